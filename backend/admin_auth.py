@@ -0,0 +1,77 @@
+# Layer 1 License Server - Admin Session Tokens
+#
+# Admin sessions are stateless HS256 JWTs carrying the username and an
+# expiry. Every worker and node verifies them with the same secret (env
+# ADMIN_TOKEN_SECRET, or one generated once and shared through server_state),
+# so a token issued by one worker is accepted by all of them and checking it
+# needs no I/O. Verified tokens are memoized in a small LRU to skip the HMAC
+# on repeat requests.
+import os
+import time
+import secrets
+from typing import Dict, Optional
+
+from jose import jwt, JWTError
+
+import database
+from cache import TTLCache
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+ADMIN_TOKEN_SECRET = os.getenv("ADMIN_TOKEN_SECRET", "")
+ADMIN_TOKEN_TTL = int(os.getenv("ADMIN_TOKEN_TTL", str(12 * 3600)))
+
+ALGORITHM = "HS256"
+SECRET_STATE = "admin_token_secret"
+
+# ============================================================================
+# Tokens
+# ============================================================================
+
+class AdminTokens:
+    """Issues and verifies admin session tokens."""
+
+    def __init__(self):
+        self._secret: Optional[str] = None
+        self._verified = TTLCache(maxsize=1000, ttl=300, name="admin_tokens")
+
+    def load(self):
+        """Load (or create and share) the signing secret. Blocking: call at startup."""
+        self._secret = ADMIN_TOKEN_SECRET or database.init_state(SECRET_STATE, secrets.token_urlsafe(48))
+        self._verified.clear()
+
+    def issue(self, username: str) -> Dict:
+        now = int(time.time())
+        claims = {"sub": username, "iat": now, "exp": now + ADMIN_TOKEN_TTL}
+        return {
+            "token": jwt.encode(claims, self._secret, algorithm=ALGORITHM),
+            "expires_in": ADMIN_TOKEN_TTL,
+        }
+
+    def verify(self, token: str) -> Optional[str]:
+        """Username for a valid, unexpired token, else None."""
+        cached = self._verified.get(token)
+        if cached is not None:
+            username, expires_at = cached
+            if expires_at > time.time():
+                return username
+            self._verified.invalidate(token)
+            return None
+
+        try:
+            claims = jwt.decode(token, self._secret, algorithms=[ALGORITHM])
+        except JWTError:
+            return None
+
+        username = claims.get("sub")
+        if not username or "exp" not in claims:
+            return None
+        self._verified.set(token, (username, claims["exp"]))
+        return username
+
+    def stats(self) -> Dict:
+        return self._verified.stats()
+
+admin_tokens = AdminTokens()
@@ -0,0 +1,148 @@
+# Layer 1 License Server - Awaitable Data Access Layer
+#
+# Every helper in database.py is blocking. Calling them straight from an
+# `async def` endpoint stalls the whole uvicorn worker while a query runs, so
+# endpoints go through the awaitable wrappers below instead. Each call runs on
+# a dedicated thread pool sized to the connection pool, which keeps at most
+# DB_POOL_MAX queries in flight per worker and leaves the event loop free to
+# serve other requests. The driver is still picked by the DB_TYPE switch in
+# database.py, so both PostgreSQL and MySQL are supported.
+import time
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import database
+from database import DB_POOL_MAX
+from metrics import Histogram, gauge
+
+DB_EXECUTOR_WAIT = Histogram(
+    "db_executor_wait_seconds", "Time a database call queued for a free executor thread"
+)
+DB_CALL_SECONDS = Histogram(
+    "db_call_duration_seconds", "Time a database helper ran on its thread (pool checkout included)", ("call",)
+)
+
+# One thread per pooled connection: more threads would only queue on the pool
+_executor = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=DB_POOL_MAX, thread_name_prefix="db")
+    return _executor
+
+@gauge("db_executor_queued", "Database calls waiting for an executor thread")
+def _queued_calls() -> int:
+    return _executor._work_queue.qsize() if _executor is not None else 0
+
+async def run_db(func, *args, **kwargs):
+    """Run a blocking database callable without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    timer = DB_CALL_SECONDS.labels(getattr(func, "__qualname__", "call"))
+    submitted = time.perf_counter()
+
+    def call():
+        started = time.perf_counter()
+        DB_EXECUTOR_WAIT.observe(started - submitted)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timer.observe(time.perf_counter() - started)
+
+    return await loop.run_in_executor(_get_executor(), call)
+
+def _awaitable(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_db(func, *args, **kwargs)
+    return wrapper
+
+def shutdown():
+    """Wait for in-flight database work and release the threads (app shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+# ============================================================================
+# Awaitable Helpers (same signatures as database.py)
+# ============================================================================
+
+init_database = _awaitable(database.init_database)
+get_license_page = _awaitable(database.get_license_page)
+get_activations_for_license = _awaitable(database.get_activations_for_license)
+get_admin_user = _awaitable(database.get_admin_user)
+create_license = _awaitable(database.create_license)
+create_licenses = _awaitable(database.create_licenses)
+import_license = _awaitable(database.import_license)
+block_license = _awaitable(database.block_license)
+unblock_license = _awaitable(database.unblock_license)
+extend_license = _awaitable(database.extend_license)
+delete_license = _awaitable(database.delete_license)
+get_activation_page = _awaitable(database.get_activation_page)
+activate_device = _awaitable(database.activate_device)
+deactivate_activation = _awaitable(database.deactivate_activation)
+get_licenses_changed_since = _awaitable(database.get_licenses_changed_since)
+get_state = _awaitable(database.get_state)
+set_state = _awaitable(database.set_state)
+try_acquire_lease = _awaitable(database.try_acquire_lease)
+claim_outbox = _awaitable(database.claim_outbox)
+complete_outbox = _awaitable(database.complete_outbox)
+retry_outbox = _awaitable(database.retry_outbox)
+get_outbox_stats = _awaitable(database.get_outbox_stats)
+get_license_events = _awaitable(database.get_license_events)
+get_latest_license_event_id = _awaitable(database.get_latest_license_event_id)
+
+# ============================================================================
+# Cached Reads (hits are answered on the event loop, without a thread hop)
+# ============================================================================
+
+async def get_license(license_key: str):
+    """Get license by key."""
+    cached = database.license_cache.get(license_key)
+    if cached is not None:
+        return dict(cached)
+    return await run_db(database.get_license, license_key, use_cache=False)
+
+async def get_activation(license_key: str, hardware_fingerprint: str):
+    """Get active activation by license and hardware fingerprint."""
+    cached = database.activation_cache.get((license_key, hardware_fingerprint))
+    if cached is not None:
+        return dict(cached)
+    return await run_db(database.get_activation, license_key, hardware_fingerprint, use_cache=False)
+
+async def get_stats():
+    """Get dashboard counters."""
+    cached = database.stats_cache.get("stats")
+    if cached is not None:
+        return dict(cached)
+    return await run_db(database.get_stats, use_cache=False)
+
+async def get_licenses(license_keys):
+    """Get many licenses at once, keyed by license_key."""
+    found = {}
+    misses = []
+    for key in dict.fromkeys(license_keys):
+        cached = database.license_cache.get(key)
+        if cached is not None:
+            found[key] = dict(cached)
+        else:
+            misses.append(key)
+    if misses:
+        found.update(await run_db(database.get_licenses, misses, use_cache=False))
+    return found
+
+async def get_activations(pairs):
+    """Get active activations for many (license_key, hardware_fingerprint) pairs."""
+    found = {}
+    misses = []
+    for pair in dict.fromkeys(pairs):
+        cached = database.activation_cache.get(pair)
+        if cached is not None:
+            found[pair] = dict(cached)
+        else:
+            misses.append(pair)
+    if misses:
+        found.update(await run_db(database.get_activations, misses, use_cache=False))
+    return found
@@ -0,0 +1,8 @@
+# Layer 1 License Server - Benchmark Suite
+#
+# Seeds a local database, starts a stub of the remote registry and drives a
+# real uvicorn process with concurrent requests. Run from backend/:
+#
+#     BENCH_DATABASE_URL=postgresql://localhost/license_bench python -m bench.run
+#
+# See bench/run.py for options (workload size, concurrency, baselines).
@@ -0,0 +1,275 @@
+# Layer 1 License Server - Benchmark Driver
+#
+#     cd backend
+#     BENCH_DATABASE_URL=postgresql://localhost/license_bench \
+#         python -m bench.run --licenses 20000 --concurrency 32 --duration 15 --save before
+#     ... change code ...
+#     BENCH_DATABASE_URL=... python -m bench.run --no-seed --compare before
+#
+# The database named by BENCH_DATABASE_URL (PostgreSQL) or BENCH_DB_NAME
+# (MySQL, with the usual DB_HOST/DB_USER/DB_PASSWORD) is migrated and seeded,
+# a stub remote is started, and a real uvicorn process serving main:app is
+# driven endpoint by endpoint. main.py loads backend/.env with override=True,
+# which would point that process at the real database and remote, so the
+# bench refuses to run while the file exists.
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import httpx
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENDPOINTS = ("validate", "activate", "licenses")
+
+# ============================================================================
+# Environment
+# ============================================================================
+
+def _bench_environment() -> Dict[str, str]:
+    """Database settings for the bench, refusing to fall back to the app's own."""
+    env_file = os.path.join(BACKEND_DIR, ".env")
+    if os.path.exists(env_file):
+        sys.exit(f"{env_file} exists and would override the bench database and stub remote "
+                 f"in the server process; move it aside while benchmarking")
+    if os.getenv("BENCH_DATABASE_URL"):
+        return {"DB_TYPE": "postgresql", "DATABASE_URL": os.environ["BENCH_DATABASE_URL"]}
+    if os.getenv("BENCH_DB_NAME"):
+        return {"DB_TYPE": "mysql", "DATABASE_URL": "", "DB_NAME": os.environ["BENCH_DB_NAME"]}
+    sys.exit("Set BENCH_DATABASE_URL (PostgreSQL) or BENCH_DB_NAME (MySQL): the bench rewrites bench rows")
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+def _start_server(port: int, workers: int, env: Dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL,
+    )
+
+async def _wait_until_up(base_url: str, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.25)
+    raise RuntimeError(f"Server at {base_url} did not become healthy within {timeout:.0f}s")
+
+# ============================================================================
+# Load Generation
+# ============================================================================
+
+async def _drive(client: httpx.AsyncClient, make_request, concurrency: int, duration: float) -> Dict:
+    """Run `make_request()` from `concurrency` loops for `duration` seconds."""
+    from remote_sync import percentile
+
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.monotonic() < deadline:
+            method, url, kwargs = make_request()
+            started = time.monotonic()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.monotonic() - started)
+            bucket = f"{response.status_code // 100}xx"
+            statuses[bucket] = statuses.get(bucket, 0) + 1
+
+    started = time.monotonic()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.monotonic() - started
+
+    latencies.sort()
+    to_ms = lambda value: round(value * 1000, 2) if value is not None else None
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "statuses": statuses,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": to_ms(percentile(latencies, 50)),
+        "p95_ms": to_ms(percentile(latencies, 95)),
+        "p99_ms": to_ms(percentile(latencies, 99)),
+    }
+
+async def run_workloads(base_url: str, pairs: List[tuple], endpoints: List[str],
+                        concurrency: int, duration: float, warmup: float) -> Dict:
+    rng = random.Random(7)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        login = await client.post("/admin/login", json={"username": "admin", "password": "admin123"})
+        admin_headers = {"Authorization": f"Bearer {login.json()['token']}"} if login.status_code == 200 else None
+
+        def device_request(path):
+            def make():
+                key, fp = rng.choice(pairs)
+                return "POST", path, {"json": {"license_key": key, "hardware_fingerprint": fp}}
+            return make
+
+        def listing_request():
+            status = rng.choice([None, "active", "expired"])
+            params = {"limit": 100, **({"status": status} if status else {})}
+            return "GET", "/admin/licenses", {"params": params, "headers": admin_headers}
+
+        workloads = {
+            "validate": device_request("/validate"),
+            "activate": device_request("/activate"),
+            "licenses": listing_request,
+        }
+
+        results = {}
+        for name in endpoints:
+            if name == "licenses" and admin_headers is None:
+                print("⚠️ Skipping licenses: default admin login failed")
+                continue
+            if warmup:
+                await _drive(client, workloads[name], concurrency, warmup)
+            results[name] = await _drive(client, workloads[name], concurrency, duration)
+            print(f"  {name:<10} {results[name]['rps']:>9.1f} rps   p50 {results[name]['p50_ms']} ms   "
+                  f"p95 {results[name]['p95_ms']} ms   p99 {results[name]['p99_ms']} ms   "
+                  f"{results[name]['statuses']}")
+        return results
+
+# ============================================================================
+# Baselines
+# ============================================================================
+
+def save_baseline(name: str, report: Dict) -> str:
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    path = os.path.join(BASELINE_DIR, f"{name}.json")
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+def compare(baseline: Dict, results: Dict, params: Dict, threshold: float) -> bool:
+    """Print changes against a baseline. Returns True if any endpoint regressed."""
+    print(f"\nCompared with baseline from commit {baseline.get('commit')} ({baseline.get('created_at')}):")
+    for param in ("licenses", "activations", "concurrency", "workers", "remote_delay"):
+        if param in params and baseline.get("params", {}).get(param) != params[param]:
+            print(f"  ⚠️ {param} differs from the baseline ({baseline.get('params', {}).get(param)} vs {params[param]})")
+    regressed = False
+    for name, current in results.items():
+        before = baseline["results"].get(name)
+        if not before:
+            continue
+        rps_change = (current["rps"] - before["rps"]) / before["rps"] * 100 if before["rps"] else 0.0
+        p95_change = ((current["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100
+                      if before["p95_ms"] and current["p95_ms"] is not None else 0.0)
+        worse = rps_change < -threshold or p95_change > threshold
+        regressed = regressed or worse
+        print(f"  {name:<10} rps {rps_change:+6.1f}%   p95 {p95_change:+6.1f}%   {'REGRESSION' if worse else 'ok'}")
+    return regressed
+
+# ============================================================================
+# Main
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the license server's client and admin endpoints.")
+    parser.add_argument("--licenses", type=int, default=10000)
+    parser.add_argument("--activations", type=int, default=1, help="activations per license")
+    parser.add_argument("--logs", type=int, default=100000, help="validation log rows to seed")
+    parser.add_argument("--no-seed", action="store_true", help="reuse the bench rows already in the database")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS))
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per endpoint")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds per endpoint")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--remote-delay", type=float, default=0.0, help="stub remote latency in seconds")
+    parser.add_argument("--save", metavar="NAME", help="save results as baselines/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", help="compare with baselines/NAME.json")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    args = parser.parse_args()
+
+    endpoints = [name for name in args.endpoints.split(",") if name]
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(sorted(unknown))}")
+
+    bench_env = _bench_environment()
+    os.environ.update(bench_env)
+    sys.path.insert(0, BACKEND_DIR)
+    import database
+    from bench import seed
+    from bench.stub_remote import StubRemote
+
+    database.init_database()
+    if args.no_seed:
+        with database.db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT license_key, hardware_fingerprint FROM activations WHERE license_key LIKE %s",
+                           (seed.BENCH_PREFIX + "%",))
+            pairs = [tuple(row) for row in cursor.fetchall()]
+            cursor.close()
+    else:
+        started = time.monotonic()
+        pairs = seed.seed(args.licenses, args.activations, args.logs)
+        print(f"🌱 Seeded {args.licenses} licenses, {len(pairs)} activations, {args.logs} logs "
+              f"in {time.monotonic() - started:.1f}s")
+    if not pairs:
+        sys.exit("No bench activations found; run without --no-seed first")
+
+    stub = StubRemote(delay=args.remote_delay).start()
+    server_env = {**os.environ, **bench_env, "REMOTE_URL": stub.url}
+    server_env.pop("REMOTE_ADMIN_TOKEN", None)   # keep background sync off
+    server = _start_server(args.port, args.workers, server_env)
+    base_url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        asyncio.run(_wait_until_up(base_url))
+        print(f"🚀 Driving {base_url} with {args.concurrency} concurrent clients, {args.duration:.0f}s per endpoint")
+        results = asyncio.run(run_workloads(
+            base_url, pairs, endpoints, args.concurrency, args.duration, args.warmup
+        ))
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            server.kill()
+        stub.stop()
+        database.close_pool()
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "params": {key: value for key, value in vars(args).items() if key not in ("save", "compare")},
+        "db_type": database.DB_TYPE,
+        "results": results,
+    }
+
+    regressed = False
+    if args.compare:
+        with open(os.path.join(BASELINE_DIR, f"{args.compare}.json")) as f:
+            regressed = compare(json.load(f), results, report["params"], args.threshold)
+    if args.save:
+        print(f"💾 Baseline saved to {save_baseline(args.save, report)}")
+    sys.exit(1 if regressed else 0)
+
+if __name__ == "__main__":
+    main()
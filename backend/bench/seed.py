@@ -0,0 +1,88 @@
+# Layer 1 License Server - Benchmark Data
+#
+# Bulk-loads synthetic licenses, activations and validation logs. Every
+# seeded key starts with BENCH_PREFIX so a re-seed only replaces bench rows.
+import random
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+import database
+from database import DB_TYPE, db_connection
+
+BENCH_PREFIX = "BENCH-"
+SEED_BATCH = 5000
+
+def _insert_many(cursor, table: str, columns: Tuple[str, ...], rows: List[tuple]):
+    column_list = ", ".join(columns)
+    if DB_TYPE == "postgresql":
+        database.execute_values(cursor, f"INSERT INTO {table} ({column_list}) VALUES %s", rows, page_size=len(rows))
+    else:
+        placeholders = ", ".join(["%s"] * len(columns))
+        cursor.executemany(f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})", rows)
+
+def clear():
+    """Remove previously seeded bench rows."""
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        pattern = BENCH_PREFIX + "%"
+        cursor.execute("DELETE FROM validation_logs WHERE license_key LIKE %s", (pattern,))
+        cursor.execute("DELETE FROM activations WHERE license_key LIKE %s", (pattern,))
+        cursor.execute("DELETE FROM licenses WHERE license_key LIKE %s", (pattern,))
+        conn.commit()
+        cursor.close()
+
+def seed(licenses: int, activations_per_license: int = 1, logs: int = 0,
+         seed_value: int = 42) -> List[Tuple[str, str]]:
+    """Insert bench data and return the activated (license_key, fingerprint) pairs.
+
+    Licenses are bound to their first device's fingerprint, as /activate
+    requires; a tenth of them are expired and a fiftieth blocked so the
+    non-happy paths are exercised too.
+    """
+    rng = random.Random(seed_value)
+    now = datetime.now()
+    clear()
+
+    pairs = []
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        for start in range(0, licenses, SEED_BATCH):
+            license_rows, activation_rows = [], []
+            for i in range(start, min(start + SEED_BATCH, licenses)):
+                key = f"{BENCH_PREFIX}{i:08d}"
+                fingerprints = [f"bench-fp-{i}-{d}" for d in range(max(1, activations_per_license))]
+                expired = rng.random() < 0.1
+                license_rows.append((
+                    key, f"Customer {i}", f"Company {i % 500}",
+                    now + timedelta(days=-rng.randint(1, 90) if expired else rng.randint(30, 720)),
+                    max(1, activations_per_license), fingerprints[0],
+                    rng.random() < 0.02, "bench", now, now,
+                ))
+                for fp in fingerprints[:activations_per_license]:
+                    activation_rows.append((key, fp, f"Device {fp}", now, True))
+                    pairs.append((key, fp))
+
+            _insert_many(cursor, "licenses", (
+                "license_key", "customer_name", "company_name", "expires_at", "max_activations",
+                "restricted_fingerprint", "is_blocked", "created_by", "generated_at", "updated_at",
+            ), license_rows)
+            if activation_rows:
+                _insert_many(cursor, "activations", (
+                    "license_key", "hardware_fingerprint", "device_name", "activated_at", "is_active",
+                ), activation_rows)
+            conn.commit()
+        cursor.close()
+
+    # Spread logs over the last 90 days through the production insert path
+    statuses = ["valid"] * 8 + ["expired", "hardware_mismatch"]
+    for start in range(0, logs, SEED_BATCH):
+        batch = []
+        for _ in range(min(SEED_BATCH, logs - start)):
+            key, fp = rng.choice(pairs) if pairs else (f"{BENCH_PREFIX}none", "none")
+            batch.append((key, fp, rng.choice(statuses), False, None,
+                          now - timedelta(seconds=rng.randint(0, 90 * 86400))))
+        database.insert_validation_logs(batch)
+
+    database.license_cache.clear()
+    database.activation_cache.clear()
+    return pairs
@@ -0,0 +1,69 @@
+# Layer 1 License Server - Remote Registry Stub
+#
+# Minimal stand-in for the remote registry so benchmarks measure this server
+# and not the network: /sys/validate always allows, /sys/license/* is never
+# found and the admin sync endpoints accept everything. An optional fixed
+# delay simulates remote latency.
+import json
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+class StubRemote:
+    """Threaded HTTP stub listening on 127.0.0.1 (random port by default)."""
+
+    def __init__(self, port: int = 0, delay: float = 0.0):
+        self.delay = delay
+        self.requests = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, status: int, body):
+                stub.requests += 1
+                if stub.delay:
+                    time.sleep(stub.delay)
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                if self.path.startswith("/sys/validate"):
+                    self._reply(200, {"allowed": True})
+                else:
+                    self._reply(200, {"success": True})
+
+            def do_GET(self):
+                self._reply(404, {"detail": "License not found"})
+
+            def do_PATCH(self):
+                self._reply(200, {"success": True})
+
+            def do_DELETE(self):
+                self._reply(200, {"success": True})
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, name="stub-remote", daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def start(self) -> "StubRemote":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
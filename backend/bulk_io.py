@@ -0,0 +1,204 @@
+# Layer 1 License Server - Bulk Export / Import
+#
+# Export streams a table as NDJSON or CSV straight from a server-side cursor;
+# import reads an uploaded file line by line and writes it in batches. Both
+# hold at most one batch in memory, so a 10M-row catalog costs the same RAM
+# as a 1k-row one.
+#
+# Licenses are upserted by license_key (the file wins). Activations are
+# appended unless the same license, fingerprint and activation time already
+# exist, so importing a file twice changes nothing.
+import io
+import os
+import csv
+import json
+from datetime import datetime
+from typing import IO, Dict, Iterator, List, Optional
+
+import database
+from database import EXPORT_COLUMNS
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+# Row errors reported back in detail; the rest are only counted
+IMPORT_MAX_ERRORS = 50
+
+FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+REQUIRED = {
+    "licenses": ("license_key", "customer_name", "expires_at"),
+    "activations": ("license_key", "hardware_fingerprint"),
+}
+DATETIME_COLUMNS = {"expires_at", "generated_at", "updated_at", "activated_at", "last_validated"}
+BOOLEAN_COLUMNS = {"is_blocked", "is_active"}
+INTEGER_COLUMNS = {"max_activations"}
+
+def format_for_filename(filename: Optional[str]) -> str:
+    return "csv" if filename and filename.lower().endswith(".csv") else "ndjson"
+
+# ============================================================================
+# Export
+# ============================================================================
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+def export_chunks(table: str, fmt: str) -> Iterator[str]:
+    """Yield the table as text chunks of one fetched batch each."""
+    columns = EXPORT_COLUMNS[table]
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for rows in database.iter_table_batches(table):
+            for row in rows:
+                writer.writerow([_csv_value(row[c]) for c in columns])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+    else:
+        for rows in database.iter_table_batches(table):
+            yield "".join(json.dumps(dict(row), default=database._json_default) + "\n" for row in rows)
+
+# ============================================================================
+# Import
+# ============================================================================
+
+def _parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("1", "true", "t", "yes", "y"):
+        return True
+    if text in ("0", "false", "f", "no", "n"):
+        return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+def clean_row(table: str, raw: Dict) -> Dict:
+    """Keep the table's columns and convert values. Raises ValueError on bad input."""
+    if not isinstance(raw, dict):
+        raise ValueError("expected an object")
+
+    row = {}
+    for column in EXPORT_COLUMNS[table]:
+        value = raw.get(column)
+        if value == "":
+            value = None
+        if value is not None:
+            try:
+                if column in DATETIME_COLUMNS:
+                    value = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+                elif column in BOOLEAN_COLUMNS:
+                    value = _parse_bool(value)
+                elif column in INTEGER_COLUMNS:
+                    value = int(value)
+            except ValueError as e:
+                raise ValueError(f"{column}: {e}")
+        row[column] = value
+
+    missing = [c for c in REQUIRED[table] if row.get(c) is None]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+
+    if table == "licenses":
+        row['generated_at'] = row['generated_at'] or datetime.now()
+        row['is_blocked'] = bool(row['is_blocked'])
+        row['max_activations'] = row['max_activations'] or 1
+        row['created_by'] = row['created_by'] or "import"
+    else:
+        row['activated_at'] = row['activated_at'] or datetime.now()
+        row['is_active'] = True if row['is_active'] is None else row['is_active']
+    return row
+
+def _records(text: IO[str], fmt: str) -> Iterator[tuple]:
+    """Yield (line_number, record_or_exception) from an NDJSON or CSV stream."""
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, ValueError(f"invalid JSON: {e}")
+
+def import_file(binary: IO[bytes], table: str, fmt: str, batch_size: int = IMPORT_BATCH_SIZE) -> Dict:
+    """Import an uploaded file into `table`. Blocking; run it in a thread.
+
+    Each batch commits on its own. A batch the database rejects is counted
+    under `failed` (with its line range in `errors`) and the import goes on
+    with the next one, so the report always says what was written.
+    """
+    report = {"table": table, "rows": 0, "imported": 0, "skipped": 0, "invalid": 0, "failed": 0, "errors": []}
+    started = datetime.now()
+
+    def add_error(error: Dict):
+        if len(report["errors"]) < IMPORT_MAX_ERRORS:
+            report["errors"].append(error)
+
+    def write(batch: List[Dict], first_line: Optional[int], last_line: Optional[int]):
+        if not batch:
+            return
+        try:
+            if table == "licenses":
+                report["imported"] += database.upsert_licenses(batch)
+            else:
+                inserted, skipped = database.insert_activations(batch)
+                report["imported"] += inserted
+                report["skipped"] += skipped
+        except Exception as e:
+            report["failed"] += len(batch)
+            add_error({"lines": f"{first_line}-{last_line}", "error": f"batch not written: {e}"})
+            print(f"❌ Import batch at lines {first_line}-{last_line} failed: {e}")
+
+    text = io.TextIOWrapper(binary, encoding="utf-8-sig", newline="")
+    batch: Dict = {}
+    first_line = last_line = None
+    try:
+        for line_number, record in _records(text, fmt):
+            report["rows"] += 1
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                row = clean_row(table, record)
+            except ValueError as e:
+                report["invalid"] += 1
+                add_error({"line": line_number, "error": str(e)})
+                continue
+
+            # A key repeated within one batch keeps its last row (one statement
+            # cannot upsert the same key twice)
+            identity = row['license_key'] if table == "licenses" else len(batch)
+            batch[identity] = row
+            first_line = first_line or line_number
+            last_line = line_number
+            if len(batch) >= batch_size:
+                write(list(batch.values()), first_line, last_line)
+                batch = {}
+                first_line = None
+        write(list(batch.values()), first_line, last_line)
+    finally:
+        text.detach()
+        if report["imported"]:
+            database.notify_bulk_change()
+
+    report["seconds"] = round((datetime.now() - started).total_seconds(), 2)
+    return report
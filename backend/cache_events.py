@@ -0,0 +1,128 @@
+# Layer 1 License Server - Cross-Worker Cache Invalidation
+#
+# License and activation rows are cached per process. A write evicts them in
+# the worker that made it; this listener evicts them everywhere else:
+#
+# - PostgreSQL: write helpers pg_notify() on the license_events channel inside
+#   their transaction, and each worker LISTENs on a dedicated connection.
+#   After a lost connection every cache is cleared, since notifications sent
+#   meanwhile are gone.
+# - MySQL: no NOTIFY, so each worker polls the license_events table for rows
+#   newer than the last settled one it has seen (see
+#   database.LICENSE_EVENT_SETTLE_SECONDS).
+import os
+import json
+import select
+import threading
+from typing import Dict, Optional
+
+import database
+from database import DB_TYPE, LICENSE_EVENTS_CHANNEL, get_connection
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+# MySQL polling period (and, on PostgreSQL, how often the listener checks for shutdown)
+CACHE_EVENT_POLL_INTERVAL = float(os.getenv("CACHE_EVENT_POLL_INTERVAL", "2"))
+CACHE_EVENT_RECONNECT_DELAY = float(os.getenv("CACHE_EVENT_RECONNECT_DELAY", "5"))
+CACHE_EVENT_BATCH = 1000
+
+# ============================================================================
+# Listener
+# ============================================================================
+
+class CacheInvalidationListener:
+    """Daemon thread applying license change events to this worker's caches."""
+
+    def __init__(self, poll_interval: float = CACHE_EVENT_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_event_id: Optional[int] = None
+        self._applied = set()   # ids past last_event_id that were already applied
+        self.received = 0
+        self.reconnects = 0
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cache-events", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.poll_interval + 1)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if DB_TYPE == "postgresql":
+                    self._listen()
+                else:
+                    self._poll()
+            except Exception as e:
+                self.reconnects += 1
+                print(f"⚠️ Cache event listener error (reconnecting): {e}")
+                self._stop.wait(CACHE_EVENT_RECONNECT_DELAY)
+
+    def _apply(self, license_key: str, event: str, hardware_fingerprint: Optional[str]):
+        database.apply_license_event(license_key, event, hardware_fingerprint)
+        self.received += 1
+
+    def _listen(self):
+        conn = get_connection()
+        try:
+            conn.autocommit = True
+            cursor = conn.cursor()
+            cursor.execute(f"LISTEN {LICENSE_EVENTS_CHANNEL}")
+            if self.reconnects:
+                # Anything sent while we were disconnected was lost
+                database.license_cache.clear()
+                database.activation_cache.clear()
+
+            while not self._stop.is_set():
+                if select.select([conn], [], [], self.poll_interval) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    try:
+                        payload = json.loads(notify.payload)
+                        self._apply(payload['key'], payload['event'], payload.get('fp'))
+                    except (ValueError, KeyError, TypeError):
+                        print(f"⚠️ Ignoring malformed cache event: {notify.payload!r}")
+        finally:
+            conn.close()
+
+    def _poll(self):
+        if self.last_event_id is None:
+            self.last_event_id = database.get_latest_license_event_id()
+
+        while not self._stop.is_set():
+            # Evict as soon as an event is visible, but only move last_event_id
+            # past settled ones: a smaller id may still commit behind them
+            events = database.get_license_events(self.last_event_id, CACHE_EVENT_BATCH, settled=False)
+            for event in events:
+                if event['id'] not in self._applied:
+                    self._apply(event['license_key'], event['event'], event['hardware_fingerprint'])
+                    self._applied.add(event['id'])
+            settled = database.settled_license_events(events, database.LICENSE_EVENT_SETTLE_SECONDS)
+            if settled:
+                self.last_event_id = settled[-1]['id']
+                self._applied = {i for i in self._applied if i > self.last_event_id}
+            if len(settled) < CACHE_EVENT_BATCH:
+                self._stop.wait(self.poll_interval)
+
+    def stats(self) -> Dict:
+        return {
+            "mode": "listen" if DB_TYPE == "postgresql" else "poll",
+            "running": self._thread is not None and self._thread.is_alive(),
+            "received": self.received,
+            "reconnects": self.reconnects,
+        }
+
+cache_listener = CacheInvalidationListener()
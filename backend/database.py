@@ -1,8 +1,14 @@
 # Layer 1 License Server - Database Models (MySQL/PostgreSQL Compatible)
 import os
-from typing import Optional, List, Dict
-from datetime import datetime
-from urllib.parse import urlparse
+import json
+import time
+import base64
+import threading
+from contextlib import contextmanager
+from typing import Callable, Optional, List, Dict
+from datetime import datetime, timedelta
+
+from cache import TTLCache
 
 # ============================================================================
 # Database Type Detection and Library Imports
@@ -16,12 +22,10 @@ print(f"🔧 Database Type: {DB_TYPE}")
 
 if DB_TYPE == "postgresql":
     import psycopg2
-    from psycopg2.extras import RealDictCursor
-    from psycopg2 import pool as pg_pool
+    from psycopg2.extras import RealDictCursor, execute_values
     print("✅ Using PostgreSQL driver")
 else:
     import mysql.connector
-    from mysql.connector import pooling
     print("✅ Using MySQL driver")
 
 # ============================================================================
@@ -51,15 +55,30 @@ else:
         "database": os.getenv("DB_NAME", "license_server_db"),
     }
 
-# Connection pool
+# Connection pool (one per worker process, created lazily on first use)
 connection_pool = None
+_pool_lock = threading.Lock()
+
+# Pool sizing is per process: with `gunicorn -w N` the server sees up to
+# N * DB_POOL_MAX connections, which must stay under the provider's cap.
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "5"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+# Idle connections older than this are pinged before being handed out
+DB_POOL_CHECK_IDLE = float(os.getenv("DB_POOL_CHECK_IDLE", "30"))
+# Connections are recycled after this many seconds (0 = never)
+DB_POOL_MAX_LIFETIME = float(os.getenv("DB_POOL_MAX_LIFETIME", "1800"))
 
 # ============================================================================
 # Connection Management
 # ============================================================================
 
 def get_connection():
-    """Get database connection (MySQL or PostgreSQL)."""
+    """Open a dedicated (unpooled) database connection (MySQL or PostgreSQL).
+
+    Request handlers should use `db_connection()` instead; this is for the
+    pool itself and for long-lived connections that must not hold a pool slot.
+    """
     if DB_TYPE == "postgresql":
         if "dsn" in DB_CONFIG:
             return psycopg2.connect(DB_CONFIG["dsn"])
@@ -73,252 +92,1402 @@ def dict_cursor(conn):
     if DB_TYPE == "postgresql":
         return conn.cursor(cursor_factory=RealDictCursor)
     else:
-        return conn.cursor(dictionary=True)
+        # Buffered so a partially read result never blocks returning the
+        # connection to the pool.
+        return conn.cursor(dictionary=True, buffered=True)
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection becomes available in time."""
+
+class ConnectionPool:
+    """Thread-safe pool of database connections owned by a single process.
+
+    Checkout is LIFO so the hottest connections stay warm, blocks up to
+    `timeout` seconds when all `maxconn` connections are in use, and pings
+    connections that sat idle for a while before handing them out.
+    """
+
+    def __init__(self, minconn: int, maxconn: int, timeout: float):
+        self.minconn = max(0, minconn)
+        self.maxconn = max(1, maxconn, self.minconn)
+        self.timeout = timeout
+        self.pid = os.getpid()
+        self._idle = []       # [(conn, last_used)]
+        self._born = {}       # id(conn) -> created_at
+        self._size = 0        # idle + checked out
+        self._cond = threading.Condition()
+        self.waits = 0        # checkouts that had to wait for a connection
+        self.timeouts = 0
+
+        for _ in range(self.minconn):
+            conn = self._open()
+            self._idle.append((conn, time.monotonic()))
+            self._size += 1
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    def _open(self):
+        conn = get_connection()
+        self._born[id(conn)] = time.monotonic()
+        return conn
+
+    def _close(self, conn):
+        self._born.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_usable(self, conn, last_used: float) -> bool:
+        """Cheap liveness check; only pings connections that sat idle."""
+        if DB_TYPE == "postgresql" and conn.closed:
+            return False
+
+        now = time.monotonic()
+        born = self._born.get(id(conn), now)
+        if DB_POOL_MAX_LIFETIME and now - born > DB_POOL_MAX_LIFETIME:
+            return False
+
+        if now - last_used > DB_POOL_CHECK_IDLE:
+            try:
+                if DB_TYPE == "postgresql":
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+                    cursor.close()
+                    conn.rollback()
+                else:
+                    conn.ping(reconnect=False)
+            except Exception:
+                return False
+        return True
+
+    def getconn(self):
+        """Check out a healthy connection, opening one if below `maxconn`."""
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        while True:
+            conn = None
+            with self._cond:
+                while True:
+                    if self._idle:
+                        conn, last_used = self._idle.pop()
+                        break
+                    if self._size < self.maxconn:
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timeouts += 1
+                        raise PoolTimeout(
+                            f"No database connection available within {self.timeout}s "
+                            f"(pool max {self.maxconn})"
+                        )
+                    if not waited:
+                        waited = True
+                        self.waits += 1
+                    self._cond.wait(remaining)
+
+            if conn is None:
+                try:
+                    return self._open()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+
+            if self._is_usable(conn, last_used):
+                return conn
+
+            # Stale connection: drop it and try again (usually opens a new one)
+            self._close(conn)
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+
+    def putconn(self, conn, discard: bool = False):
+        """Return a connection, ending any open transaction first."""
+        if not discard:
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        if discard or self.pid != os.getpid():
+            self._close(conn)
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            return
+
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def closeall(self):
+        """Close all idle connections (checked-out ones close on return)."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for conn, _ in idle:
+            self._close(conn)
+
+def get_pool() -> ConnectionPool:
+    """Get this process's connection pool, creating it on first use.
+
+    The pool is keyed to the current PID so a forked worker never reuses
+    sockets inherited from its parent.
+    """
+    global connection_pool
+    pool = connection_pool
+    if pool is not None and pool.pid == os.getpid():
+        return pool
+
+    with _pool_lock:
+        if connection_pool is None or connection_pool.pid != os.getpid():
+            connection_pool = ConnectionPool(DB_POOL_MIN, DB_POOL_MAX, DB_POOL_TIMEOUT)
+            print(f"🔗 Connection pool ready (min={DB_POOL_MIN}, max={DB_POOL_MAX}, pid={os.getpid()})")
+        return connection_pool
+
+def pool_stats() -> Dict:
+    """Connection counts of this process's pool (empty before first use)."""
+    pool = connection_pool
+    if pool is None or pool.pid != os.getpid():
+        return {}
+    return {
+        "size": pool.size,
+        "idle": pool.idle,
+        "in_use": pool.size - pool.idle,
+        "max": pool.maxconn,
+        "waits": pool.waits,
+        "timeouts": pool.timeouts,
+    }
+
+def close_pool():
+    """Close this process's pooled connections (called on shutdown)."""
+    global connection_pool
+    with _pool_lock:
+        if connection_pool is not None and connection_pool.pid == os.getpid():
+            connection_pool.closeall()
+        connection_pool = None
+
+@contextmanager
+def db_connection():
+    """Borrow a pooled connection for the duration of a `with` block.
+
+    Callers commit explicitly; anything left uncommitted is rolled back when
+    the connection goes back to the pool.
+    """
+    pool = get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
 
 # ============================================================================
 # Schema Initialization
 # ============================================================================
 
 def init_database():
-    """Initialize database tables if they don't exist."""
-    conn = get_connection()
-    cursor = conn.cursor()
+    """Bring the schema up to date (a single SELECT when it already is)."""
+    from migrations import migrate, LATEST_VERSION
     
-    print("🔧 Initializing database schema...")
-    
-    # PostgreSQL-compatible schema
-    if DB_TYPE == "postgresql":
-        schema_sql = """
-        CREATE TABLE IF NOT EXISTS admin_users (
-            id SERIAL PRIMARY KEY,
-            username VARCHAR(50) UNIQUE NOT NULL,
-            password_hash VARCHAR(255) NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS licenses (
-            id SERIAL PRIMARY KEY,
-            license_key VARCHAR(50) UNIQUE NOT NULL,
-            customer_name VARCHAR(255) NOT NULL,
-            company_name VARCHAR(255),
-            email VARCHAR(255),
-            phone VARCHAR(50),
-            expires_at TIMESTAMP NOT NULL,
-            max_activations INT DEFAULT 1,
-            restricted_fingerprint VARCHAR(255),
-            notes TEXT,
-            is_blocked BOOLEAN DEFAULT FALSE,
-            block_message TEXT,
-            created_by VARCHAR(50),
-            generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS activations (
-            id SERIAL PRIMARY KEY,
-            license_key VARCHAR(50) NOT NULL,
-            hardware_fingerprint VARCHAR(255) NOT NULL,
-            device_name VARCHAR(255),
-            activated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            last_validated TIMESTAMP,
-            is_active BOOLEAN DEFAULT TRUE,
-            FOREIGN KEY (license_key) REFERENCES licenses(license_key) ON DELETE CASCADE
-        );
-
-        CREATE TABLE IF NOT EXISTS validation_logs (
-            id SERIAL PRIMARY KEY,
-            license_key VARCHAR(50),
-            hardware_fingerprint VARCHAR(255),
-            status VARCHAR(50),
-            remote_override BOOLEAN DEFAULT FALSE,
-            message TEXT,
-            validated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- Create default admin user if not exists (password: admin123)
-        INSERT INTO admin_users (username, password_hash)
-        VALUES ('admin', 'SHA2:240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9')
-        ON CONFLICT (username) DO NOTHING;
-        """
+    applied = migrate()
+    if applied:
+        print(f"✅ Database migrated to schema version {LATEST_VERSION} ({applied} applied)")
     else:
-        # MySQL schema
-        schema_sql = """
-        CREATE TABLE IF NOT EXISTS admin_users (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            username VARCHAR(50) UNIQUE NOT NULL,
-            password_hash VARCHAR(255) NOT NULL,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS licenses (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            license_key VARCHAR(50) UNIQUE NOT NULL,
-            customer_name VARCHAR(255) NOT NULL,
-            company_name VARCHAR(255),
-            email VARCHAR(255),
-            phone VARCHAR(50),
-            expires_at DATETIME NOT NULL,
-            max_activations INT DEFAULT 1,
-            restricted_fingerprint VARCHAR(255),
-            notes TEXT,
-            is_blocked BOOLEAN DEFAULT FALSE,
-            block_message TEXT,
-            created_by VARCHAR(50),
-            generated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS activations (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            license_key VARCHAR(50) NOT NULL,
-            hardware_fingerprint VARCHAR(255) NOT NULL,
-            device_name VARCHAR(255),
-            activated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            last_validated DATETIME,
-            is_active BOOLEAN DEFAULT TRUE,
-            FOREIGN KEY (license_key) REFERENCES licenses(license_key) ON DELETE CASCADE
-        );
-
-        CREATE TABLE IF NOT EXISTS validation_logs (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            license_key VARCHAR(50),
-            hardware_fingerprint VARCHAR(255),
-            status VARCHAR(50),
-            remote_override BOOLEAN DEFAULT FALSE,
-            message TEXT,
-            validated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- Create default admin user if not exists (password: admin123)
-        INSERT IGNORE INTO admin_users (username, password_hash)
-        VALUES ('admin', 'SHA2:240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9');
-        """
-    
-    # Execute schema
-    for statement in schema_sql.split(';'):
-        statement = statement.strip()
-        if statement:
-            try:
-                cursor.execute(statement)
-                conn.commit()
-            except Exception as e:
-                # Table might already exist
-                print(f"⚠️ Schema statement skipped: {e}")
-                pass
-    
-    cursor.close()
-    conn.close()
-    print("✅ Database initialized")
+        print(f"✅ Database schema current (version {LATEST_VERSION})")
+
+# ============================================================================
+# Read Caches
+# ============================================================================
+
+# License rows keyed by license_key, and active activations keyed by
+# (license_key, hardware_fingerprint). Only found rows are cached; every write
+# helper below invalidates the keys it touches after committing, and other
+# workers evict them when the change event reaches them (cache_events.py).
+# The TTL is only a backstop for changes made outside this server.
+license_cache = TTLCache(
+    maxsize=int(os.getenv("LICENSE_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("LICENSE_CACHE_TTL", "600")),
+    name="licenses",
+)
+activation_cache = TTLCache(
+    maxsize=int(os.getenv("ACTIVATION_CACHE_SIZE", "50000")),
+    ttl=float(os.getenv("LICENSE_CACHE_TTL", "600")),
+    name="activations",
+)
+
+# Dashboard counters, recomputed at most once per STATS_CACHE_TTL seconds.
+# Writes deliberately leave them alone (steady activation traffic would
+# otherwise force a full count on nearly every load), so they can lag by
+# up to one TTL.
+stats_cache = TTLCache(maxsize=1, ttl=float(os.getenv("STATS_CACHE_TTL", "15")), name="stats")
+
+def invalidate_license(license_key: str):
+    """Drop a license and all of its cached activations."""
+    license_cache.invalidate(license_key)
+    activation_cache.invalidate_where(lambda key: key[0] == license_key)
+
+def invalidate_licenses(license_keys):
+    """Drop many licenses and their activations in one pass over the caches."""
+    keys = set(license_keys)
+    for license_key in keys:
+        license_cache.invalidate(license_key)
+    activation_cache.invalidate_where(lambda key: key[0] in keys)
+
+def apply_license_event(license_key: str, event: str, hardware_fingerprint: Optional[str] = None):
+    """Evict what a license change (possibly made by another worker) affects."""
+    if license_key == ALL_LICENSES:
+        license_cache.clear()
+        activation_cache.clear()
+    elif event == "deactivated" and hardware_fingerprint:
+        activation_cache.invalidate((license_key, hardware_fingerprint))
+    else:
+        invalidate_license(license_key)
+
+def cache_stats() -> Dict:
+    """Hit/miss/eviction counters for the read caches."""
+    return {
+        "licenses": license_cache.stats(),
+        "activations": activation_cache.stats(),
+        "stats": stats_cache.stats(),
+    }
 
 # ============================================================================
 # Database Helper Functions
 # ============================================================================
 
-def get_license(license_key: str) -> Optional[Dict]:
-    """Get license by key."""
-    conn = get_connection()
-    cursor = dict_cursor(conn)
+def get_license(license_key: str, use_cache: bool = True) -> Optional[Dict]:
+    """Get license by key (served from the license cache when possible)."""
+    if use_cache:
+        cached = license_cache.get(license_key)
+        if cached is not None:
+            return dict(cached)
     
-    cursor.execute("""
-        SELECT * FROM licenses WHERE license_key = %s
-    """, (license_key,))
+    epoch = license_cache.epoch
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        
+        cursor.execute("""
+            SELECT * FROM licenses WHERE license_key = %s
+        """, (license_key,))
+        
+        license_data = cursor.fetchone()
+        cursor.close()
     
-    license_data = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    if license_data is not None:
+        license_cache.set(license_key, dict(license_data), epoch=epoch)
     
     return license_data
 
-def get_all_licenses(limit: int = 100, offset: int = 0, updated_after: Optional[datetime] = None) -> List[Dict]:
-    """Get all licenses with pagination and optional time filter."""
-    conn = get_connection()
-    cursor = dict_cursor(conn)
+def get_licenses(license_keys: List[str], use_cache: bool = True) -> Dict[str, Dict]:
+    """Get many licenses at once, keyed by license_key (missing keys are absent)."""
+    found = {}
+    misses = []
+    for key in dict.fromkeys(license_keys):
+        cached = license_cache.get(key) if use_cache else None
+        if cached is not None:
+            found[key] = dict(cached)
+        else:
+            misses.append(key)
     
-    query = "SELECT * FROM licenses"
+    if not misses:
+        return found
+    
+    epoch = license_cache.epoch
+    placeholders = ", ".join(["%s"] * len(misses))
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        cursor.execute(f"""
+            SELECT * FROM licenses WHERE license_key IN ({placeholders})
+        """, tuple(misses))
+        rows = cursor.fetchall()
+        cursor.close()
+    
+    for row in rows:
+        license_cache.set(row['license_key'], dict(row), epoch=epoch)
+        found[row['license_key']] = row
+    
+    return found
+
+# Server-side status filters for the admin license listing
+LICENSE_STATUS_FILTERS = {
+    "active": "is_blocked = FALSE AND expires_at > NOW()",
+    "expired": "expires_at <= NOW()",
+    "blocked": "is_blocked = TRUE",
+}
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """Opaque keyset cursor for the row a page ended on."""
+    raw = json.dumps([sort_value.isoformat() if sort_value else None, row_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple:
+    """Inverse of `encode_cursor`. Raises ValueError for malformed cursors."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def get_license_page(limit: int = 100, cursor: Optional[str] = None, updated_after: Optional[datetime] = None,
+                     status: Optional[str] = None, offset: int = 0) -> Dict:
+    """Get a page of licenses, newest change first, with active activation counts.
+    
+    Pages are keyset-paginated on (updated_at, id): pass the returned
+    `next_cursor` to get the following page. `total` is only computed for the
+    first page (no cursor) so later pages never pay for a count.
+    """
+    conditions = []
     params = []
     
     if updated_after:
-        query += " WHERE COALESCE(updated_at, generated_at) > %s"
+        conditions.append("updated_at > %s")
         params.append(updated_after)
-        
-    query += " ORDER BY COALESCE(updated_at, generated_at) DESC LIMIT %s OFFSET %s"
-    params.extend([limit, offset])
+    if status:
+        conditions.append(LICENSE_STATUS_FILTERS[status])
     
-    cursor.execute(query, tuple(params))
+    filter_conditions = list(conditions)
+    filter_params = list(params)
     
-    licenses = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    if cursor:
+        last_updated, last_id = decode_cursor(cursor)
+        conditions.append("(updated_at < %s OR (updated_at = %s AND id < %s))")
+        params.extend([last_updated, last_updated, last_id])
+        offset = 0
     
-    return licenses
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    params.extend([limit + 1, offset])
+    
+    # The count subquery only runs for the rows of the page, each one an
+    # index lookup on activations.license_key.
+    query = f"""
+        SELECT p.*, (
+            SELECT COUNT(*) FROM activations a
+            WHERE a.license_key = p.license_key AND a.is_active = TRUE
+        ) AS activation_count
+        FROM (
+            SELECT * FROM licenses
+            {where}
+            ORDER BY updated_at DESC, id DESC
+            LIMIT %s OFFSET %s
+        ) p
+        ORDER BY p.updated_at DESC, p.id DESC
+    """
+    
+    total = None
+    with db_connection() as conn:
+        db_cursor = dict_cursor(conn)
+        db_cursor.execute(query, tuple(params))
+        licenses = db_cursor.fetchall()
+        
+        if not cursor:
+            filter_where = f"WHERE {' AND '.join(filter_conditions)}" if filter_conditions else ""
+            db_cursor.execute(f"SELECT COUNT(*) AS total FROM licenses {filter_where}", tuple(filter_params))
+            total = db_cursor.fetchone()['total']
+        db_cursor.close()
+    
+    next_cursor = None
+    if len(licenses) > limit:
+        licenses = licenses[:limit]
+        last = licenses[-1]
+        next_cursor = encode_cursor(last['updated_at'], last['id'])
+    
+    return {"licenses": licenses, "total": total, "next_cursor": next_cursor}
 
-def get_activation(license_key: str, hardware_fingerprint: str) -> Optional[Dict]:
-    """Get activation by license and hardware fingerprint."""
-    conn = get_connection()
-    cursor = dict_cursor(conn)
+def get_activation(license_key: str, hardware_fingerprint: str, use_cache: bool = True) -> Optional[Dict]:
+    """Get active activation by license and hardware fingerprint (cached)."""
+    cache_key = (license_key, hardware_fingerprint)
+    if use_cache:
+        cached = activation_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
     
-    cursor.execute("""
-        SELECT * FROM activations 
-        WHERE license_key = %s AND hardware_fingerprint = %s AND is_active = TRUE
-    """, (license_key, hardware_fingerprint))
+    epoch = activation_cache.epoch
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        
+        cursor.execute("""
+            SELECT * FROM activations 
+            WHERE license_key = %s AND hardware_fingerprint = %s AND is_active = TRUE
+        """, (license_key, hardware_fingerprint))
+        
+        activation = cursor.fetchone()
+        cursor.close()
     
-    activation = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    if activation is not None:
+        activation_cache.set(cache_key, dict(activation), epoch=epoch)
     
     return activation
 
+def get_activations(pairs: List[tuple], use_cache: bool = True) -> Dict[tuple, Dict]:
+    """Get active activations for many (license_key, hardware_fingerprint) pairs at once."""
+    found = {}
+    misses = []
+    for pair in dict.fromkeys(pairs):
+        cached = activation_cache.get(pair) if use_cache else None
+        if cached is not None:
+            found[pair] = dict(cached)
+        else:
+            misses.append(pair)
+    
+    if not misses:
+        return found
+    
+    epoch = activation_cache.epoch
+    placeholders = ", ".join(["(%s, %s)"] * len(misses))
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        cursor.execute(f"""
+            SELECT * FROM activations
+            WHERE is_active = TRUE
+            AND (license_key, hardware_fingerprint) IN ({placeholders})
+        """, tuple(value for pair in misses for value in pair))
+        rows = cursor.fetchall()
+        cursor.close()
+    
+    for row in rows:
+        pair = (row['license_key'], row['hardware_fingerprint'])
+        activation_cache.set(pair, dict(row), epoch=epoch)
+        found[pair] = row
+    
+    return found
+
 def get_activations_for_license(license_key: str) -> List[Dict]:
     """Get all activations for a license."""
-    conn = get_connection()
-    cursor = dict_cursor(conn)
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        
+        cursor.execute("""
+            SELECT * FROM activations 
+            WHERE license_key = %s
+            ORDER BY activated_at DESC
+        """, (license_key,))
+        
+        activations = cursor.fetchall()
+        cursor.close()
     
-    cursor.execute("""
-        SELECT * FROM activations 
-        WHERE license_key = %s
-        ORDER BY activated_at DESC
-    """, (license_key,))
+    return activations
+
+def insert_validation_logs(rows: List[tuple]):
+    """Insert many validation log rows in one statement.
+
+    Each row is (license_key, hardware_fingerprint, status, remote_override,
+    message, validated_at).
+    """
+    if not rows:
+        return
     
-    activations = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        
+        if DB_TYPE == "postgresql":
+            execute_values(cursor, """
+                INSERT INTO validation_logs 
+                (license_key, hardware_fingerprint, status, remote_override, message, validated_at)
+                VALUES %s
+            """, rows, page_size=len(rows))
+        else:
+            # mysql-connector rewrites executemany INSERTs into one multi-row INSERT
+            cursor.executemany("""
+                INSERT INTO validation_logs 
+                (license_key, hardware_fingerprint, status, remote_override, message, validated_at)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, rows)
+        
+        conn.commit()
+        cursor.close()
+
+def get_admin_user(username: str) -> Optional[Dict]:
+    """Get admin user by username."""
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        cursor.execute("SELECT * FROM admin_users WHERE username = %s", (username,))
+        user = cursor.fetchone()
+        cursor.close()
     
-    return activations
+    return user
 
-def log_validation(license_key: str, hardware_fingerprint: str, status: str, 
-                   remote_override: bool = False, message: str = None):
-    """Log a validation attempt."""
-    conn = get_connection()
-    cursor = conn.cursor()
+def create_license(license_key: str, data: Dict, created_by: str) -> Optional[int]:
+    """Insert a new license and return its id.
     
-    cursor.execute("""
-        INSERT INTO validation_logs 
-        (license_key, hardware_fingerprint, status, remote_override, message)
-        VALUES (%s, %s, %s, %s, %s)
-    """, (license_key, hardware_fingerprint, status, remote_override, message))
+    The remote learns about it from the watermark sync (remote_sync.py), not
+    the outbox, so a new license is pushed exactly once.
+    """
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        
+        query = """
+            INSERT INTO licenses 
+            (license_key, customer_name, company_name, email, phone, 
+             expires_at, max_activations, restricted_fingerprint, notes, created_by)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """
+        if DB_TYPE == "postgresql":
+            # psycopg2 has no lastrowid for SERIAL columns
+            query += " RETURNING id"
+        
+        cursor.execute(query, (
+            license_key, data['customer_name'], data.get('company_name'),
+            data.get('email'), data.get('phone'), data['expires_at'],
+            data.get('max_activations', 1), data.get('restricted_fingerprint'),
+            data.get('notes'), created_by
+        ))
+        
+        license_id = cursor.fetchone()[0] if DB_TYPE == "postgresql" else cursor.lastrowid
+        conn.commit()
+        cursor.close()
     
-    conn.commit()
-    cursor.close()
-    conn.close()
+    return license_id
 
-def update_last_validated(activation_id: int):
-    """Update last validated timestamp for an activation."""
-    conn = get_connection()
-    cursor = conn.cursor()
+def create_licenses(licenses: List[Dict], created_by: str, new_key: Callable[[], str]) -> List[Dict]:
+    """Insert many licenses in one transaction and return their keys and ids.
     
+    Keys come from `new_key()`; any that repeat within the batch or already
+    exist are drawn again before the multi-row INSERT. Like create_license,
+    the remote learns about them from the watermark sync.
+    """
+    if not licenses:
+        return []
+    
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        
+        keys = []
+        taken = set()
+        while len(keys) < len(licenses):
+            candidates = []
+            while len(keys) + len(candidates) < len(licenses):
+                key = new_key()
+                if key not in taken:
+                    taken.add(key)
+                    candidates.append(key)
+            placeholders = ", ".join(["%s"] * len(candidates))
+            cursor.execute(
+                f"SELECT license_key FROM licenses WHERE license_key IN ({placeholders})", tuple(candidates)
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+            keys.extend(key for key in candidates if key not in existing)
+        
+        rows = [(
+            key, data['customer_name'], data.get('company_name'), data.get('email'), data.get('phone'),
+            data['expires_at'], data.get('max_activations', 1), data.get('restricted_fingerprint'),
+            data.get('notes'), created_by
+        ) for key, data in zip(keys, licenses)]
+        columns = """license_key, customer_name, company_name, email, phone,
+             expires_at, max_activations, restricted_fingerprint, notes, created_by"""
+        
+        if DB_TYPE == "postgresql":
+            returned = execute_values(
+                cursor, f"INSERT INTO licenses ({columns}) VALUES %s RETURNING license_key, id",
+                rows, page_size=len(rows), fetch=True
+            )
+        else:
+            # mysql-connector rewrites executemany INSERTs into one multi-row INSERT
+            cursor.executemany(
+                f"INSERT INTO licenses ({columns}) VALUES ({', '.join(['%s'] * 10)})", rows
+            )
+            cursor.execute(
+                f"SELECT license_key, id FROM licenses WHERE license_key IN ({', '.join(['%s'] * len(keys))})",
+                tuple(keys)
+            )
+            returned = cursor.fetchall()
+        ids = dict(returned)
+        conn.commit()
+        cursor.close()
+    
+    return [{"license_key": key, "id": ids.get(key)} for key in keys]
+
+def import_license(license_data: Dict):
+    """Insert or refresh a license fetched from the remote registry."""
     if DB_TYPE == "postgresql":
+        upsert = """
+            ON CONFLICT (license_key) DO UPDATE SET
+            customer_name = EXCLUDED.customer_name, expires_at = EXCLUDED.expires_at,
+            updated_at = CURRENT_TIMESTAMP
+        """
+    else:
+        upsert = """
+            ON DUPLICATE KEY UPDATE 
+            customer_name=VALUES(customer_name), expires_at=VALUES(expires_at)
+        """
+    
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        
+        # Convert iso format strings back to datetime if needed, 
+        # but MySQL connector often handles strings fine.
         cursor.execute("""
-            UPDATE activations 
-            SET last_validated = CURRENT_TIMESTAMP
-            WHERE id = %s
+            INSERT INTO licenses 
+            (license_key, customer_name, company_name, email, phone, 
+             expires_at, max_activations, restricted_fingerprint, notes, created_by, generated_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """ + upsert, (
+            license_data['license_key'], 
+            license_data['customer_name'], 
+            license_data.get('company_name'),
+            license_data.get('email'), 
+            license_data.get('phone'), 
+            license_data['expires_at'],
+            license_data['max_activations'], 
+            license_data['restricted_fingerprint'], 
+            license_data.get('notes'), 
+            license_data.get('created_by', 'system_sync'),
+            license_data.get('generated_at', datetime.now())
+        ))
+        # Recorded, not just notified, so MySQL workers polling license_events see it
+        _record_license_event(
+            cursor, license_data['license_key'], "imported", expires_at=license_data['expires_at']
+        )
+        
+        conn.commit()
+        cursor.close()
+    
+    invalidate_license(license_data['license_key'])
+
+def block_license(license_key: str, message: Optional[str]):
+    """Block a license with a message shown to clients."""
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            UPDATE licenses 
+            SET is_blocked = TRUE, block_message = %s, updated_at = CURRENT_TIMESTAMP
+            WHERE license_key = %s
+        """, (message, license_key))
+        if cursor.rowcount > 0:
+            _record_license_event(cursor, license_key, "blocked")
+        conn.commit()
+        cursor.close()
+    
+    license_cache.invalidate(license_key)
+
+def unblock_license(license_key: str):
+    """Clear the blocked flag of a license."""
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            UPDATE licenses 
+            SET is_blocked = FALSE, block_message = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE license_key = %s
+        """, (license_key,))
+        if cursor.rowcount > 0:
+            _record_license_event(cursor, license_key, "unblocked")
+        conn.commit()
+        cursor.close()
+    
+    license_cache.invalidate(license_key)
+
+def extend_license(license_key: str, new_expiry: datetime):
+    """Set a new expiry date for a license (and queue it for the remote)."""
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            UPDATE licenses 
+            SET expires_at = %s, updated_at = CURRENT_TIMESTAMP
+            WHERE license_key = %s
+        """, (new_expiry, license_key))
+        if cursor.rowcount > 0:
+            _enqueue_outbox(cursor, license_key, "extend", {"expires_at": new_expiry})
+            _record_license_event(cursor, license_key, "extended", expires_at=new_expiry)
+        conn.commit()
+        cursor.close()
+    
+    license_cache.invalidate(license_key)
+
+def delete_license(license_key: str) -> bool:
+    """Delete a license and its activations (and queue the deletion for the remote).
+    
+    Returns False if it did not exist.
+    """
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        
+        # Delete activations first (foreign key constraint)
+        cursor.execute("DELETE FROM activations WHERE license_key = %s", (license_key,))
+        
+        # Delete license
+        cursor.execute("DELETE FROM licenses WHERE license_key = %s", (license_key,))
+        deleted = cursor.rowcount > 0
+        
+        if deleted:
+            _enqueue_outbox(cursor, license_key, "delete")
+            _record_license_event(cursor, license_key, "deleted")
+            conn.commit()
+        cursor.close()
+    
+    if deleted:
+        invalidate_license(license_key)
+    return deleted
+
+def get_activation_page(limit: int = 100, cursor: Optional[str] = None) -> Dict:
+    """Get a page of activations joined with their license, newest first.
+    
+    Keyset-paginated on (activated_at, id) like `get_license_page`.
+    """
+    where = ""
+    params = []
+    if cursor:
+        last_activated, last_id = decode_cursor(cursor)
+        where = "WHERE (a.activated_at < %s OR (a.activated_at = %s AND a.id < %s))"
+        params.extend([last_activated, last_activated, last_id])
+    params.append(limit + 1)
+    
+    total = None
+    with db_connection() as conn:
+        db_cursor = dict_cursor(conn)
+        db_cursor.execute(f"""
+            SELECT a.*, l.customer_name, l.company_name, l.expires_at
+            FROM activations a
+            JOIN licenses l ON a.license_key = l.license_key
+            {where}
+            ORDER BY a.activated_at DESC, a.id DESC
+            LIMIT %s
+        """, tuple(params))
+        activations = db_cursor.fetchall()
+        
+        if not cursor:
+            db_cursor.execute("SELECT COUNT(*) AS total FROM activations")
+            total = db_cursor.fetchone()['total']
+        db_cursor.close()
+    
+    next_cursor = None
+    if len(activations) > limit:
+        activations = activations[:limit]
+        last = activations[-1]
+        next_cursor = encode_cursor(last['activated_at'], last['id'])
+    
+    return {"activations": activations, "total": total, "next_cursor": next_cursor}
+
+def activate_device(license_key: str, hardware_fingerprint: str,
+                    device_name: Optional[str] = None) -> tuple:
+    """Check a license and activate a device on it in one transaction.
+    
+    The license row is locked (SELECT ... FOR UPDATE) until commit, so
+    concurrent activations of the same key are serialized and cannot both
+    pass the max_activations check. Returns (outcome, license) where outcome
+    is one of "not_found", "no_binding", "hardware_mismatch", "blocked",
+    "expired", "already_active", "limit_reached" or "activated".
+    """
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        cursor.execute("SELECT * FROM licenses WHERE license_key = %s FOR UPDATE", (license_key,))
+        license = cursor.fetchone()
+        
+        outcome = None
+        if license is None:
+            outcome = "not_found"
+        elif not license['restricted_fingerprint']:
+            outcome = "no_binding"
+        elif license['restricted_fingerprint'] != hardware_fingerprint:
+            outcome = "hardware_mismatch"
+        elif license['is_blocked']:
+            outcome = "blocked"
+        elif license['expires_at'] < datetime.now():
+            outcome = "expired"
+        
+        if outcome is None:
+            # Active count and this device's activation in one pass
+            cursor.execute("""
+                SELECT
+                    COALESCE(SUM(CASE WHEN is_active THEN 1 ELSE 0 END), 0) AS active_count,
+                    MAX(CASE WHEN is_active AND hardware_fingerprint = %s THEN id END) AS existing_id
+                FROM activations
+                WHERE license_key = %s
+            """, (hardware_fingerprint, license_key))
+            counts = cursor.fetchone()
+            
+            if counts['existing_id'] is not None:
+                outcome = "already_active"
+            elif int(counts['active_count']) >= license['max_activations']:
+                outcome = "limit_reached"
+            else:
+                cursor.execute("""
+                    INSERT INTO activations 
+                    (license_key, hardware_fingerprint, device_name)
+                    VALUES (%s, %s, %s)
+                """, (license_key, hardware_fingerprint, device_name))
+                outcome = "activated"
+        
+        conn.commit()
+        cursor.close()
+    
+    if outcome == "activated":
+        activation_cache.invalidate((license_key, hardware_fingerprint))
+    return outcome, dict(license) if license is not None else None
+
+def deactivate_activation(activation_id: int):
+    """Mark a device activation as inactive."""
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT license_key, hardware_fingerprint FROM activations WHERE id = %s
         """, (activation_id,))
-    else:
+        row = cursor.fetchone()
         cursor.execute("""
             UPDATE activations 
-            SET last_validated = NOW()
-            WHERE id = %s
+            SET is_active = FALSE
+            WHERE id = %s AND is_active = TRUE
         """, (activation_id,))
+        if row and cursor.rowcount > 0:
+            _record_license_event(cursor, row[0], "deactivated", hardware_fingerprint=row[1])
+        conn.commit()
+        cursor.close()
+    
+    if row:
+        activation_cache.invalidate((row[0], row[1]))
+
+def get_stats(use_cache: bool = True) -> Dict:
+    """Get license and activation counters for the dashboard in one pass."""
+    if use_cache:
+        cached = stats_cache.get("stats")
+        if cached is not None:
+            return dict(cached)
+    
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        cursor.execute("""
+            SELECT
+                COUNT(*) AS total_licenses,
+                SUM(CASE WHEN expires_at > NOW() AND is_blocked = FALSE THEN 1 ELSE 0 END) AS active_licenses,
+                SUM(CASE WHEN expires_at <= NOW() THEN 1 ELSE 0 END) AS expired_licenses,
+                SUM(CASE WHEN is_blocked = TRUE THEN 1 ELSE 0 END) AS blocked_licenses,
+                (SELECT COUNT(*) FROM activations WHERE is_active = TRUE) AS total_activations
+            FROM licenses
+        """)
+        row = cursor.fetchone()
+        cursor.close()
+    
+    # SUM() is NULL on an empty table and a Decimal on MySQL
+    stats = {name: int(value or 0) for name, value in row.items()}
+    stats_cache.set("stats", stats)
+    return stats
+
+def bulk_update_last_validated(timestamps: Dict[int, datetime]):
+    """Set last_validated for many activations in a single UPDATE."""
+    if not timestamps:
+        return
+    
+    items = list(timestamps.items())
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        
+        if DB_TYPE == "postgresql":
+            execute_values(cursor, """
+                UPDATE activations AS a
+                SET last_validated = v.ts
+                FROM (VALUES %s) AS v(id, ts)
+                WHERE a.id = v.id
+            """, items, template="(%s, %s::timestamp)", page_size=len(items))
+        else:
+            cases = " ".join(["WHEN %s THEN %s"] * len(items))
+            placeholders = ", ".join(["%s"] * len(items))
+            params = [value for item in items for value in item]
+            params.extend(activation_id for activation_id, _ in items)
+            cursor.execute(f"""
+                UPDATE activations
+                SET last_validated = CASE id {cases} END
+                WHERE id IN ({placeholders})
+            """, tuple(params))
+        
+        conn.commit()
+        cursor.close()
+
+def get_licenses_changed_since(after: Optional[tuple] = None, limit: int = 500) -> List[Dict]:
+    """Get licenses changed after an (updated_at, id) position, oldest change first."""
+    query = "SELECT * FROM licenses"
+    params = []
+    
+    if after:
+        after_updated, after_id = after
+        query += " WHERE (updated_at > %s OR (updated_at = %s AND id > %s))"
+        params.extend([after_updated, after_updated, after_id])
+    
+    query += " ORDER BY updated_at, id LIMIT %s"
+    params.append(limit)
+    
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        cursor.execute(query, tuple(params))
+        licenses = cursor.fetchall()
+        cursor.close()
+    
+    return licenses
+
+# ============================================================================
+# Bulk Export / Import
+# ============================================================================
+
+EXPORT_FETCH_SIZE = 2000
+
+# Portable columns per table (ids are local and never exported)
+EXPORT_COLUMNS = {
+    "licenses": (
+        "license_key", "customer_name", "company_name", "email", "phone", "expires_at",
+        "max_activations", "restricted_fingerprint", "notes", "is_blocked", "block_message",
+        "created_by", "generated_at", "updated_at",
+    ),
+    "activations": (
+        "license_key", "hardware_fingerprint", "device_name", "activated_at", "last_validated", "is_active",
+    ),
+}
+
+def iter_table_batches(table: str, batch_size: int = EXPORT_FETCH_SIZE):
+    """Yield all rows of an exportable table as lists of dicts, in id order.
+    
+    Uses a dedicated connection and a server-side cursor, so memory stays
+    bounded by `batch_size` however large the table is.
+    """
+    columns = ", ".join(EXPORT_COLUMNS[table])
+    conn = get_connection()
+    try:
+        if DB_TYPE == "postgresql":
+            cursor = conn.cursor(name=f"export_{table}", cursor_factory=RealDictCursor)
+            cursor.itersize = batch_size
+        else:
+            cursor = conn.cursor(dictionary=True)   # unbuffered: streams from the server
+        try:
+            cursor.execute(f"SELECT {columns} FROM {table} ORDER BY id")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+    finally:
+        conn.close()
+
+def _existing_license_keys(cursor, license_keys: List[str]) -> set:
+    placeholders = ", ".join(["%s"] * len(license_keys))
+    cursor.execute(f"SELECT license_key FROM licenses WHERE license_key IN ({placeholders})", tuple(license_keys))
+    return {row[0] for row in cursor.fetchall()}
+
+def upsert_licenses(rows: List[Dict]) -> int:
+    """Insert or fully overwrite licenses by license_key in one statement.
+    
+    Existing licenses whose block state or expiry changes get the same
+    license_events rows as the admin endpoints write, so the revocation feed
+    reports them.
+    """
+    if not rows:
+        return 0
+    
+    columns = [c for c in EXPORT_COLUMNS["licenses"] if c != "updated_at"]
+    now = datetime.now()
+    values = [tuple(row.get(c) for c in columns) + (now,) for row in rows]
+    column_list = ", ".join(columns) + ", updated_at"
+    updates = [c for c in columns if c != "license_key"] + ["updated_at"]
+    
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        placeholders = ", ".join(["%s"] * len(rows))
+        cursor.execute(f"""
+            SELECT license_key, is_blocked, expires_at FROM licenses
+            WHERE license_key IN ({placeholders})
+        """, tuple(row['license_key'] for row in rows))
+        before = {key: (bool(is_blocked), expires_at) for key, is_blocked, expires_at in cursor.fetchall()}
+        
+        if DB_TYPE == "postgresql":
+            execute_values(cursor, f"""
+                INSERT INTO licenses ({column_list}) VALUES %s
+                ON CONFLICT (license_key) DO UPDATE SET
+                {", ".join(f"{c} = EXCLUDED.{c}" for c in updates)}
+            """, values, page_size=len(values))
+        else:
+            cursor.executemany(f"""
+                INSERT INTO licenses ({column_list}) VALUES ({", ".join(["%s"] * (len(columns) + 1))})
+                ON DUPLICATE KEY UPDATE {", ".join(f"{c} = VALUES({c})" for c in updates)}
+            """, values)
+        
+        events = []
+        for row in rows:
+            if row['license_key'] not in before:
+                continue
+            was_blocked, old_expiry = before[row['license_key']]
+            if row['is_blocked'] != was_blocked:
+                events.append((row['license_key'], "blocked" if row['is_blocked'] else "unblocked", None))
+            if row['expires_at'] != old_expiry:
+                events.append((row['license_key'], "extended", row['expires_at']))
+        _record_license_events(cursor, events)
+        conn.commit()
+        cursor.close()
+    
+    invalidate_licenses(row['license_key'] for row in rows)
+    return len(rows)
+
+def insert_activations(rows: List[Dict]) -> tuple:
+    """Insert activations not already present. Returns (inserted, skipped).
+    
+    A row is skipped when its license does not exist or an activation with
+    the same license, fingerprint and activation time does, which makes
+    re-importing the same file a no-op.
+    """
+    if not rows:
+        return 0, 0
+    
+    columns = EXPORT_COLUMNS["activations"]
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        keys = list({row['license_key'] for row in rows})
+        known = _existing_license_keys(cursor, keys)
+        placeholders = ", ".join(["%s"] * len(keys))
+        cursor.execute(f"""
+            SELECT license_key, hardware_fingerprint, activated_at FROM activations
+            WHERE license_key IN ({placeholders})
+        """, tuple(keys))
+        present = set(cursor.fetchall())
+        
+        values = []
+        for row in rows:
+            identity = (row['license_key'], row['hardware_fingerprint'], row.get('activated_at'))
+            if row['license_key'] in known and identity not in present:
+                present.add(identity)
+                values.append(tuple(row.get(c) for c in columns))
+        
+        if values:
+            if DB_TYPE == "postgresql":
+                execute_values(cursor, f"INSERT INTO activations ({', '.join(columns)}) VALUES %s",
+                               values, page_size=len(values))
+            else:
+                cursor.executemany(f"""
+                    INSERT INTO activations ({', '.join(columns)}) VALUES ({", ".join(["%s"] * len(columns))})
+                """, values)
+        conn.commit()
+        cursor.close()
+    
+    invalidate_licenses(keys)
+    return len(values), len(rows) - len(values)
+
+def notify_bulk_change():
+    """Tell every worker to drop its caches after a bulk change.
+    
+    Recorded as an ALL_LICENSES event, so MySQL workers polling
+    license_events see it too; the revocation feed leaves it out.
+    """
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        _record_license_event(cursor, ALL_LICENSES, "imported")
+        conn.commit()
+        cursor.close()
+
+# ============================================================================
+# Sync Outbox
+# ============================================================================
+
+# A claimed row is invisible to other dispatchers for this long; if its
+# dispatcher dies mid-request the row becomes claimable again afterwards.
+OUTBOX_LOCK_SECONDS = float(os.getenv("OUTBOX_LOCK_SECONDS", "120"))
+
+# Nothing is queued while remote sync is disabled: no dispatcher would ever
+# drain the table, and delete rows are never superseded, so it would only grow.
+_outbox_enabled = True
+
+def set_outbox_enabled(enabled: bool):
+    global _outbox_enabled
+    _outbox_enabled = enabled
+
+# Pending operations made redundant by a newer operation on the same license.
+# New licenses are not queued here: the watermark sync pushes them (and any
+# other change to a license row), so the outbox only carries the extensions
+# and deletions that must reach the remote promptly.
+_OUTBOX_SUPERSEDES = {
+    "extend": ("extend",),
+    "delete": ("extend", "delete"),
+}
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _enqueue_outbox(cursor, license_key: str, operation: str, payload: Optional[Dict] = None):
+    """Queue a remote change on the caller's cursor, inside its transaction.
+    
+    Pending (unclaimed) rows for the same license that the new operation
+    supersedes are dropped, so a burst of edits is sent once.
+    """
+    if not _outbox_enabled:
+        return
+    now = datetime.now()
+    superseded = _OUTBOX_SUPERSEDES[operation]
+    placeholders = ", ".join(["%s"] * len(superseded))
+    cursor.execute(f"""
+        DELETE FROM sync_outbox
+        WHERE license_key = %s AND operation IN ({placeholders})
+          AND (locked_until IS NULL OR locked_until < %s)
+    """, (license_key, *superseded, now))
+    cursor.execute("""
+        INSERT INTO sync_outbox (license_key, operation, payload, next_attempt_at, created_at)
+        VALUES (%s, %s, %s, %s, %s)
+    """, (
+        license_key, operation,
+        json.dumps(payload, default=_json_default) if payload is not None else None,
+        now, now
+    ))
+
+def claim_outbox(limit: int = 50, lock_seconds: float = OUTBOX_LOCK_SECONDS) -> List[Dict]:
+    """Claim due outbox rows for dispatch, at most one (the oldest) per license.
+    
+    A row is only claimable while no earlier row for its license exists, so
+    changes reach the remote in the order they were made. SKIP LOCKED lets
+    several dispatchers claim disjoint batches concurrently.
+    """
+    now = datetime.now()
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        cursor.execute("""
+            SELECT o.id, o.license_key, o.operation, o.payload, o.attempts
+            FROM sync_outbox o
+            WHERE o.next_attempt_at <= %s
+              AND (o.locked_until IS NULL OR o.locked_until < %s)
+              AND NOT EXISTS (
+                  SELECT 1 FROM sync_outbox e
+                  WHERE e.license_key = o.license_key AND e.id < o.id
+              )
+            ORDER BY o.id
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+        """, (now, now, limit))
+        rows = [dict(row) for row in cursor.fetchall()]
+        
+        if rows:
+            placeholders = ", ".join(["%s"] * len(rows))
+            cursor.execute(f"""
+                UPDATE sync_outbox SET locked_until = %s, attempts = attempts + 1
+                WHERE id IN ({placeholders})
+            """, (now + timedelta(seconds=lock_seconds), *[row['id'] for row in rows]))
+        
+        conn.commit()
+        cursor.close()
+    
+    for row in rows:
+        row['attempts'] += 1
+    return rows
+
+def complete_outbox(outbox_id: int):
+    """Remove an outbox row once the remote has accepted (or finally rejected) it."""
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM sync_outbox WHERE id = %s", (outbox_id,))
+        conn.commit()
+        cursor.close()
+
+def retry_outbox(outbox_id: int, error: str, next_attempt_at: datetime):
+    """Release a claimed outbox row for another attempt at `next_attempt_at`."""
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            UPDATE sync_outbox
+            SET locked_until = NULL, next_attempt_at = %s, last_error = %s
+            WHERE id = %s
+        """, (next_attempt_at, error[:1000], outbox_id))
+        conn.commit()
+        cursor.close()
+
+def get_outbox_stats() -> Dict:
+    """Backlog size and age of the sync outbox."""
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        cursor.execute("""
+            SELECT
+                COUNT(*) AS pending,
+                COUNT(CASE WHEN attempts > 0 THEN 1 END) AS retrying,
+                MIN(created_at) AS oldest_created_at
+            FROM sync_outbox
+        """)
+        stats = dict(cursor.fetchone())
+        cursor.close()
+    
+    stats['pending'] = int(stats['pending'] or 0)
+    stats['retrying'] = int(stats['retrying'] or 0)
+    return stats
+
+# ============================================================================
+# License Events (revocation feed for offline tokens)
+# ============================================================================
+
+# PostgreSQL channel every worker LISTENs on to evict changed licenses
+LICENSE_EVENTS_CHANNEL = "license_events"
+# License key in a cache event meaning "every license" (bulk changes)
+ALL_LICENSES = "*"
+
+def _notify_license_change(cursor, license_key: str, event: str, hardware_fingerprint: Optional[str] = None):
+    """Tell other workers to evict a license (PostgreSQL: delivered on commit).
+    
+    MySQL has no NOTIFY; its workers poll license_events instead.
+    """
+    if DB_TYPE == "postgresql":
+        payload = json.dumps({"key": license_key, "event": event, "fp": hardware_fingerprint})
+        cursor.execute("SELECT pg_notify(%s, %s)", (LICENSE_EVENTS_CHANNEL, payload))
+
+def _record_license_event(cursor, license_key: str, event: str,
+                          hardware_fingerprint: Optional[str] = None, expires_at: Optional[datetime] = None):
+    """Append a license change to license_events, inside the caller's transaction."""
+    cursor.execute("""
+        INSERT INTO license_events (license_key, event, hardware_fingerprint, expires_at, created_at)
+        VALUES (%s, %s, %s, %s, %s)
+    """, (license_key, event, hardware_fingerprint, expires_at, datetime.now()))
+    _notify_license_change(cursor, license_key, event, hardware_fingerprint)
+
+def _record_license_events(cursor, events: List[tuple]):
+    """Append many (license_key, event, expires_at) changes in one statement.
+    
+    No per-license NOTIFY: bulk writers follow up with notify_bulk_change().
+    """
+    if not events:
+        return
+    now = datetime.now()
+    rows = [(key, event, expires_at, now) for key, event, expires_at in events]
+    query = "INSERT INTO license_events (license_key, event, expires_at, created_at) VALUES "
+    if DB_TYPE == "postgresql":
+        execute_values(cursor, query + "%s", rows, page_size=len(rows))
+    else:
+        cursor.executemany(query + "(%s, %s, %s, %s)", rows)
+
+# Event ids are drawn at INSERT but become visible at COMMIT, so an event can
+# appear behind ids a reader has already moved past. Readers only advance over
+# events at least this old, assuming no transaction that records one stays
+# open longer than that.
+LICENSE_EVENT_SETTLE_SECONDS = float(os.getenv("LICENSE_EVENT_SETTLE_SECONDS", "10"))
+
+def settled_license_events(events: List[Dict], settle_seconds: float = LICENSE_EVENT_SETTLE_SECONDS) -> List[Dict]:
+    """The leading events (in id order) that are older than the settle window.
+    
+    Stops at the first newer one, so a reader advancing to the last returned
+    id cannot skip an earlier id that has not committed yet.
+    """
+    cutoff = datetime.now() - timedelta(seconds=settle_seconds)
+    for i, event in enumerate(events):
+        if event['created_at'] > cutoff:
+            return events[:i]
+    return events
+
+def get_license_events(since: int = 0, limit: int = 1000, settled: bool = True) -> List[Dict]:
+    """Get license events with id > `since`, oldest first.
+    
+    With `settled`, events still inside the settle window (and any after
+    them) are left for a later call.
+    """
+    with db_connection() as conn:
+        cursor = dict_cursor(conn)
+        cursor.execute("""
+            SELECT id, license_key, event, hardware_fingerprint, expires_at, created_at
+            FROM license_events
+            WHERE id > %s
+            ORDER BY id
+            LIMIT %s
+        """, (since, limit))
+        events = cursor.fetchall()
+        cursor.close()
+    
+    return settled_license_events(events, LICENSE_EVENT_SETTLE_SECONDS) if settled else events
+
+def get_latest_license_event_id() -> int:
+    """Id of the newest settled license event (0 if there are none), to start reading after."""
+    cutoff = datetime.now() - timedelta(seconds=LICENSE_EVENT_SETTLE_SECONDS)
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        # Walks the primary key down from the newest row, so only the
+        # unsettled tail is scanned
+        cursor.execute("""
+            SELECT id FROM license_events WHERE created_at <= %s ORDER BY id DESC LIMIT 1
+        """, (cutoff,))
+        row = cursor.fetchone()
+        cursor.close()
+    
+    return int(row[0]) if row else 0
+
+# ============================================================================
+# Server State (shared by all workers)
+# ============================================================================
+
+def get_state(name: str) -> Optional[str]:
+    """Read a value from the server_state table."""
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT value FROM server_state WHERE name = %s", (name,))
+        row = cursor.fetchone()
+        cursor.close()
+    
+    return row[0] if row else None
+
+def set_state(name: str, value: Optional[str]):
+    """Write a value to the server_state table."""
+    if DB_TYPE == "postgresql":
+        query = """
+            INSERT INTO server_state (name, value, updated_at) VALUES (%s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT (name) DO UPDATE SET value = EXCLUDED.value, updated_at = CURRENT_TIMESTAMP
+        """
+    else:
+        query = """
+            INSERT INTO server_state (name, value, updated_at) VALUES (%s, %s, CURRENT_TIMESTAMP)
+            ON DUPLICATE KEY UPDATE value = VALUES(value), updated_at = CURRENT_TIMESTAMP
+        """
+    
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(query, (name, value))
+        conn.commit()
+        cursor.close()
+
+def init_state(name: str, value: str) -> str:
+    """Store `value` unless the name is already set; return whichever value is stored.
+    
+    Lets several workers race to initialize a shared value (e.g. a generated
+    key) and all end up using the same one.
+    """
+    insert = "INSERT INTO server_state (name, value, updated_at) VALUES (%s, %s, CURRENT_TIMESTAMP)"
+    if DB_TYPE == "postgresql":
+        insert += " ON CONFLICT (name) DO NOTHING"
+    else:
+        insert = insert.replace("INSERT", "INSERT IGNORE", 1)
+    
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(insert, (name, value))
+        cursor.execute("SELECT value FROM server_state WHERE name = %s", (name,))
+        stored = cursor.fetchone()[0]
+        conn.commit()
+        cursor.close()
+    
+    return stored
+
+def try_acquire_lease(name: str, owner: str, ttl_seconds: float) -> bool:
+    """Take or renew a named lease so only one worker runs a singleton job.
+    
+    The lease is held by `owner` until it stops renewing it for `ttl_seconds`.
+    """
+    now = datetime.now()
+    insert = "INSERT INTO server_state (name, value, updated_at) VALUES (%s, %s, %s)"
+    if DB_TYPE == "postgresql":
+        insert += " ON CONFLICT (name) DO NOTHING"
+    else:
+        insert = insert.replace("INSERT", "INSERT IGNORE", 1)
+    
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(insert, (name, owner, now))
+        acquired = cursor.rowcount == 1
+        if not acquired:
+            cursor.execute("""
+                UPDATE server_state SET value = %s, updated_at = %s
+                WHERE name = %s AND (value = %s OR updated_at < %s)
+            """, (owner, now, name, owner, now - timedelta(seconds=ttl_seconds)))
+            # Not rowcount: MySQL counts changed rows, and a renewal within
+            # the same second changes nothing
+            cursor.execute("SELECT value FROM server_state WHERE name = %s", (name,))
+            acquired = cursor.fetchone()[0] == owner
+        conn.commit()
+        cursor.close()
     
-    conn.commit()
-    cursor.close()
-    conn.close()
+    return acquired
@@ -0,0 +1,121 @@
+# Layer 1 License Server - Signed Offline License Tokens
+#
+# A successful /activate or /validate returns a short-lived JWT binding the
+# license key, the device fingerprint and the license expiry. Clients verify
+# it locally with the public key from GET /license-token/keys and only come
+# back when it is about to expire, polling GET /revocations in between to
+# learn about blocked, deleted, extended or deactivated licenses. The feed
+# carries SHA-256 hashes, never license keys or fingerprints.
+#
+# Tokens are signed with ES256 (P-256 ECDSA): python-jose has no EdDSA
+# support, and ES256 gives the same small keys and signatures.
+import os
+import hashlib
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from jose import jwk, jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+import database
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+# PEM private key (P-256). When unset, one is generated on first start and
+# kept in server_state so every worker and node signs with the same key.
+LICENSE_TOKEN_PRIVATE_KEY = os.getenv("LICENSE_TOKEN_PRIVATE_KEY", "")
+# Seconds a token stays valid (never beyond the license expiry)
+LICENSE_TOKEN_TTL = int(os.getenv("LICENSE_TOKEN_TTL", str(24 * 3600)))
+LICENSE_TOKEN_ISSUER = os.getenv("LICENSE_TOKEN_ISSUER", "layer1-license-server")
+
+ALGORITHM = "ES256"
+SIGNING_KEY_STATE = "license_token_signing_key"
+
+def _generate_private_key() -> str:
+    key = ec.generate_private_key(ec.SECP256R1())
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+# ============================================================================
+# Signer
+# ============================================================================
+
+class TokenSigner:
+    """Issues license tokens with the server's signing key."""
+
+    def __init__(self):
+        self._key = None
+        self.public_pem: Optional[str] = None
+        self.kid: Optional[str] = None
+        self.issued = 0
+
+    def load(self):
+        """Load (or create and share) the signing key. Blocking: call at startup."""
+        pem = LICENSE_TOKEN_PRIVATE_KEY or database.init_state(SIGNING_KEY_STATE, _generate_private_key())
+        private_key = serialization.load_pem_private_key(pem.encode(), password=None)
+        public_key = private_key.public_key()
+
+        self.public_pem = public_key.public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode()
+        der = public_key.public_bytes(
+            serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        self.kid = hashlib.sha256(der).hexdigest()[:16]
+        # Parsed once; passing the PEM to jwt.encode would re-parse it per token
+        self._key = jwk.construct(pem, ALGORITHM)
+
+    def issue(self, license: Dict, hardware_fingerprint: str) -> Dict:
+        """Sign a token for a valid license on one device."""
+        now = datetime.now()
+        expires = min(now + timedelta(seconds=LICENSE_TOKEN_TTL), license['expires_at'])
+        claims = {
+            "iss": LICENSE_TOKEN_ISSUER,
+            "sub": license['license_key'],
+            "fp": hardware_fingerprint,
+            "lic_exp": int(license['expires_at'].timestamp()),
+            "iat": int(now.timestamp()),
+            "exp": int(expires.timestamp()),
+        }
+        self.issued += 1
+        return {
+            "token": jwt.encode(claims, self._key, algorithm=ALGORITHM, headers={"kid": self.kid}),
+            "token_expires_at": expires,
+        }
+
+    def jwks(self) -> Dict:
+        """Public key as a JWK set, plus PEM for clients without a JOSE library."""
+        public = jwk.construct(self.public_pem, ALGORITHM).to_dict()
+        public.update({"kid": self.kid, "use": "sig", "alg": ALGORITHM})
+        return {"keys": [public], "pem": self.public_pem, "ttl": LICENSE_TOKEN_TTL}
+
+def feed_hash(*parts: str) -> str:
+    """SHA-256 hex of the parts joined with ":", as published by GET /revocations.
+
+    The feed is public, so it names licenses by `feed_hash(license_key)` and
+    devices by `feed_hash(license_key, hardware_fingerprint)`; a client can
+    compute both from its own token, nobody else can reverse them.
+    """
+    return hashlib.sha256(":".join(parts).encode()).hexdigest()
+
+def revocation_entry(event: Dict) -> Dict:
+    """A license_events row as published by the feed, without key or fingerprint."""
+    entry = {
+        "id": event['id'],
+        "key_hash": feed_hash(event['license_key']),
+        "event": event['event'],
+        "created_at": event['created_at'],
+    }
+    if event.get('hardware_fingerprint'):
+        entry["device_hash"] = feed_hash(event['license_key'], event['hardware_fingerprint'])
+    if event.get('expires_at'):
+        entry["expires_at"] = event['expires_at']
+    return entry
+
+token_signer = TokenSigner()
@@ -0,0 +1,342 @@
+# Layer 1 License Server - Validation Log Partitioning and Retention
+#
+# validation_logs gains a row on every validate/activate attempt. It is split
+# by month so old history is removed a whole table at a time instead of with
+# row-by-row DELETEs, which keeps insert and index cost flat as it grows:
+#
+# - PostgreSQL: native range partitions validation_logs_pYYYYMM, plus a
+#   DEFAULT partition so inserts never fail if maintenance falls behind.
+#   Partitions are created LOG_PARTITION_PREMAKE months ahead.
+# - MySQL: rolling tables. Once the live table holds rows from a finished
+#   month it is atomically swapped (RENAME TABLE) for an empty copy, and its
+#   rows are split into one validation_logs_pYYYYMM table per month.
+#
+# Months older than LOG_RETENTION_MONTHS are streamed to LOG_ARCHIVE_DIR as
+# gzip-compressed NDJSON (when set) and then dropped. Run this module directly
+# for a one-off pass.
+import os
+import re
+import gzip
+import json
+import socket
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import database
+import async_database as db
+from database import DB_TYPE, get_connection
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+# Whole months of logs kept in the database (the current month included)
+LOG_RETENTION_MONTHS = int(os.getenv("LOG_RETENTION_MONTHS", "6"))
+# Where expired months are archived before being dropped ("" = drop only)
+LOG_ARCHIVE_DIR = os.getenv("LOG_ARCHIVE_DIR", "")
+# Future months partitioned in advance (PostgreSQL)
+LOG_PARTITION_PREMAKE = int(os.getenv("LOG_PARTITION_PREMAKE", "3"))
+LOG_RETENTION_INTERVAL = float(os.getenv("LOG_RETENTION_INTERVAL", "3600"))
+
+LEASE_STATE = "log_retention_lease"
+DEFAULT_PARTITION = "validation_logs_default"
+ROTATING_TABLE = "validation_logs_rotating"   # MySQL: swapped out, being split by month
+ARCHIVE_FETCH_SIZE = 5000
+
+_PARTITION_RE = re.compile(r"^validation_logs_p(\d{4})(\d{2})$")
+
+# ============================================================================
+# Months and Names
+# ============================================================================
+
+def month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+def add_months(month: datetime, count: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + count
+    return datetime(index // 12, index % 12 + 1, 1)
+
+def partition_name(month: datetime) -> str:
+    return f"validation_logs_p{month:%Y%m}"
+
+def list_log_tables(cursor) -> List[Tuple[str, datetime]]:
+    """Monthly partitions / rotated tables as (name, month), oldest first."""
+    if DB_TYPE == "postgresql":
+        cursor.execute("""
+            SELECT table_name FROM information_schema.tables
+            WHERE table_schema = current_schema() AND table_name LIKE 'validation_logs_p%'
+        """)
+    else:
+        cursor.execute("""
+            SELECT table_name FROM information_schema.tables
+            WHERE table_schema = DATABASE() AND table_name LIKE 'validation_logs_p%'
+        """)
+
+    tables = []
+    for (name,) in cursor.fetchall():
+        match = _PARTITION_RE.match(name)
+        if match:
+            tables.append((name, datetime(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(tables, key=lambda table: table[1])
+
+# ============================================================================
+# PostgreSQL Partitions
+# ============================================================================
+
+def create_month_partition(cursor, month: datetime) -> bool:
+    """Create the partition for `month` if it is missing. Returns True if created."""
+    name = partition_name(month)
+    end = add_months(month, 1)
+    cursor.execute("SELECT to_regclass(%s)", (name,))
+    if cursor.fetchone()[0] is not None:
+        return False
+
+    cursor.execute(f"""
+        SELECT 1 FROM {DEFAULT_PARTITION} WHERE validated_at >= %s AND validated_at < %s LIMIT 1
+    """, (month, end))
+    if cursor.fetchone() is None:
+        cursor.execute(f"""
+            CREATE TABLE {name} PARTITION OF validation_logs FOR VALUES FROM (%s) TO (%s)
+        """, (month, end))
+    else:
+        # Rows for this month already landed in the DEFAULT partition, which
+        # forbids creating an overlapping partition: move them out first
+        cursor.execute(f"CREATE TABLE {name} (LIKE validation_logs INCLUDING DEFAULTS)")
+        cursor.execute(f"""
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION}
+                WHERE validated_at >= %s AND validated_at < %s
+                RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+        """, (month, end))
+        cursor.execute(f"""
+            ALTER TABLE validation_logs ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s)
+        """, (month, end))
+    return True
+
+def ensure_partitions(conn, now: Optional[datetime] = None) -> List[str]:
+    """Create partitions for the current month and the next LOG_PARTITION_PREMAKE.
+
+    Months that only exist in the DEFAULT partition (rows written while a
+    partition was missing) get theirs too, so they expire like any other.
+    """
+    current = month_start(now or datetime.now())
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT DISTINCT date_trunc('month', validated_at) FROM {DEFAULT_PARTITION}")
+    months = {row[0] for row in cursor.fetchall()}
+    months.update(add_months(current, offset) for offset in range(LOG_PARTITION_PREMAKE + 1))
+
+    created = []
+    for month in sorted(months):
+        if create_month_partition(cursor, month):
+            created.append(partition_name(month))
+        conn.commit()
+    cursor.close()
+    return created
+
+# ============================================================================
+# MySQL Rolling Tables
+# ============================================================================
+
+def _table_exists(cursor, name: str) -> bool:
+    cursor.execute("""
+        SELECT COUNT(*) FROM information_schema.tables
+        WHERE table_schema = DATABASE() AND table_name = %s
+    """, (name,))
+    return cursor.fetchone()[0] > 0
+
+def _split_rotating(conn, current: datetime) -> List[str]:
+    """Move the rows of ROTATING_TABLE into one table per month, then drop it.
+
+    Each finished month is copied with one INSERT ... SELECT into its
+    validation_logs_pYYYYMM (merged into it if it already exists); rows from
+    the current month go back to the live table. INSERT IGNORE on the id
+    makes the copy idempotent, so a split interrupted half way is simply
+    redone by the next pass.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"""
+            SELECT DISTINCT YEAR(validated_at), MONTH(validated_at) FROM {ROTATING_TABLE}
+            WHERE validated_at < %s
+        """, (current,))
+        months = sorted(datetime(year, month, 1) for year, month in cursor.fetchall())
+
+        written = []
+        for month in months:
+            name = partition_name(month)
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS {name} LIKE validation_logs")
+            cursor.execute(f"""
+                INSERT IGNORE INTO {name}
+                SELECT * FROM {ROTATING_TABLE} WHERE validated_at >= %s AND validated_at < %s
+            """, (month, add_months(month, 1)))
+            conn.commit()
+            written.append(name)
+
+        cursor.execute(f"""
+            INSERT IGNORE INTO validation_logs
+            SELECT * FROM {ROTATING_TABLE} WHERE validated_at >= %s OR validated_at IS NULL
+        """, (current,))
+        cursor.execute(f"DROP TABLE {ROTATING_TABLE}")
+        conn.commit()
+        return written
+    finally:
+        cursor.close()
+
+def rotate_table(conn, now: Optional[datetime] = None) -> List[str]:
+    """Move rows of finished months out of the live table.
+
+    When the live table's oldest row is from a finished month, it is
+    atomically swapped (RENAME TABLE) for an empty copy and then split by
+    month. Rows written around the swap are picked up by a later pass and
+    merged into their month. Returns the month tables written to.
+    """
+    current = month_start(now or datetime.now())
+    cursor = conn.cursor()
+    try:
+        # A previous pass stopped after the swap: finish its split first
+        if not _table_exists(cursor, ROTATING_TABLE):
+            cursor.execute("""
+                SELECT validated_at FROM validation_logs
+                WHERE validated_at IS NOT NULL ORDER BY id LIMIT 1
+            """)
+            row = cursor.fetchone()
+            if row is None or row[0] >= current:
+                return []
+
+            cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM validation_logs")
+            next_id = cursor.fetchone()[0]
+            cursor.execute("DROP TABLE IF EXISTS validation_logs_next")
+            cursor.execute("CREATE TABLE validation_logs_next LIKE validation_logs")
+            # Keep ids increasing across tables so archives never collide
+            cursor.execute(f"ALTER TABLE validation_logs_next AUTO_INCREMENT = {int(next_id)}")
+            cursor.execute(
+                f"RENAME TABLE validation_logs TO {ROTATING_TABLE}, validation_logs_next TO validation_logs"
+            )
+            conn.commit()
+    finally:
+        cursor.close()
+
+    return _split_rotating(conn, current)
+
+# ============================================================================
+# Archive and Drop
+# ============================================================================
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def archive_table(conn, name: str, directory: str) -> int:
+    """Stream a log table to `<directory>/<name>.ndjson.gz`. Returns the row count."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{name}.ndjson.gz")
+    if os.path.exists(path):
+        # Late rows for an already archived month: never overwrite the first archive
+        path = os.path.join(directory, f"{name}-{datetime.now():%Y%m%d%H%M%S}.ndjson.gz")
+    partial = path + ".partial"
+
+    if DB_TYPE == "postgresql":
+        # Named (server-side) cursor: rows arrive in chunks, not all at once
+        cursor = conn.cursor(name=f"archive_{name}", cursor_factory=database.RealDictCursor)
+        cursor.itersize = ARCHIVE_FETCH_SIZE
+    else:
+        cursor = conn.cursor(dictionary=True)   # unbuffered: streams from the server
+
+    count = 0
+    try:
+        cursor.execute(f"SELECT * FROM {name} ORDER BY id")
+        with gzip.open(partial, "wt", encoding="utf-8") as archive:
+            while True:
+                rows = cursor.fetchmany(ARCHIVE_FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    archive.write(json.dumps(row, default=_json_default) + "\n")
+                count += len(rows)
+    finally:
+        cursor.close()
+        conn.commit()
+
+    # Only a complete archive ever carries the final name
+    os.replace(partial, path)
+    return count
+
+def newest_log_time(conn, name: str) -> Optional[datetime]:
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT MAX(validated_at) FROM {name}")
+    newest = cursor.fetchone()[0]
+    conn.commit()
+    cursor.close()
+    return newest
+
+def drop_log_table(conn, name: str):
+    cursor = conn.cursor()
+    if DB_TYPE == "postgresql":
+        cursor.execute(f"ALTER TABLE validation_logs DETACH PARTITION {name}")
+    cursor.execute(f"DROP TABLE {name}")
+    conn.commit()
+    cursor.close()
+
+# ============================================================================
+# Retention Pass
+# ============================================================================
+
+def run_retention(now: Optional[datetime] = None) -> Dict:
+    """Prepare upcoming months, then archive and drop expired ones."""
+    now = now or datetime.now()
+    cutoff = add_months(month_start(now), -(LOG_RETENTION_MONTHS - 1))
+    report = {"created": [], "rotated": [], "archived": {}, "dropped": []}
+
+    # Dedicated connection: archiving can stream for a long time
+    conn = get_connection()
+    try:
+        if DB_TYPE == "postgresql":
+            report["created"] = ensure_partitions(conn, now)
+        else:
+            report["rotated"] = rotate_table(conn, now)
+
+        cursor = conn.cursor()
+        expired = [name for name, month in list_log_tables(cursor) if month < cutoff]
+        conn.commit()
+        cursor.close()
+
+        for name in expired:
+            # Never drop rows that are still inside the retention window
+            newest = newest_log_time(conn, name)
+            if newest is not None and newest >= cutoff:
+                print(f"⚠️ Kept validation log table {name}: it has rows up to {newest}")
+                continue
+
+            if LOG_ARCHIVE_DIR:
+                report["archived"][name] = archive_table(conn, name, LOG_ARCHIVE_DIR)
+            drop_log_table(conn, name)
+            report["dropped"].append(name)
+            print(f"🗑️ Dropped validation log partition {name}")
+    finally:
+        conn.close()
+
+    return report
+
+async def run_forever():
+    """Background loop: one retention pass every LOG_RETENTION_INTERVAL seconds."""
+    owner = f"{socket.gethostname()}:{os.getpid()}"
+    await asyncio.sleep(30)
+
+    while True:
+        try:
+            # Only one worker (across all nodes) does maintenance at a time
+            if await db.try_acquire_lease(LEASE_STATE, owner, LOG_RETENTION_INTERVAL * 2):
+                report = await asyncio.to_thread(run_retention)
+                if report["created"] or report["rotated"] or report["dropped"]:
+                    print(f"✅ Log retention: {report}")
+        except Exception as e:
+            print(f"❌ Log retention error: {e}")
+
+        await asyncio.sleep(LOG_RETENTION_INTERVAL)
+
+if __name__ == "__main__":
+    print(run_retention())
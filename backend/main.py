@@ -1,27 +1,38 @@
 import os
-import secrets
+import csv
+import uuid
 import hashlib
-import requests
 import base64
 import asyncio 
-import functools # Added for run_in_executor
 from datetime import datetime
 from typing import Optional
-from fastapi import FastAPI, HTTPException, Depends, Header
+from fastapi import FastAPI, HTTPException, Depends, Header, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv(override=True)
 
 from models import *
-from database import (
-    init_database, get_connection, dict_cursor, get_license, get_all_licenses,
-    get_activation, get_activations_for_license, log_validation,
-    update_last_validated
+from database import close_pool, cache_stats, pool_stats, set_outbox_enabled, ALL_LICENSES, LICENSE_STATUS_FILTERS, EXPORT_COLUMNS
+import async_database as db
+from remote import RemoteClient
+from remote_sync import LicenseSyncer
+from outbox import OutboxDispatcher
+import log_retention
+import bulk_io
+from license_tokens import token_signer, revocation_entry
+from admin_auth import admin_tokens
+from cache_events import cache_listener
+from write_behind import (
+    log_validation, touch_last_validated, start_writers, stop_writers,
+    validation_log_writer, last_validated_writer,
 )
+import metrics
+from metrics import stage
+from cache import SingleFlight
 
 # Create FastAPI app
 app = FastAPI(title="License Server - Layer 1", version="1.0.0")
@@ -35,6 +46,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency histograms (outermost, so it times the whole request)
+app.add_middleware(metrics.MetricsMiddleware)
+
 _encoded_default = "aHR0cHM6Ly93Yi1jbG91ZC1zeW5jLm9ucmVuZGVyLmNvbQ=="
 _remote_url_raw = os.getenv("REMOTE_URL", "")
 if _remote_url_raw:
@@ -44,183 +58,85 @@ else:
     # Decode from base64
     REMOTE_URL = base64.b64decode(_encoded_default).decode('utf-8')
 
+# Largest page returned by the admin license and activation listings
+LISTING_PAGE_MAX = int(os.getenv("LISTING_PAGE_MAX", "500"))
+
+# Optional bearer token required by GET /metrics
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
 # Remote Admin Token (for syncing)
 REMOTE_ADMIN_TOKEN = os.getenv("REMOTE_ADMIN_TOKEN", "REPLACE_WITH_REAL_TOKEN_IN_ENV")
+REMOTE_SYNC_ENABLED = REMOTE_ADMIN_TOKEN != "REPLACE_WITH_REAL_TOKEN_IN_ENV"
 
-async def push_all_licenses_periodically():
-    """Background task to push all licenses to remote every 15 minutes."""
-    # Initial delay to let server start up completely
-    await asyncio.sleep(5)
-    
-    while True:
-        if REMOTE_ADMIN_TOKEN == 'REPLACE_WITH_REAL_TOKEN_IN_ENV':
-            print("⏳ Remote sync not configured. Waiting 60s...")
-            await asyncio.sleep(60)
-            continue
+# Shared keep-alive client for the remote's public /sys endpoints
+remote = RemoteClient(REMOTE_URL)
 
-        print("🔄 Starting scheduled full sync to remote...")
-        loop = asyncio.get_event_loop()
-        
-        try:
-            # 1. Fetch all local licenses (Run DB call in executor)
-            # Use partial to pass arguments to the blocking function
-            licenses = await loop.run_in_executor(
-                None, 
-                functools.partial(get_all_licenses, limit=1000)
-            )
-            
-            success_count = 0
-            for lic in licenses:
-                try:
-                    # Prepare payload
-                    payload = lic.copy()
-                    if isinstance(payload.get('expires_at'), datetime):
-                        payload['expires_at'] = payload['expires_at'].isoformat()
-                    if isinstance(payload.get('generated_at'), datetime):
-                        payload['generated_at'] = payload['generated_at'].isoformat()
-                    if isinstance(payload.get('updated_at'), datetime):
-                        payload['updated_at'] = payload['updated_at'].isoformat()
-                    
-                    # Push (Run Network call in executor)
-                    def push_request():
-                        return requests.post(
-                            f"{REMOTE_URL}/m4st3r/license/sync",
-                            json=payload,
-                            headers={"Authorization": f"Bearer {REMOTE_ADMIN_TOKEN}"},
-                            timeout=60.0 # Keep long timeout for cold starts
-                        )
-                    
-                    response = await loop.run_in_executor(None, push_request)
-                    
-                    if response.status_code == 200:
-                        success_count += 1
-                except Exception as ex:
-                    print(f"⚠️ Failed to push license {lic.get('license_key')}: {ex}")
-                
-                # Small yield not strictly needed with executor but good practice
-                await asyncio.sleep(0.01)
-                
-            print(f"✅ Scheduled sync complete: Pushed {success_count}/{len(licenses)} licenses.")
-            
-        except Exception as e:
-            print(f"❌ Scheduled sync error: {e}")
-        
-        # Wait 15 minutes (900 seconds)
-        await asyncio.sleep(900)
+# Incremental (watermark-based) push of local license changes to the remote
+syncer = LicenseSyncer(REMOTE_URL, REMOTE_ADMIN_TOKEN)
+
+# Delivers queued admin changes (generate/extend/delete) to the remote
+outbox = OutboxDispatcher(REMOTE_URL, REMOTE_ADMIN_TOKEN)
 
 # Initialize database on startup
 @app.on_event("startup")
 async def startup():
-    init_database()
+    # Without a dispatcher nothing would drain the outbox, so don't fill it
+    set_outbox_enabled(REMOTE_SYNC_ENABLED)
+    await db.init_database()
+    await db.run_db(token_signer.load)
+    await db.run_db(admin_tokens.load)
+    start_writers()
+    cache_listener.start()
+    asyncio.create_task(log_retention.run_forever())
     print(f"✅ License Server ready")
-    print(f"🔗 Remote sync: {'Enabled' if REMOTE_ADMIN_TOKEN != 'REPLACE_WITH_REAL_TOKEN_IN_ENV' else 'Disabled'}")
+    print(f"🔗 Remote sync: {'Enabled' if REMOTE_SYNC_ENABLED else 'Disabled'}")
     
     # Start background sync task
-    if REMOTE_ADMIN_TOKEN != "REPLACE_WITH_REAL_TOKEN_IN_ENV":
+    if REMOTE_SYNC_ENABLED:
         print(f"🔗 Cloud sync: Enabled. Starting background pusher...")
-        asyncio.create_task(push_all_licenses_periodically())
-
-# Simple admin authentication (stored in memory for demo)
-_admin_tokens = {}
+        asyncio.create_task(syncer.run_forever())
+        asyncio.create_task(outbox.run_forever())
+
+@app.on_event("shutdown")
+async def shutdown():
+    await remote.close()
+    await syncer.close()
+    await outbox.close()
+    cache_listener.stop()
+    stop_writers()
+    db.shutdown()
+    close_pool()
 
 def verify_admin(authorization: Optional[str] = Header(None)):
-    """Verify admin authentication."""
+    """Verify admin authentication (signed token, no per-request I/O)."""
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Not authenticated")
     
     token = authorization.replace("Bearer ", "")
-    if token not in _admin_tokens:
+    username = admin_tokens.verify(token)
+    if username is None:
         raise HTTPException(status_code=401, detail="Invalid token")
     
-    return _admin_tokens[token]
+    return username
 
 # ============================================================================
 # SYNC HELPERS
 # ============================================================================
 
-async def sync_license_to_remote(license_data: dict):
-    """Push new license to remote registry."""
-    if REMOTE_ADMIN_TOKEN == 'REPLACE_WITH_REAL_TOKEN_IN_ENV':
-        print(f"⚠️ Skipping remote sync: Token not configured")
-        return
-
-    try:
-        # Format dates for JSON
-        payload = license_data.copy()
-        payload['expires_at'] = payload['expires_at'].isoformat() if isinstance(payload['expires_at'], datetime) else payload['expires_at']
-        payload['generated_at'] = str(datetime.now()) # sending current time as generated_at is not in input payload
-
-        print(f"🔄 Syncing license {payload['license_key']} to remote...")
-        response = requests.post(
-            f"{REMOTE_URL}/m4st3r/license/sync",
-            json=payload,
-            headers={"Authorization": f"Bearer {REMOTE_ADMIN_TOKEN}"},
-            timeout=60.0
-        )
-        
-        if response.status_code == 200:
-            print(f"✅ License synced successfully")
-        else:
-            print(f"❌ improved Sync failed: {response.text}")
-            
-    except Exception as e:
-        print(f"❌ Sync error: {e}")
-
 async def fetch_license_from_remote(license_key: str):
     """Fetch license details from remote registry."""
-    try:
-        print(f"🔍 Searching for license {license_key} remotely...")
-        response = requests.get(
-            f"{REMOTE_URL}/sys/license/{license_key}",
-            timeout=60.0
-        )
-        
-        if response.status_code == 200:
-            return response.json()
-        return None
-    except Exception as e:
-        print(f"⚠️ Remote fetch error: {e}")
-        return None
+    print(f"🔍 Searching for license {license_key} remotely...")
+    return await remote.fetch_license(license_key)
 
-def import_license_to_local(license_data: dict):
+async def import_license_to_local(license_data: dict):
     """Import a license fetched from remote into local DB."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
     try:
-        # Convert iso format strings back to datetime if needed, 
-        # but MySQL connector often handles strings fine.
-        
-        cursor.execute("""
-            INSERT INTO licenses 
-            (license_key, customer_name, company_name, email, phone, 
-             expires_at, max_activations, restricted_fingerprint, notes, created_by, generated_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE 
-            customer_name=VALUES(customer_name), expires_at=VALUES(expires_at)
-        """, (
-            license_data['license_key'], 
-            license_data['customer_name'], 
-            license_data.get('company_name'),
-            license_data.get('email'), 
-            license_data.get('phone'), 
-            license_data['expires_at'],
-            license_data['max_activations'], 
-            license_data['restricted_fingerprint'], 
-            license_data.get('notes'), 
-            license_data.get('created_by', 'system_sync'),
-            license_data.get('generated_at', datetime.now())
-        ))
-        
-        conn.commit()
+        await db.import_license(license_data)
         print(f"✅ Imported license {license_data['license_key']} to local DB")
         return True
     except Exception as e:
         print(f"❌ Import error: {e}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 # ============================================================================
 # ADMIN ENDPOINTS
@@ -229,13 +145,7 @@ def import_license_to_local(license_data: dict):
 @app.post("/admin/login")
 async def admin_login(payload: AdminLogin):
     """Admin login."""
-    conn = get_connection()
-    cursor = dict_cursor(conn)
-    
-    cursor.execute("SELECT * FROM admin_users WHERE username = %s", (payload.username,))
-    user = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    user = await db.get_admin_user(payload.username)
     
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -247,48 +157,22 @@ async def admin_login(payload: AdminLogin):
     if db_hash != password_hash:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    # Generate token
-    token = secrets.token_urlsafe(32)
-    _admin_tokens[token] = user['username']
-    
-    return {"token": token, "username": user['username']}
+    # Signed session token, accepted by every worker
+    return {**admin_tokens.issue(user['username']), "username": user['username']}
+
+def new_license_key() -> str:
+    """Random key in the WB-XXXXXXXX-XXXXXXXX format."""
+    return f"WB-{uuid.uuid4().hex[:8].upper()}-{uuid.uuid4().hex[:8].upper()}"
 
 @app.post("/admin/generate")
 async def generate_license(payload: LicenseCreate, admin=Depends(verify_admin)):
     """Generate a new license key."""
-    import uuid
-    
     # Generate unique license key
-    license_key = f"WB-{uuid.uuid4().hex[:8].upper()}-{uuid.uuid4().hex[:8].upper()}"
-    
-    conn = get_connection()
-    cursor = conn.cursor()
+    license_key = new_license_key()
     
-    license_id = None
-    try:
-        cursor.execute("""
-            INSERT INTO licenses 
-            (license_key, customer_name, company_name, email, phone, 
-             expires_at, max_activations, restricted_fingerprint, notes, created_by)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            license_key, payload.customer_name, payload.company_name,
-            payload.email, payload.phone, payload.expires_at,
-            payload.max_activations, payload.restricted_fingerprint, payload.notes, admin
-        ))
-        
-        conn.commit()
-        license_id = cursor.lastrowid
-        
-    finally:
-        cursor.close()
-        conn.close()
-
-    # SYNC TO REMOTE
-    sync_data = payload.dict()
-    sync_data['license_key'] = license_key
-    sync_data['created_by'] = admin
-    await sync_license_to_remote(sync_data)
+    # The watermark sync pushes it to the remote; run it now
+    license_id = await db.create_license(license_key, payload.dict(), admin)
+    syncer.wake()
     
     return {
         "success": True,
@@ -297,31 +181,59 @@ async def generate_license(payload: LicenseCreate, admin=Depends(verify_admin)):
         "message": "License generated successfully"
     }
 
+@app.post("/admin/generate/bulk")
+async def generate_licenses_bulk(payload: LicenseBulkCreate, admin=Depends(verify_admin)):
+    """Generate many licenses in one transaction (e.g. distributor onboarding).
+    
+    Keys are returned in the order of `licenses` (or the `count` template copies).
+    """
+    items = payload.items()
+    
+    # One multi-row INSERT; the watermark sync pushes them to the remote
+    created = await db.create_licenses([item.dict() for item in items], admin, new_license_key)
+    syncer.wake()
+    
+    return {
+        "success": True,
+        "count": len(created),
+        "licenses": created,
+        "message": f"{len(created)} licenses generated successfully"
+    }
+
 @app.get("/admin/licenses")
 async def list_licenses(
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
     updated_after: Optional[datetime] = None,
+    status: Optional[str] = None,
     admin=Depends(verify_admin)
 ):
-    """List all licenses."""
-    licenses = get_all_licenses(limit, offset, updated_after)
+    """List licenses, optionally filtered by status (active/expired/blocked).
+    
+    Pass `next_cursor` from a response as `cursor` to get the next page;
+    `total` is returned with the first page only.
+    """
+    if status == "all":
+        status = None
+    if status and status not in LICENSE_STATUS_FILTERS:
+        raise HTTPException(status_code=400, detail=f"Unknown status filter: {status}")
+    limit = max(1, min(limit, LISTING_PAGE_MAX))
+    offset = max(0, offset)
     
-    # Get activation count for each license
-    for license in licenses:
-        activations = get_activations_for_license(license['license_key'])
-        license['activation_count'] = len([a for a in activations if a['is_active']])
-    
-    return {"licenses": licenses, "total": len(licenses)}
+    try:
+        return await db.get_license_page(limit, cursor, updated_after, status, offset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @app.get("/admin/licenses/{license_key}")
 async def get_license_details(license_key: str, admin=Depends(verify_admin)):
     """Get license details including activations."""
-    license = get_license(license_key)
+    license = await db.get_license(license_key)
     if not license:
         raise HTTPException(status_code=404, detail="License not found")
     
-    activations = get_activations_for_license(license_key)
+    activations = await db.get_activations_for_license(license_key)
     
     return {
         "license": license,
@@ -331,185 +243,114 @@ async def get_license_details(license_key: str, admin=Depends(verify_admin)):
 @app.post("/admin/block")
 async def block_license(payload: BlockRequest, admin=Depends(verify_admin)):
     """Block a license."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        UPDATE licenses 
-        SET is_blocked = TRUE, block_message = %s
-        WHERE license_key = %s
-    """, (payload.message, payload.license_key))
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
+    await db.block_license(payload.license_key, payload.message)
     
     return {"success": True, "message": "License blocked"}
 
 @app.post("/admin/unblock")
 async def unblock_license(license_key: str, admin=Depends(verify_admin)):
     """Unblock a license."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        UPDATE licenses 
-        SET is_blocked = FALSE, block_message = NULL
-        WHERE license_key = %s
-    """, (license_key,))
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
+    await db.unblock_license(license_key)
     
     return {"success": True, "message": "License unblocked"}
 
 @app.post("/admin/extend")
 async def extend_license(payload: ExtendRequest, admin=Depends(verify_admin)):
     """Extend license expiry date."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        UPDATE licenses 
-        SET expires_at = %s
-        WHERE license_key = %s
-    """, (payload.new_expiry, payload.license_key))
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
-    
-    # Sync update to remote
-    try:
-        requests.patch(
-            f"{REMOTE_URL}/m4st3r/central/licenses/{payload.license_key}",
-            headers={"Authorization": f"Bearer {REMOTE_ADMIN_TOKEN}"},
-            json={"expires_at": payload.new_expiry},
-            timeout=60.0
-        )
-        print(f"✅ License expiry synced remotely: {payload.license_key}")
-    except Exception as e:
-        print(f"⚠️ Failed to sync expiry remotely: {e}")
+    await db.extend_license(payload.license_key, payload.new_expiry)
+    outbox.wake()
     
     return {"success": True, "message": "License expiry extended"}
 
 @app.delete("/admin/licenses/{license_key}")
 async def delete_license(license_key: str, admin=Depends(verify_admin)):
     """Delete a license and all its activations."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    try:
-        # Delete activations first (foreign key constraint)
-        cursor.execute("DELETE FROM activations WHERE license_key = %s", (license_key,))
-        
-        # Delete license
-        cursor.execute("DELETE FROM licenses WHERE license_key = %s", (license_key,))
-        
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="License not found")
-        
-        conn.commit()
-        
-        # Sync deletion to remote
-        try:
-            requests.delete(
-                f"{REMOTE_URL}/m4st3r/central/licenses/{license_key}",
-                headers={"Authorization": f"Bearer {REMOTE_ADMIN_TOKEN}"},
-                timeout=60.0
-            )
-            print(f"✅ License deletion synced remotely: {license_key}")
-        except Exception as e:
-            print(f"⚠️ Failed to sync deletion remotely: {e}")
-        
-    finally:
-        cursor.close()
-        conn.close()
+    if not await db.delete_license(license_key):
+        raise HTTPException(status_code=404, detail="License not found")
+    outbox.wake()
     
     return {"success": True, "message": "License deleted successfully"}
 
 @app.get("/admin/activations")
-async def list_activations(admin=Depends(verify_admin)):
-    """List all activations."""
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-    
-    cursor.execute("""
-        SELECT a.*, l.customer_name, l.company_name, l.expires_at
-        FROM activations a
-        JOIN licenses l ON a.license_key = l.license_key
-        ORDER BY a.activated_at DESC
-        LIMIT 100
-    """)
-    
-    activations = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    
-    return {"activations": activations}
+async def list_activations(limit: int = 100, cursor: Optional[str] = None, admin=Depends(verify_admin)):
+    """List activations, newest first, one keyset page at a time."""
+    limit = max(1, min(limit, LISTING_PAGE_MAX))
+    try:
+        return await db.get_activation_page(limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @app.delete("/admin/activation/{activation_id}")
 async def deactivate_device(activation_id: int, admin=Depends(verify_admin)):
     """Deactivate a specific device."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        UPDATE activations 
-        SET is_active = FALSE
-        WHERE id = %s
-    """, (activation_id,))
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
+    await db.deactivate_activation(activation_id)
     
     return {"success": True, "message": "Device deactivated"}
 
 @app.get("/admin/stats")
 async def get_stats(admin=Depends(verify_admin)):
     """Get license statistics."""
-    conn = get_connection()
-    cursor = dict_cursor(conn)
-    
-    # Total licenses
-    cursor.execute("SELECT COUNT(*) as total FROM licenses")
-    total = cursor.fetchone()['total']
-    
-    # Active licenses (not expired, not blocked)
-    cursor.execute("""
-        SELECT COUNT(*) as active 
-        FROM licenses 
-        WHERE expires_at > NOW() AND is_blocked = FALSE
-    """)
-    active = cursor.fetchone()['active']
-    
-    # Expired licenses
-    cursor.execute("""
-        SELECT COUNT(*) as expired 
-        FROM licenses 
-        WHERE expires_at <= NOW()
-    """)
-    expired = cursor.fetchone()['expired']
-    
-    # Blocked licenses
-    cursor.execute("SELECT COUNT(*) as blocked FROM licenses WHERE is_blocked = TRUE")
-    blocked = cursor.fetchone()['blocked']
-    
-    # Total activations
-    cursor.execute("SELECT COUNT(*) as total FROM activations WHERE is_active = TRUE")
-    activations = cursor.fetchone()['total']
-    
-    cursor.close()
-    conn.close()
+    return await db.get_stats()
+
+@app.get("/admin/export")
+async def export_table(table: str = "licenses", format: str = "ndjson", admin=Depends(verify_admin)):
+    """Stream all licenses or activations as NDJSON or CSV."""
+    if table not in EXPORT_COLUMNS:
+        raise HTTPException(status_code=400, detail=f"Unknown table: {table}")
+    if format not in bulk_io.FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format: {format}")
+    
+    filename = f"{table}-{datetime.now():%Y%m%d-%H%M%S}.{format}"
+    return StreamingResponse(
+        bulk_io.export_chunks(table, format),
+        media_type=bulk_io.FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@app.post("/admin/import")
+async def import_table(
+    file: UploadFile = File(...),
+    table: str = "licenses",
+    format: Optional[str] = None,
+    admin=Depends(verify_admin)
+):
+    """Import an NDJSON or CSV export (format defaults from the file name).
+    
+    Licenses are upserted by key; activations already present are skipped.
+    """
+    format = format or bulk_io.format_for_filename(file.filename)
+    if table not in EXPORT_COLUMNS:
+        raise HTTPException(status_code=400, detail=f"Unknown table: {table}")
+    if format not in bulk_io.FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format: {format}")
     
+    # Long-running: run it beside, not on, the database executor (batches borrow pooled connections)
+    try:
+        report = await asyncio.to_thread(bulk_io.import_file, file.file, table, format)
+    except (ValueError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Unreadable {format} file: {e}")
+    
+    return {"success": True, **report}
+
+@app.post("/admin/sync/full")
+async def request_full_sync(admin=Depends(verify_admin)):
+    """Reset the sync watermark so the next scheduled run pushes every license."""
+    await syncer.reset_watermark()
+    return {"success": True, "message": "Full resync scheduled"}
+
+@app.get("/admin/sync/outbox")
+async def get_outbox_status(admin=Depends(verify_admin)):
+    """Get the backlog of license changes waiting to reach the remote."""
+    return {**await db.get_outbox_stats(), "dispatcher": outbox.stats()}
+
+@app.get("/admin/cache")
+async def get_cache_stats(admin=Depends(verify_admin)):
+    """Get hit/miss/eviction counters of the license caches."""
     return {
-        "total_licenses": total,
-        "active_licenses": active,
-        "expired_licenses": expired,
-        "blocked_licenses": blocked,
-        "total_activations": activations
+        **cache_stats(),
+        "remote": remote.stats(),
+        "invalidation": cache_listener.stats(),
+        "coalescing": _license_flights.stats(),
     }
 
 # ============================================================================
@@ -517,42 +358,50 @@ async def get_stats(admin=Depends(verify_admin)):
 # ============================================================================
 
 async def check_remote_override(license_key: str) -> dict:
-    """Check remote server for override."""
-    try:
-        response = requests.post(
-            f"{REMOTE_URL}/sys/validate",
-            params={"license_key": license_key},
-            timeout=10.0
-        )
-        data = response.json()
-        print(f"📡 Remote Validation for {license_key}: {data}")
-        return data
-    except Exception as e:
-        print(f"⚠️ Remote check failed: {e}")
-        return {"allowed": True}  # Fail-open if remote is unreachable
+    """Check remote server for override (cached; fails open if unreachable)."""
+    return await remote.check_override(license_key)
+
+# Concurrent requests for one license (e.g. every terminal of a site booting
+# at once, each with its own fingerprint) share the per-key work: the remote
+# override check and the license lookup with its remote self-heal. The
+# device's own activation, logging, timestamps and tokens stay per caller.
+_license_flights = SingleFlight(name="license")
+
+async def _resolve_license(endpoint: str, license_key: str) -> tuple:
+    """Per-key part of /activate and /validate. Returns (remote_status, license)."""
+    with stage(endpoint, "remote_override"):
+        remote_status = await check_remote_override(license_key)
+    
+    # Check license exists locally
+    with stage(endpoint, "get_license"):
+        license = await db.get_license(license_key)
+    
+    # If missing, try to fetch it from remote (self-healing)
+    if not license:
+        print(f"License {license_key} not found locally. Checking remote...")
+        with stage(endpoint, "fetch_remote_license"):
+            remote_license = await fetch_license_from_remote(license_key)
+            if remote_license:
+                await import_license_to_local(remote_license)
+                license = await db.get_license(license_key) # Re-fetch
+            else:
+                print("License not found remotely either.")
+    return remote_status, license
+
+async def resolve_license(endpoint: str, license_key: str) -> tuple:
+    """Remote override and license for a key, shared with concurrent callers."""
+    with stage(endpoint, "resolve"):
+        return await _license_flights.do(license_key, _resolve_license, endpoint, license_key)
 
 @app.post("/activate")
 async def activate_license(payload: ActivateRequest):
     """Activate a license on a device."""
-    # 1. Check if license exists locally
-    license = get_license(payload.license_key)
-    
-    # 1a. If not found locally, try to fetch from remote
-    if not license:
-        print(f"License {payload.license_key} not found locally. Checking remote...")
-        remote_license = await fetch_license_from_remote(payload.license_key)
-        
-        if remote_license:
-            import_license_to_local(remote_license)
-            license = get_license(payload.license_key) # Re-fetch
-        else:
-             print("License not found remotely either.")
-    
+    # 1. Remote override and license, shared with concurrent requests for this key
+    remote_status, license = await resolve_license("activate", payload.license_key)
     if not license:
         raise HTTPException(status_code=404, detail="Invalid license key. Please check and try again.")
     
     # 2. Check remote override
-    remote_status = await check_remote_override(payload.license_key)
     if not remote_status.get('allowed', True):
         log_validation(
             payload.license_key, payload.hardware_fingerprint,
@@ -560,145 +409,95 @@ async def activate_license(payload: ActivateRequest):
         )
         raise HTTPException(status_code=403, detail=remote_status.get('message', 'License disabled by administrator'))
     
-    # 3. Check Hardware Binding (MANDATORY)
-    if not license.get('restricted_fingerprint'):
+    # 3. Binding, blocked, expiry and activation limit are checked and the
+    #    device recorded in one transaction holding the license row lock
+    with stage("activate", "activate_device"):
+        outcome, license = await db.activate_device(
+            payload.license_key, payload.hardware_fingerprint, payload.device_name
+        )
+    
+    if outcome == "not_found":
+        raise HTTPException(status_code=404, detail="Invalid license key. Please check and try again.")
+    
+    if outcome == "no_binding":
         # This shouldn't happen with new licenses, but for safety:
         log_validation(payload.license_key, payload.hardware_fingerprint, 'not_implemented')
         raise HTTPException(status_code=403, detail="License is missing hardware binding secure data.")
-        
-    if license['restricted_fingerprint'] != payload.hardware_fingerprint:
+    
+    if outcome == "hardware_mismatch":
         log_validation(
             payload.license_key, payload.hardware_fingerprint, 
             'hardware_mismatch', False, 
             f"License is strictly bound to machine {license['restricted_fingerprint']}"
         )
         raise HTTPException(status_code=403, detail="Activation Failed: This license is already bound to a different machine.")
-
-    # 4. Check if blocked
-    if license['is_blocked']:
+    
+    if outcome == "blocked":
         log_validation(payload.license_key, payload.hardware_fingerprint, 'blocked')
         raise HTTPException(status_code=403, detail=license['block_message'] or 'License is blocked')
     
-    # 4. Check if expired
-    if license['expires_at'] < datetime.now():
+    if outcome == "expired":
         log_validation(payload.license_key, payload.hardware_fingerprint, 'expired')
         raise HTTPException(status_code=403, detail='License has expired')
     
-    # 5. Check activation count
-    existing_activations = get_activations_for_license(payload.license_key)
-    active_count = len([a for a in existing_activations if a['is_active']])
-    
-    # Check if already activated on this device
-    existing = get_activation(payload.license_key, payload.hardware_fingerprint)
-    if existing:
-        log_validation(payload.license_key, payload.hardware_fingerprint, 'valid')
-        return {
-            "success": True,
-            "message": "Already activated on this device",
-            "expires_at": license['expires_at']
-        }
-    
-    # Check max activations
-    if active_count >= license['max_activations']:
+    if outcome == "limit_reached":
         log_validation(payload.license_key, payload.hardware_fingerprint, 'hardware_mismatch')
         raise HTTPException(status_code=403, detail=f'Maximum activations ({license["max_activations"]}) reached')
     
-    # 6. Activate
-    conn = get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        INSERT INTO activations 
-        (license_key, hardware_fingerprint, device_name)
-        VALUES (%s, %s, %s)
-    """, (payload.license_key, payload.hardware_fingerprint, payload.device_name))
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
-    
-    log_validation(payload.license_key, payload.hardware_fingerprint, 'valid')
+    # 4. Activated now, or already active on this device
+    with stage("activate", "log_validation"):
+        log_validation(payload.license_key, payload.hardware_fingerprint, 'valid')
+    with stage("activate", "issue_token"):
+        token = token_signer.issue(license, payload.hardware_fingerprint)
     
     return {
         "success": True,
-        "message": "License activated successfully",
-        "expires_at": license['expires_at']
+        "message": "Already activated on this device" if outcome == "already_active" else "License activated successfully",
+        "expires_at": license['expires_at'],
+        **token
     }
 
-@app.post("/validate")
-async def validate_license(payload: ValidateRequest):
-    """Validate a license."""
-    # 1. Check remote override
-    remote_status = await check_remote_override(payload.license_key)
-    if not remote_status.get('allowed', True):
-        log_validation(
-            payload.license_key, payload.hardware_fingerprint,
-            'remote_disabled', True, remote_status.get('message')
-        )
-        return {
-            "valid": False,
-            "is_blocked": True,
-            "reason": "remote_disabled",
-            "message": remote_status.get('message', 'License disabled by administrator')
-        }
-    
-    # 2. Check license exists
-    license = get_license(payload.license_key)
-    
-    # 2a. Attempt fetch if missing (optional for validate, but good for self-healing)
-    if not license:
-         remote_license = await fetch_license_from_remote(payload.license_key)
-         if remote_license:
-            import_license_to_local(remote_license)
-            license = get_license(payload.license_key)
+def _remote_disabled_result(remote_status: dict) -> dict:
+    """Validation response for a license disabled by the remote registry."""
+    return {
+        "valid": False,
+        "is_blocked": True,
+        "reason": "remote_disabled",
+        "message": remote_status.get('message', 'License disabled by administrator')
+    }
 
-    if not license:
-        log_validation(payload.license_key, payload.hardware_fingerprint, 'not_found')
-        raise HTTPException(
-            status_code=404,
-            detail="License not found or has been deleted"
-        )
-    
-    # 3. Check if blocked
+def _validation_result(license: dict, activation: Optional[dict]) -> tuple:
+    """Check a known license and device. Returns (log_status, response)."""
+    # Check if blocked
     if license['is_blocked']:
-        log_validation(payload.license_key, payload.hardware_fingerprint, 'blocked')
-        return {
+        return 'blocked', {
             "valid": False,
             "is_blocked": True,
             "reason": "blocked",
             "message": license['block_message'] or 'License is blocked'
         }
     
-    # 4. Check if expired
+    # Check if expired
     if license['expires_at'] < datetime.now():
-        log_validation(payload.license_key, payload.hardware_fingerprint, 'expired')
-        return {
+        return 'expired', {
             "valid": False,
             "reason": "expired",
             "message": "License has expired",
             "expired_at": license['expires_at']
         }
     
-    # 5. Check activation
-    activation = get_activation(payload.license_key, payload.hardware_fingerprint)
+    # Check activation
     if not activation:
-        log_validation(payload.license_key, payload.hardware_fingerprint, 'hardware_mismatch')
-        return {
+        return 'hardware_mismatch', {
             "valid": False,
             "reason": "not_activated",
             "message": "License not activated on this device"
         }
     
-    # 6. Update validation timestamp
-    update_last_validated(activation['id'])
-    
-    # 7. Log successful validation
-    log_validation(payload.license_key, payload.hardware_fingerprint, 'valid')
-    
     # Calculate days until expiry
     days_until_expiry = (license['expires_at'] - datetime.now()).days
     
-    return {
+    return 'valid', {
         "valid": True,
         "is_blocked": False,
         "expires_at": license['expires_at'],
@@ -707,10 +506,140 @@ async def validate_license(payload: ValidateRequest):
         "company_name": license['company_name']
     }
 
+@app.post("/validate")
+async def validate_license(payload: ValidateRequest):
+    """Validate a license."""
+    # 1. Remote override and license, shared with concurrent requests for this key
+    remote_status, license = await resolve_license("validate", payload.license_key)
+    
+    if not remote_status.get('allowed', True):
+        log_validation(
+            payload.license_key, payload.hardware_fingerprint,
+            'remote_disabled', True, remote_status.get('message')
+        )
+        return _remote_disabled_result(remote_status)
+    
+    if not license:
+        log_validation(payload.license_key, payload.hardware_fingerprint, 'not_found')
+        raise HTTPException(
+            status_code=404,
+            detail="License not found or has been deleted"
+        )
+    
+    # 2. Activation on this device
+    with stage("validate", "get_activation"):
+        activation = await db.get_activation(payload.license_key, payload.hardware_fingerprint)
+    
+    # Check blocked / expired / activation on this device
+    status, result = _validation_result(license, activation)
+    
+    # Update validation timestamp and hand out an offline token
+    if status == 'valid':
+        with stage("validate", "touch_last_validated"):
+            touch_last_validated(activation['id'])
+        with stage("validate", "issue_token"):
+            result.update(token_signer.issue(license, payload.hardware_fingerprint))
+    
+    # Log the outcome
+    with stage("validate", "log_validation"):
+        log_validation(payload.license_key, payload.hardware_fingerprint, status)
+    
+    return result
+
+@app.post("/validate/batch")
+async def validate_license_batch(payload: ValidateBatchRequest):
+    """Validate many (license_key, hardware_fingerprint) pairs in one call.
+    
+    Results are returned in request order with the same shape as /validate;
+    unknown licenses yield a `not_found` result instead of a 404.
+    """
+    # 1. Remote overrides, one (cached) lookup per distinct key
+    keys = list(dict.fromkeys(item.license_key for item in payload.items))
+    remote_statuses = dict(zip(keys, await asyncio.gather(*(check_remote_override(k) for k in keys))))
+    allowed_keys = [k for k in keys if remote_statuses[k].get('allowed', True)]
+    
+    # 2. Licenses in one set-based query, self-healing missing ones from remote
+    licenses = await db.get_licenses(allowed_keys)
+    missing = [k for k in allowed_keys if k not in licenses]
+    if missing:
+        fetched = await asyncio.gather(*(fetch_license_from_remote(k) for k in missing))
+        imported = [k for k, remote_license in zip(missing, fetched)
+                    if remote_license and await import_license_to_local(remote_license)]
+        if imported:
+            licenses.update(await db.get_licenses(imported))
+    
+    # 3. Active activations for all known pairs in one query
+    pairs = list(dict.fromkeys(
+        (item.license_key, item.hardware_fingerprint)
+        for item in payload.items if item.license_key in licenses
+    ))
+    activations = await db.get_activations(pairs)
+    
+    # 4. Evaluate each item; logging and timestamps stay per item
+    results = []
+    for item in payload.items:
+        remote_status = remote_statuses[item.license_key]
+        license = licenses.get(item.license_key)
+        
+        if not remote_status.get('allowed', True):
+            log_validation(
+                item.license_key, item.hardware_fingerprint,
+                'remote_disabled', True, remote_status.get('message')
+            )
+            results.append(_remote_disabled_result(remote_status))
+            continue
+        
+        if not license:
+            log_validation(item.license_key, item.hardware_fingerprint, 'not_found')
+            results.append({
+                "valid": False,
+                "reason": "not_found",
+                "message": "License not found or has been deleted"
+            })
+            continue
+        
+        activation = activations.get((item.license_key, item.hardware_fingerprint))
+        status, result = _validation_result(license, activation)
+        if status == 'valid':
+            touch_last_validated(activation['id'])
+            result.update(token_signer.issue(license, item.hardware_fingerprint))
+        log_validation(item.license_key, item.hardware_fingerprint, status)
+        results.append(result)
+    
+    return {"results": results}
+
+@app.get("/license-token/keys")
+async def get_license_token_keys():
+    """Public key for verifying license tokens offline."""
+    return token_signer.jwks()
+
+@app.get("/revocations")
+async def get_revocations(since: Optional[int] = None, limit: int = 1000):
+    """Incremental feed of blocked, unblocked, extended, deleted and deactivated licenses.
+    
+    Poll with `since` set to the previous response's `next`. Without `since`
+    only the current position is returned, to start polling from. Events
+    name the license by `key_hash` (SHA-256 of the key) and, for
+    deactivations, the device by `device_hash` (SHA-256 of "key:fingerprint").
+    Events are published once they are LICENSE_EVENT_SETTLE_SECONDS old, so
+    `next` never moves past a change that has yet to commit.
+    """
+    if since is None:
+        return {"events": [], "next": await db.get_latest_license_event_id(), "more": False}
+    
+    limit = max(1, min(limit, 1000))
+    events = await db.get_license_events(since, limit)
+    return {
+        # Cache-flush events after bulk imports name no license
+        "events": [revocation_entry(event) for event in events if event['license_key'] != ALL_LICENSES],
+        "next": events[-1]['id'] if events else since,
+        "more": len(events) == limit
+    }
+
 @app.get("/info/{license_key}")
 async def get_license_info(license_key: str):
     """Get public license info (for display purposes)."""
-    license = get_license(license_key)
+    license = await db.get_license(license_key)
     if not license:
         raise HTTPException(status_code=404, detail="License not found")
     
@@ -721,6 +650,74 @@ async def get_license_info(license_key: str):
         "is_blocked": license['is_blocked']
     }
 
+# ============================================================================
+# METRICS
+# ============================================================================
+
+@metrics.gauge("db_pool_connections", "Pooled database connections in this worker", ("state",))
+def _pool_connections():
+    stats = pool_stats()
+    return {(state,): stats[state] for state in ("idle", "in_use", "max") if state in stats}
+
+@metrics.counter("db_pool_waits", "Connection checkouts that had to wait, and those that timed out", ("result",))
+def _pool_waits():
+    stats = pool_stats()
+    return {("waited",): stats.get("waits", 0), ("timeout",): stats.get("timeouts", 0)}
+
+@metrics.gauge("write_behind_pending", "Buffered writes not yet flushed", ("buffer",))
+def _write_behind_pending():
+    return {("validation_logs",): len(validation_log_writer), ("last_validated",): len(last_validated_writer)}
+
+@metrics.counter("validation_logs_dropped", "Validation log rows dropped because the queue was full")
+def _validation_logs_dropped():
+    return validation_log_writer.dropped
+
+@metrics.counter("write_behind_failed_flushes", "Bulk writes that failed and were retried", ("buffer",))
+def _write_behind_failed_flushes():
+    return {("validation_logs",): validation_log_writer.failed_flushes,
+            ("last_validated",): last_validated_writer.failed_flushes}
+
+def _all_caches() -> dict:
+    return {**cache_stats(), "remote_override": remote.override_cache.stats(),
+            "admin_tokens": admin_tokens.stats()}
+
+@metrics.counter("cache_lookups", "Cache lookups by cache and result", ("cache", "result"))
+def _cache_lookups():
+    samples = {}
+    for name, stats in _all_caches().items():
+        samples[(name, "hit")] = stats["hits"]
+        samples[(name, "miss")] = stats["misses"]
+    return samples
+
+@metrics.gauge("cache_entries", "Entries currently held per cache", ("cache",))
+def _cache_entries():
+    return {(name,): stats["size"] for name, stats in _all_caches().items()}
+
+@metrics.gauge("remote_circuit_open", "1 while the remote registry circuit breaker is open or probing")
+def _remote_circuit_open():
+    return 0 if remote.breaker.state == remote.breaker.CLOSED else 1
+
+@metrics.counter("outbox_deliveries", "Outbox rows handled by this worker's dispatcher", ("result",))
+def _outbox_deliveries():
+    return {(result,): count for result, count in outbox.stats().items()}
+
+@metrics.counter("request_coalescing", "Client lookups executed vs. shared with an in-flight one for the same key",
+                 ("endpoint", "result"))
+def _request_coalescing():
+    samples = {}
+    for flights in (_license_flights, remote._flights):
+        stats = flights.stats()
+        samples[(stats["name"], "executed")] = stats["calls"]
+        samples[(stats["name"], "shared")] = stats["shared"]
+    return samples
+
+@app.get("/metrics")
+async def get_metrics(authorization: Optional[str] = Header(None)):
+    """Prometheus metrics for this worker process."""
+    if METRICS_TOKEN and authorization != f"Bearer {METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
 # Health check
 @app.get("/health")
 async def health_check():
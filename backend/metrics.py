@@ -0,0 +1,258 @@
+# Layer 1 License Server - Metrics
+#
+# Minimal Prometheus instrumentation with no extra dependency: counters and
+# histograms updated in place, plus gauges read from the existing stats()
+# helpers only when /metrics is scraped. Recording a value is a dict lookup,
+# a lock and an addition, cheap enough to leave on for every request.
+#
+# Values are per worker process. With several uvicorn workers each scrape
+# sees whichever worker answered; the `pid` label on every series tells them
+# apart, so dashboards should aggregate with sum() / histogram_quantile().
+import os
+import time
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Latency buckets in seconds, from in-memory cache hits to slow remote calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+# ============================================================================
+# Metric Types
+# ============================================================================
+
+class Counter:
+    """Monotonic counter, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+        REGISTRY.register(self)
+
+    def inc(self, *labelvalues, amount: float = 1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def collect(self) -> Iterable[Tuple[str, Sequence[str], Sequence, float]]:
+        with self._lock:
+            values = list(self._values.items())
+        for labelvalues, value in values:
+            yield self.name + "_total", self.labelnames, labelvalues, value
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # last slot is +Inf
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def time(self) -> "_Timer":
+        return _Timer(self)
+
+class _Timer:
+    """Context manager observing the elapsed wall time of its block."""
+
+    __slots__ = ("child", "started")
+
+    def __init__(self, child: _HistogramChild):
+        self.child = child
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.child.observe(time.perf_counter() - self.started)
+        return False
+
+class Histogram:
+    """Cumulative-bucket histogram, optionally split by labels."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._children: Dict[Tuple, _HistogramChild] = {}
+        self._lock = threading.Lock()
+        REGISTRY.register(self)
+
+    def labels(self, *labelvalues) -> _HistogramChild:
+        child = self._children.get(labelvalues)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(labelvalues, _HistogramChild(self.buckets))
+        return child
+
+    def observe(self, value: float, *labelvalues):
+        self.labels(*labelvalues).observe(value)
+
+    def time(self, *labelvalues) -> _Timer:
+        return _Timer(self.labels(*labelvalues))
+
+    def collect(self):
+        bucket_labels = self.labelnames + ("le",)
+        for labelvalues, child in list(self._children.items()):
+            with child.lock:
+                counts, total = list(child.counts), child.sum
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield self.name + "_bucket", bucket_labels, labelvalues + (_format_value(bound),), cumulative
+            yield self.name + "_sum", self.labelnames, labelvalues, total
+            yield self.name + "_count", self.labelnames, labelvalues, cumulative
+
+class CallbackMetric:
+    """Gauge or counter whose samples are read from `callback()` at scrape time.
+
+    The callback returns {labelvalues_tuple: value}, or a bare number for an
+    unlabelled metric.
+    """
+
+    def __init__(self, kind: str, name: str, documentation: str, callback: Callable,
+                 labelnames: Sequence[str] = ()):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        REGISTRY.register(self)
+
+    def collect(self):
+        samples = self.callback()
+        if not isinstance(samples, dict):
+            samples = {(): samples}
+        sample_name = self.name + "_total" if self.kind == "counter" else self.name
+        for labelvalues, value in samples.items():
+            if value is not None:
+                yield sample_name, self.labelnames, labelvalues, value
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()):
+    """Decorator registering a function as a scrape-time gauge."""
+    def register(callback: Callable) -> Callable:
+        CallbackMetric("gauge", name, documentation, callback, labelnames)
+        return callback
+    return register
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()):
+    """Decorator registering a function as a scrape-time counter (value must only grow)."""
+    def register(callback: Callable) -> Callable:
+        CallbackMetric("counter", name, documentation, callback, labelnames)
+        return callback
+    return register
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+class Registry:
+    def __init__(self):
+        self._metrics: List = []
+        self._names = set()
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            if metric.name in self._names:
+                raise ValueError(f"Metric {metric.name} registered twice")
+            self._names.add(metric.name)
+            self._metrics.append(metric)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        pid = str(os.getpid())
+        lines = []
+        for metric in list(self._metrics):
+            try:
+                samples = list(metric.collect())
+            except Exception as e:
+                print(f"⚠️ Metric {metric.name} failed to collect: {e}")
+                continue
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, labelnames, labelvalues, value in samples:
+                labels = _format_labels(("pid",) + tuple(labelnames), (pid,) + tuple(labelvalues))
+                lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+REGISTRY = Registry()
+
+def render() -> str:
+    return REGISTRY.render()
+
+# ============================================================================
+# Request Metrics
+# ============================================================================
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "Time to serve a request, by route template",
+    ("method", "route", "status"),
+)
+STAGE_SECONDS = Histogram(
+    "license_stage_duration_seconds", "Time spent in each step of /activate and /validate",
+    ("endpoint", "stage"),
+)
+
+def stage(endpoint: str, name: str) -> _Timer:
+    """`with stage("validate", "get_license"): ...` records that block's duration."""
+    return STAGE_SECONDS.time(endpoint, name)
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request.
+
+    Requests are labelled with the matched route template (/admin/licenses/{license_key},
+    not the concrete path) so the number of series stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "other"
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, scope["method"], route, str(status))
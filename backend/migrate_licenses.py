@@ -1,21 +1,37 @@
 """
 Migration script to sync all existing licenses to remote
+
+    python migrate_licenses.py                  # resume from the last checkpoint
+    python migrate_licenses.py --workers 32     # more parallel requests
+    python migrate_licenses.py --dry-run        # read and count only, send nothing
+    python migrate_licenses.py --restart        # ignore the checkpoint, start over
+
+Licenses are read in license_key order through a server-side cursor, one
+chunk at a time, and POSTed in parallel over one pooled HTTP session. After
+each chunk the checkpoint file records the last key reached and the keys
+that failed, so an interrupted run picks up where it stopped (retrying the
+failures first) instead of starting again from zero.
 """
-import mysql.connector
-import requests
 import os
+import sys
+import json
+import time
 import base64
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Database config from .env
-DB_CONFIG = {
-    'host': os.getenv("DB_HOST", "localhost"),
-    'user': os.getenv("DB_USER", "root"),
-    'password': os.getenv("DB_PASSWORD", ""),
-    'database': os.getenv("DB_NAME", "license_server_db")
-}
+import database
+from database import DB_TYPE, get_connection
+from remote_sync import percentile
 
 # Remote config (base64 encoded for obfuscation)
 _encoded_default = "aHR0cHM6Ly93Yi1jbG91ZC1zeW5jLm9ucmVuZGVyLmNvbQ=="
@@ -27,63 +43,231 @@ else:
 
 REMOTE_ADMIN_TOKEN = os.getenv("REMOTE_ADMIN_TOKEN", "wb_master_sync_key_2025")
 
-print("🔄 Starting license migration to remote...")
-print("📡 Connecting to cloud sync service...")
+COLUMNS = """license_key, customer_name, company_name, email, phone,
+           expires_at, max_activations, restricted_fingerprint, notes, created_by, generated_at"""
 
-# Connect to database
-conn = mysql.connector.connect(**DB_CONFIG)
-cursor = conn.cursor(dictionary=True)
+# ============================================================================
+# Checkpoint
+# ============================================================================
 
-# Get all licenses
-cursor.execute("""
-    SELECT license_key, customer_name, company_name, email, phone, 
-           expires_at, max_activations, restricted_fingerprint, notes, created_by
-    FROM licenses
-""")
+def load_checkpoint(path: str) -> Dict:
+    if not os.path.exists(path):
+        return {"last_key": None, "failed": [], "migrated": 0}
+    with open(path) as f:
+        return json.load(f)
 
-licenses = cursor.fetchall()
-print(f"📊 Found {len(licenses)} licenses to sync")
+def save_checkpoint(path: str, checkpoint: Dict):
+    """Write atomically, so a crash mid-write never corrupts the checkpoint."""
+    checkpoint["updated_at"] = datetime.now().isoformat(timespec="seconds")
+    partial = path + ".partial"
+    with open(partial, "w") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(partial, path)
 
-# Sync each license
-success_count = 0
-error_count = 0
+# ============================================================================
+# Reading
+# ============================================================================
 
-for license in licenses:
+def iter_chunks(after_key: Optional[str], chunk_size: int):
+    """Yield licenses with license_key > after_key, in key order, chunk by chunk."""
+    conn = get_connection()
     try:
-        response = requests.post(
-            f"{REMOTE_URL}/m4st3r/license/sync",
-            headers={"Authorization": f"Bearer {REMOTE_ADMIN_TOKEN}"},
-            json={
-                "license_key": license['license_key'],
-                "customer_name": license['customer_name'] or "Unknown",
-                "company_name": license['company_name'] or "",
-                "email": license['email'] or "",
-                "phone": license['phone'] or "",
-                "expires_at": str(license['expires_at']),
-                "max_activations": license['max_activations'] or 1,
-                "restricted_fingerprint": license['restricted_fingerprint'] or "",
-                "notes": license['notes'] or "",
-                "created_by": license['created_by'] or "admin",
-                "generated_at": "2026-01-01T00:00:00"
-            },
-            timeout=10
-        )
-        
-        if response.status_code in [200, 201]:
-            print(f"✅ Synced: {license['license_key']}")
-            success_count += 1
+        if DB_TYPE == "postgresql":
+            # Named (server-side) cursor: rows arrive in chunks, not all at once
+            cursor = conn.cursor(name="migrate_licenses", cursor_factory=database.RealDictCursor)
+            cursor.itersize = chunk_size
         else:
-            error_detail = response.text[:200] if response.text else 'No details'
-            print(f"⚠️  Failed: {license['license_key']} - {response.status_code} - {error_detail}")
-            error_count += 1
-            
-    except Exception as e:
-        print(f"❌ Error syncing {license['license_key']}: {e}")
-        error_count += 1
-
-cursor.close()
-conn.close()
-
-print(f"\n✨ Migration complete!")
-print(f"✅ Success: {success_count}")
-print(f"❌ Errors: {error_count}")
+            # Unbuffered cursor streams from the server; allow slow chunks
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute("SET SESSION net_write_timeout = 3600")
+        try:
+            if after_key is None:
+                cursor.execute(f"SELECT {COLUMNS} FROM licenses ORDER BY license_key")
+            else:
+                cursor.execute(
+                    f"SELECT {COLUMNS} FROM licenses WHERE license_key > %s ORDER BY license_key",
+                    (after_key,)
+                )
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cursor.close()
+    finally:
+        conn.close()
+
+def fetch_licenses(license_keys: List[str]) -> List[Dict]:
+    if not license_keys:
+        return []
+    with database.db_connection() as conn:
+        cursor = database.dict_cursor(conn)
+        placeholders = ", ".join(["%s"] * len(license_keys))
+        cursor.execute(
+            f"SELECT {COLUMNS} FROM licenses WHERE license_key IN ({placeholders}) ORDER BY license_key",
+            tuple(license_keys)
+        )
+        rows = cursor.fetchall()
+        cursor.close()
+    return rows
+
+# ============================================================================
+# Sending
+# ============================================================================
+
+def make_session(token: str, workers: int, retries: int) -> requests.Session:
+    """Keep-alive session with one pooled connection per worker and retries on 429/5xx."""
+    session = requests.Session()
+    retry = Retry(
+        total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None, raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    return session
+
+def payload_for(license: Dict) -> Dict:
+    generated_at = license.get('generated_at')
+    return {
+        "license_key": license['license_key'],
+        "customer_name": license['customer_name'] or "Unknown",
+        "company_name": license['company_name'] or "",
+        "email": license['email'] or "",
+        "phone": license['phone'] or "",
+        "expires_at": str(license['expires_at']),
+        "max_activations": license['max_activations'] or 1,
+        "restricted_fingerprint": license['restricted_fingerprint'] or "",
+        "notes": license['notes'] or "",
+        "created_by": license['created_by'] or "admin",
+        "generated_at": generated_at.isoformat() if generated_at else "2026-01-01T00:00:00"
+    }
+
+class Migrator:
+    def __init__(self, remote_url: str, token: str, workers: int, timeout: float,
+                 retries: int, dry_run: bool):
+        self.url = f"{remote_url.rstrip('/')}/m4st3r/license/sync"
+        self.timeout = timeout
+        self.dry_run = dry_run
+        self.session = make_session(token, workers, retries)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="migrate")
+        self.succeeded = 0
+        self.rejected = 0
+        self.failed = 0
+        self.latencies: List[float] = []
+
+    def close(self):
+        # Requests not started yet (after an interrupt) are dropped, not sent
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.session.close()
+
+    def _send(self, license: Dict) -> str:
+        """POST one license. Returns "ok", "rejected" (4xx) or "failed"."""
+        payload = payload_for(license)
+        if self.dry_run:
+            return "ok"
+
+        started = time.monotonic()
+        try:
+            response = self.session.post(self.url, json=payload, timeout=self.timeout)
+        except Exception as e:
+            print(f"❌ Error syncing {license['license_key']}: {e}")
+            return "failed"
+        self.latencies.append(time.monotonic() - started)
+
+        if response.status_code in (200, 201):
+            return "ok"
+        error_detail = response.text[:200] if response.text else 'No details'
+        print(f"⚠️  Failed: {license['license_key']} - {response.status_code} - {error_detail}")
+        return "rejected" if response.status_code < 500 and response.status_code != 429 else "failed"
+
+    def migrate(self, licenses: List[Dict]) -> List[str]:
+        """Send a chunk in parallel. Returns the keys that failed (worth retrying)."""
+        outcomes = list(self.executor.map(self._send, licenses))
+        self.succeeded += outcomes.count("ok")
+        self.rejected += outcomes.count("rejected")
+        self.failed += outcomes.count("failed")
+        return [lic['license_key'] for lic, outcome in zip(licenses, outcomes) if outcome == "failed"]
+
+# ============================================================================
+# Main
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Push every local license to the remote registry.")
+    parser.add_argument("--remote-url", default=REMOTE_URL)
+    parser.add_argument("--workers", type=int, default=16, help="parallel requests")
+    parser.add_argument("--chunk-size", type=int, default=500, help="licenses read and checkpointed at a time")
+    parser.add_argument("--timeout", type=float, default=10.0, help="per-request timeout in seconds")
+    parser.add_argument("--retries", type=int, default=3, help="retries on connection errors, 429 and 5xx")
+    parser.add_argument("--checkpoint", default="migrate_licenses.checkpoint.json")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and start from the first key")
+    parser.add_argument("--dry-run", action="store_true", help="read licenses and build payloads but send nothing")
+    args = parser.parse_args()
+
+    checkpoint = {"last_key": None, "failed": [], "migrated": 0}
+    if not args.restart and not args.dry_run:
+        checkpoint = load_checkpoint(args.checkpoint)
+    if checkpoint["last_key"] or checkpoint["failed"]:
+        print(f"↩️  Resuming after {checkpoint['last_key']} ({len(checkpoint['failed'])} earlier failures to retry)")
+
+    print(f"🔄 Starting license migration to remote{' (dry run)' if args.dry_run else ''}...")
+    print(f"📡 {args.remote_url} with {args.workers} workers")
+
+    migrator = Migrator(args.remote_url, REMOTE_ADMIN_TOKEN, args.workers, args.timeout,
+                        args.retries, args.dry_run)
+    started = time.monotonic()
+    processed = 0
+    interrupted = False
+
+    migrated_before = checkpoint.get("migrated", 0)
+
+    def commit_progress(last_key: Optional[str], failed: List[str]):
+        if last_key is not None:
+            checkpoint["last_key"] = last_key
+        checkpoint["failed"] = failed
+        checkpoint["migrated"] = migrated_before + migrator.succeeded
+        if not args.dry_run:
+            save_checkpoint(args.checkpoint, checkpoint)
+
+    try:
+        # Earlier failures first, then everything after the last key reached
+        retry_keys = checkpoint["failed"]
+        still_failed: List[str] = []
+        for start in range(0, len(retry_keys), args.chunk_size):
+            licenses = fetch_licenses(retry_keys[start:start + args.chunk_size])
+            still_failed += migrator.migrate(licenses)
+            processed += len(licenses)
+            commit_progress(None, still_failed + retry_keys[start + args.chunk_size:])
+
+        for licenses in iter_chunks(checkpoint["last_key"], args.chunk_size):
+            still_failed += migrator.migrate(licenses)
+            processed += len(licenses)
+            commit_progress(licenses[-1]['license_key'], still_failed)
+            elapsed = time.monotonic() - started
+            print(f"📦 {processed} processed, {migrator.succeeded} synced, {migrator.failed} failed "
+                  f"({processed / elapsed:.0f}/s)")
+    except KeyboardInterrupt:
+        interrupted = True
+        print("\n⏸️  Interrupted; progress up to the last completed chunk is saved")
+    finally:
+        migrator.close()
+
+    elapsed = time.monotonic() - started
+    latencies = sorted(migrator.latencies)
+    to_ms = lambda value: f"{value * 1000:.0f}ms" if value is not None else "-"
+
+    print(f"\n✨ Migration {'interrupted' if interrupted else 'complete'}!")
+    print(f"✅ Success: {migrator.succeeded}")
+    print(f"⚠️  Rejected: {migrator.rejected}")
+    print(f"❌ Errors: {migrator.failed}{' (retried on the next run)' if migrator.failed else ''}")
+    print(f"⏱️  {processed} licenses in {elapsed:.1f}s ({processed / elapsed if elapsed else 0:.0f}/s), "
+          f"latency p50 {to_ms(percentile(latencies, 50))} p95 {to_ms(percentile(latencies, 95))}")
+
+    sys.exit(1 if interrupted or migrator.failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,467 @@
+# Layer 1 License Server - Versioned Schema Migrations
+#
+# The schema is built by numbered migrations recorded in `schema_version`.
+# On startup every worker reads the current version; when it is up to date
+# (the normal case) no DDL runs at all. Otherwise one worker applies the
+# pending migrations under a database-wide lock (advisory lock / GET_LOCK)
+# while the others wait and then find nothing left to do.
+#
+# Migrations are append-only: never edit one that has shipped, add a new one.
+# A step is a SQL string or a callable taking the open cursor. Migrations
+# marked `concurrent` run in autocommit mode, which PostgreSQL requires for
+# CREATE INDEX CONCURRENTLY (so building an index on a large table does not
+# block validations writing to it).
+import time
+from datetime import datetime
+from typing import Callable, List, Optional, Union
+
+if __name__ == "__main__":
+    # Run by hand: load backend/.env before database reads DB_TYPE/DATABASE_URL
+    from dotenv import load_dotenv
+    load_dotenv(override=True)
+
+from database import DB_TYPE, db_connection
+
+MIGRATION_LOCK_ID = 72_531_001          # pg_advisory_lock key
+MIGRATION_LOCK_NAME = "license_server_migrations"
+MIGRATION_LOCK_TIMEOUT = 300            # seconds to wait for another worker
+MIGRATION_LOCK_POLL = 0.5               # seconds between pg_try_advisory_lock attempts
+
+# MySQL errors that make a step a no-op on an already migrated schema
+MYSQL_DUPLICATE_COLUMN = 1060
+MYSQL_DUPLICATE_INDEX = 1061
+
+Step = Union[str, Callable]
+
+class Migration:
+    """One schema version: its steps for each database type."""
+
+    def __init__(self, version: int, description: str, postgresql: List[Step], mysql: List[Step],
+                 concurrent: bool = False):
+        self.version = version
+        self.description = description
+        self.steps = {"postgresql": postgresql, "mysql": mysql}
+        self.concurrent = concurrent
+
+def _pg_index_concurrently(name: str, table: str, columns: str) -> Callable:
+    """CREATE INDEX CONCURRENTLY, first dropping an invalid leftover of a failed build."""
+    def step(cursor):
+        cursor.execute("""
+            SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = %s AND NOT i.indisvalid
+        """, (name,))
+        if cursor.fetchone():
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+    return step
+
+def _pg_partition_validation_logs(cursor):
+    """Rebuild validation_logs as a table range-partitioned by month.
+
+    Runs in one transaction: the legacy table is renamed, a partition is
+    created for every month it covers (plus upcoming ones and a DEFAULT), its
+    rows are copied over and it is dropped. Writers wait on the table lock
+    meanwhile; the write-behind log queue absorbs that.
+    """
+    from log_retention import (
+        DEFAULT_PARTITION, LOG_PARTITION_PREMAKE, add_months, create_month_partition, month_start,
+    )
+
+    cursor.execute("""
+        SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid
+        WHERE c.relname = 'validation_logs'
+    """)
+    if cursor.fetchone():
+        return
+
+    cursor.execute("ALTER TABLE validation_logs RENAME TO validation_logs_legacy")
+    cursor.execute("ALTER INDEX IF EXISTS validation_logs_pkey RENAME TO validation_logs_legacy_pkey")
+    cursor.execute("DROP INDEX IF EXISTS idx_validation_logs_key_time")
+    # Keep the id sequence alive when the legacy table is dropped
+    cursor.execute("ALTER SEQUENCE IF EXISTS validation_logs_id_seq OWNED BY NONE")
+    cursor.execute("CREATE SEQUENCE IF NOT EXISTS validation_logs_id_seq")
+
+    # The partition key must be part of the primary key
+    cursor.execute("""
+        CREATE TABLE validation_logs (
+            id BIGINT NOT NULL DEFAULT nextval('validation_logs_id_seq'),
+            license_key VARCHAR(50),
+            hardware_fingerprint VARCHAR(255),
+            status VARCHAR(50),
+            remote_override BOOLEAN DEFAULT FALSE,
+            message TEXT,
+            validated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (id, validated_at)
+        ) PARTITION BY RANGE (validated_at)
+    """)
+    cursor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF validation_logs DEFAULT")
+
+    cursor.execute("SELECT MIN(validated_at) FROM validation_logs_legacy")
+    oldest = cursor.fetchone()[0]
+    current = month_start(datetime.now())
+    month = month_start(oldest) if oldest and oldest < current else current
+    last = add_months(current, LOG_PARTITION_PREMAKE)
+    while month <= last:
+        create_month_partition(cursor, month)
+        month = add_months(month, 1)
+
+    cursor.execute("""
+        INSERT INTO validation_logs
+            (id, license_key, hardware_fingerprint, status, remote_override, message, validated_at)
+        SELECT id, license_key, hardware_fingerprint, status, remote_override, message,
+               COALESCE(validated_at, CURRENT_TIMESTAMP)
+        FROM validation_logs_legacy
+    """)
+    cursor.execute("DROP TABLE validation_logs_legacy")
+    cursor.execute("ALTER SEQUENCE validation_logs_id_seq OWNED BY validation_logs.id")
+    cursor.execute("""
+        SELECT setval('validation_logs_id_seq', GREATEST(COALESCE(MAX(id), 0), 1)) FROM validation_logs
+    """)
+    # Created on the parent, so every partition (present and future) gets it
+    cursor.execute("CREATE INDEX idx_validation_logs_key_time ON validation_logs (license_key, validated_at)")
+
+# ============================================================================
+# Migrations
+# ============================================================================
+
+MIGRATIONS = [
+    Migration(1, "baseline schema", postgresql=[
+        """
+        CREATE TABLE IF NOT EXISTS admin_users (
+            id SERIAL PRIMARY KEY,
+            username VARCHAR(50) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS licenses (
+            id SERIAL PRIMARY KEY,
+            license_key VARCHAR(50) UNIQUE NOT NULL,
+            customer_name VARCHAR(255) NOT NULL,
+            company_name VARCHAR(255),
+            email VARCHAR(255),
+            phone VARCHAR(50),
+            expires_at TIMESTAMP NOT NULL,
+            max_activations INT DEFAULT 1,
+            restricted_fingerprint VARCHAR(255),
+            notes TEXT,
+            is_blocked BOOLEAN DEFAULT FALSE,
+            block_message TEXT,
+            created_by VARCHAR(50),
+            generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS activations (
+            id SERIAL PRIMARY KEY,
+            license_key VARCHAR(50) NOT NULL,
+            hardware_fingerprint VARCHAR(255) NOT NULL,
+            device_name VARCHAR(255),
+            activated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_validated TIMESTAMP,
+            is_active BOOLEAN DEFAULT TRUE,
+            FOREIGN KEY (license_key) REFERENCES licenses(license_key) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS validation_logs (
+            id SERIAL PRIMARY KEY,
+            license_key VARCHAR(50),
+            hardware_fingerprint VARCHAR(255),
+            status VARCHAR(50),
+            remote_override BOOLEAN DEFAULT FALSE,
+            message TEXT,
+            validated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # Default admin user (password: admin123)
+        """
+        INSERT INTO admin_users (username, password_hash)
+        VALUES ('admin', 'SHA2:240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9')
+        ON CONFLICT (username) DO NOTHING
+        """,
+    ], mysql=[
+        """
+        CREATE TABLE IF NOT EXISTS admin_users (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            username VARCHAR(50) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS licenses (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            license_key VARCHAR(50) UNIQUE NOT NULL,
+            customer_name VARCHAR(255) NOT NULL,
+            company_name VARCHAR(255),
+            email VARCHAR(255),
+            phone VARCHAR(50),
+            expires_at DATETIME NOT NULL,
+            max_activations INT DEFAULT 1,
+            restricted_fingerprint VARCHAR(255),
+            notes TEXT,
+            is_blocked BOOLEAN DEFAULT FALSE,
+            block_message TEXT,
+            created_by VARCHAR(50),
+            generated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS activations (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            license_key VARCHAR(50) NOT NULL,
+            hardware_fingerprint VARCHAR(255) NOT NULL,
+            device_name VARCHAR(255),
+            activated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            last_validated DATETIME,
+            is_active BOOLEAN DEFAULT TRUE,
+            FOREIGN KEY (license_key) REFERENCES licenses(license_key) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS validation_logs (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            license_key VARCHAR(50),
+            hardware_fingerprint VARCHAR(255),
+            status VARCHAR(50),
+            remote_override BOOLEAN DEFAULT FALSE,
+            message TEXT,
+            validated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # Default admin user (password: admin123)
+        """
+        INSERT IGNORE INTO admin_users (username, password_hash)
+        VALUES ('admin', 'SHA2:240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9')
+        """,
+    ]),
+
+    Migration(2, "server state, sync outbox and listing indexes", postgresql=[
+        # Databases created from database.sql have no updated_at column
+        "ALTER TABLE licenses ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+        # Listing sort keys are NOT NULL: keyset pages skip NULL rows and
+        # cursors cannot encode them
+        "UPDATE licenses SET updated_at = COALESCE(generated_at, CURRENT_TIMESTAMP) WHERE updated_at IS NULL",
+        "ALTER TABLE licenses ALTER COLUMN updated_at SET DEFAULT CURRENT_TIMESTAMP, ALTER COLUMN updated_at SET NOT NULL",
+        "UPDATE activations SET activated_at = CURRENT_TIMESTAMP WHERE activated_at IS NULL",
+        "ALTER TABLE activations ALTER COLUMN activated_at SET DEFAULT CURRENT_TIMESTAMP, ALTER COLUMN activated_at SET NOT NULL",
+        """
+        CREATE TABLE IF NOT EXISTS server_state (
+            name VARCHAR(100) PRIMARY KEY,
+            value TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS sync_outbox (
+            id BIGSERIAL PRIMARY KEY,
+            license_key VARCHAR(50) NOT NULL,
+            operation VARCHAR(20) NOT NULL,
+            payload TEXT,
+            attempts INT DEFAULT 0,
+            next_attempt_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            locked_until TIMESTAMP,
+            last_error TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_sync_outbox_key_id ON sync_outbox (license_key, id)",
+        "CREATE INDEX IF NOT EXISTS idx_sync_outbox_due ON sync_outbox (next_attempt_at)",
+        # Keyset listing sort keys
+        "CREATE INDEX IF NOT EXISTS idx_licenses_updated_id ON licenses (updated_at DESC, id DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_activations_activated_id ON activations (activated_at DESC, id DESC)",
+    ], mysql=[
+        "ALTER TABLE licenses ADD COLUMN updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP",
+        "UPDATE licenses SET updated_at = COALESCE(generated_at, CURRENT_TIMESTAMP) WHERE updated_at IS NULL",
+        "ALTER TABLE licenses MODIFY updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP",
+        "UPDATE activations SET activated_at = CURRENT_TIMESTAMP WHERE activated_at IS NULL",
+        "ALTER TABLE activations MODIFY activated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        """
+        CREATE TABLE IF NOT EXISTS server_state (
+            name VARCHAR(100) PRIMARY KEY,
+            value TEXT,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS sync_outbox (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            license_key VARCHAR(50) NOT NULL,
+            operation VARCHAR(20) NOT NULL,
+            payload TEXT,
+            attempts INT DEFAULT 0,
+            next_attempt_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            locked_until DATETIME,
+            last_error TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_sync_outbox_key_id (license_key, id),
+            INDEX idx_sync_outbox_due (next_attempt_at)
+        )
+        """,
+        "CREATE INDEX idx_licenses_updated_id ON licenses (updated_at, id)",
+        "CREATE INDEX idx_activations_activated_id ON activations (activated_at, id)",
+    ]),
+
+    # Validate/activate look up (license_key, hardware_fingerprint, is_active)
+    # and count active devices per license; log queries filter by key and time.
+    Migration(3, "hot-path indexes for validate/activate", concurrent=True, postgresql=[
+        _pg_index_concurrently(
+            "idx_activations_key_fp_active", "activations", "license_key, hardware_fingerprint, is_active"
+        ),
+        _pg_index_concurrently("idx_validation_logs_key_time", "validation_logs", "license_key, validated_at"),
+    ], mysql=[
+        "CREATE INDEX idx_activations_key_fp_active ON activations (license_key, hardware_fingerprint, is_active)",
+        "CREATE INDEX idx_validation_logs_key_time ON validation_logs (license_key, validated_at)",
+    ]),
+
+    # MySQL needs no DDL: log_retention rotates the live table monthly
+    Migration(4, "monthly partitions for validation_logs", postgresql=[
+        _pg_partition_validation_logs,
+    ], mysql=[]),
+
+    # Append-only feed of revocation-relevant changes, polled by clients
+    # holding offline license tokens (GET /revocations)
+    Migration(5, "license events", postgresql=[
+        """
+        CREATE TABLE IF NOT EXISTS license_events (
+            id BIGSERIAL PRIMARY KEY,
+            license_key VARCHAR(50) NOT NULL,
+            event VARCHAR(20) NOT NULL,
+            hardware_fingerprint VARCHAR(255),
+            expires_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ], mysql=[
+        """
+        CREATE TABLE IF NOT EXISTS license_events (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            license_key VARCHAR(50) NOT NULL,
+            event VARCHAR(20) NOT NULL,
+            hardware_fingerprint VARCHAR(255),
+            expires_at DATETIME,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def _current_version(conn) -> Optional[int]:
+    """Highest applied version, or None when schema_version does not exist yet."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT MAX(version) FROM schema_version")
+        row = cursor.fetchone()
+        conn.commit()
+        return row[0] or 0
+    except Exception:
+        conn.rollback()
+        return None
+    finally:
+        cursor.close()
+
+def _acquire_lock(conn, cursor):
+    if DB_TYPE == "postgresql":
+        # Poll rather than block in pg_advisory_lock: a blocked statement keeps
+        # its snapshot open, and CREATE INDEX CONCURRENTLY in the migrating
+        # worker waits for every older snapshot, so the two would deadlock.
+        # Between attempts this session is idle with no transaction open.
+        deadline = time.monotonic() + MIGRATION_LOCK_TIMEOUT
+        while True:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+            acquired = cursor.fetchone()[0]
+            conn.commit()
+            if acquired:
+                return
+            if time.monotonic() >= deadline:
+                raise RuntimeError("Timed out waiting for another worker's schema migration")
+            time.sleep(MIGRATION_LOCK_POLL)
+    else:
+        cursor.execute("SELECT GET_LOCK(%s, %s)", (MIGRATION_LOCK_NAME, MIGRATION_LOCK_TIMEOUT))
+        if cursor.fetchone()[0] != 1:
+            raise RuntimeError("Timed out waiting for another worker's schema migration")
+
+def _release_lock(cursor):
+    if DB_TYPE == "postgresql":
+        cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+    else:
+        cursor.execute("SELECT RELEASE_LOCK(%s)", (MIGRATION_LOCK_NAME,))
+    cursor.fetchone()
+
+def _run_step(cursor, step: Step):
+    if callable(step):
+        step(cursor)
+        return
+    try:
+        cursor.execute(step)
+    except Exception as e:
+        # Re-running MySQL DDL on a schema that already has the column/index
+        if DB_TYPE == "mysql" and getattr(e, "errno", None) in (MYSQL_DUPLICATE_COLUMN, MYSQL_DUPLICATE_INDEX):
+            return
+        raise
+
+def _apply(conn, migration: Migration):
+    cursor = conn.cursor()
+    try:
+        if migration.concurrent:
+            conn.autocommit = True
+        for step in migration.steps[DB_TYPE]:
+            _run_step(cursor, step)
+        cursor.execute(
+            "INSERT INTO schema_version (version, description) VALUES (%s, %s)",
+            (migration.version, migration.description),
+        )
+        if not migration.concurrent:
+            conn.commit()
+    except Exception:
+        if not migration.concurrent:
+            conn.rollback()
+        raise
+    finally:
+        conn.autocommit = False
+        cursor.close()
+
+def migrate() -> int:
+    """Apply pending migrations. Returns the number applied (0 on the fast path)."""
+    with db_connection() as conn:
+        if _current_version(conn) == LATEST_VERSION:
+            return 0
+
+        cursor = conn.cursor()
+        _acquire_lock(conn, cursor)
+        conn.commit()
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS schema_version (
+                    version INT PRIMARY KEY,
+                    description VARCHAR(255),
+                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.commit()
+
+            # Another worker may have migrated while we waited for the lock
+            current = _current_version(conn) or 0
+            pending = [m for m in MIGRATIONS if m.version > current]
+            for migration in pending:
+                print(f"🔧 Applying migration {migration.version}: {migration.description}...")
+                _apply(conn, migration)
+            return len(pending)
+        finally:
+            _release_lock(cursor)
+            conn.commit()
+            cursor.close()
+
+if __name__ == "__main__":
+    applied = migrate()
+    print(f"✅ Schema at version {LATEST_VERSION} ({applied} migrations applied)")
@@ -1,8 +1,15 @@
 # Layer 1 License Server - Pydantic Models
-from pydantic import BaseModel, EmailStr, field_validator
-from typing import Optional
+import os
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from typing import List, Optional
 from datetime import datetime
 
+# Largest number of items accepted by POST /validate/batch
+VALIDATE_BATCH_MAX = int(os.getenv("VALIDATE_BATCH_MAX", "500"))
+
+# Largest number of licenses created by one POST /admin/generate/bulk
+GENERATE_BULK_MAX = int(os.getenv("GENERATE_BULK_MAX", "1000"))
+
 class LicenseCreate(BaseModel):
     customer_name: str
     company_name: Optional[str] = None
@@ -20,6 +27,26 @@ class LicenseCreate(BaseModel):
             return None
         return v
 
+class LicenseBulkCreate(BaseModel):
+    """Either explicit `licenses`, or a `template` repeated `count` times."""
+    # Capped here, so an oversized request is rejected before items() builds it
+    licenses: Optional[List[LicenseCreate]] = Field(None, min_length=1, max_length=GENERATE_BULK_MAX)
+    template: Optional[LicenseCreate] = None
+    count: Optional[int] = Field(None, ge=1, le=GENERATE_BULK_MAX)
+
+    @model_validator(mode='after')
+    def one_form(self):
+        if self.licenses is not None and self.template is None and self.count is None:
+            return self
+        if self.licenses is None and self.template is not None and self.count is not None:
+            return self
+        raise ValueError("Provide either 'licenses' or both 'template' and 'count'")
+
+    def items(self) -> List[LicenseCreate]:
+        if self.licenses is not None:
+            return self.licenses
+        return [self.template] * self.count
+
 class LicenseResponse(BaseModel):
     id: int
     license_key: str
@@ -44,6 +71,10 @@ class ValidateRequest(BaseModel):
     license_key: str
     hardware_fingerprint: str
 
+class ValidateBatchRequest(BaseModel):
+    # Capped here, so an oversized batch is rejected while it is parsed
+    items: List[ValidateRequest] = Field(..., max_length=VALIDATE_BATCH_MAX)
+
 class BlockRequest(BaseModel):
     license_key: str
     message: Optional[str] = "License has been blocked by administrator"
@@ -0,0 +1,148 @@
+# Layer 1 License Server - Sync Outbox Dispatcher
+#
+# Admin changes the remote registry must learn about promptly (expiry
+# extensions, deletions) are written to the sync_outbox table in the same
+# transaction as the local change, so admin endpoints return as soon as the
+# commit lands and a crash cannot lose a change. This dispatcher drains the
+# table in the background: changes to one license are sent one at a time and
+# in order, failures are retried with exponential backoff, and any number of
+# workers may run a dispatcher since rows are claimed with SKIP LOCKED.
+import os
+import json
+import random
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import httpx
+
+import async_database as db
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", "5"))
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "50"))
+OUTBOX_TIMEOUT = float(os.getenv("OUTBOX_TIMEOUT", "60"))  # long, for remote cold starts
+# Retry delay doubles per attempt from BASE up to MAX seconds
+OUTBOX_BACKOFF_BASE = float(os.getenv("OUTBOX_BACKOFF_BASE", "5"))
+OUTBOX_BACKOFF_MAX = float(os.getenv("OUTBOX_BACKOFF_MAX", "900"))
+
+# ============================================================================
+# Dispatcher
+# ============================================================================
+
+class OutboxDispatcher:
+    """Sends queued license changes to the remote registry's admin API."""
+
+    def __init__(self, base_url: str, token: str):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self._client: Optional[httpx.AsyncClient] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.sent = 0
+        self.retried = 0
+        self.dropped = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=OUTBOX_TIMEOUT,
+                headers={"Authorization": f"Bearer {self.token}"} if self.token else None,
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def wake(self):
+        """Dispatch now instead of at the next poll (call after enqueueing)."""
+        if self._wake is not None:
+            self._wake.set()
+
+    @staticmethod
+    def _request_for(row: Dict) -> tuple:
+        """Map an outbox row to (method, path, json body)."""
+        license_key = row['license_key']
+        payload = json.loads(row['payload']) if row['payload'] else None
+        if row['operation'] == "extend":
+            return "PATCH", f"/m4st3r/central/licenses/{license_key}", payload
+        if row['operation'] == "delete":
+            return "DELETE", f"/m4st3r/central/licenses/{license_key}", None
+        raise ValueError(f"Unknown outbox operation: {row['operation']}")
+
+    async def _dispatch(self, row: Dict):
+        label = f"{row['operation']} {row['license_key']}"
+        try:
+            method, path, body = self._request_for(row)
+            response = await self.client.request(method, path, json=body)
+        except Exception as e:
+            await self._retry(row, repr(e))
+            return
+
+        status = response.status_code
+        # 404: the license never reached the remote (new licenses go out with
+        # the watermark sync, which also carries the extended expiry), or is
+        # already gone there
+        if status < 300 or status == 404:
+            await db.complete_outbox(row['id'])
+            self.sent += 1
+            print(f"✅ Remote sync: {label}")
+        elif status < 500 and status != 429:
+            # Retrying cannot fix a rejected request; drop it so later
+            # changes to the same license are not blocked behind it
+            await db.complete_outbox(row['id'])
+            self.dropped += 1
+            print(f"❌ Remote rejected {label}: {status} {response.text[:200]}")
+        else:
+            await self._retry(row, f"HTTP {status}")
+
+    async def _retry(self, row: Dict, error: str):
+        delay = min(OUTBOX_BACKOFF_MAX, OUTBOX_BACKOFF_BASE * 2 ** (row['attempts'] - 1))
+        delay = random.uniform(delay / 2, delay)
+        await db.retry_outbox(row['id'], error, datetime.now() + timedelta(seconds=delay))
+        self.retried += 1
+        print(f"⚠️ Remote sync of {row['operation']} {row['license_key']} failed "
+              f"(attempt {row['attempts']}, retry in {delay:.0f}s): {error}")
+
+    async def run_once(self) -> int:
+        """Claim and dispatch one batch. Returns the number of rows claimed."""
+        rows = await db.claim_outbox(OUTBOX_BATCH_SIZE)
+        if rows:
+            # Claimed rows belong to distinct licenses, so they can go in parallel
+            results = await asyncio.gather(*(self._dispatch(row) for row in rows), return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    # The row stays claimed until its lock expires, then is retried
+                    print(f"❌ Outbox dispatch error: {result}")
+        return len(rows)
+
+    async def run_forever(self):
+        """Background loop: drain the outbox, then wait for a wake-up or the next poll."""
+        self._wake = asyncio.Event()
+        while True:
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                print(f"❌ Outbox dispatch error: {e}")
+                claimed = 0
+
+            if claimed >= OUTBOX_BATCH_SIZE:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), OUTBOX_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def stats(self) -> Dict:
+        return {
+            "sent": self.sent,
+            "retried": self.retried,
+            "dropped": self.dropped,
+        }
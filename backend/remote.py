@@ -0,0 +1,220 @@
+# Layer 1 License Server - Remote Registry Client
+#
+# Client endpoints consult the remote registry (/sys/validate) for a master
+# override on every request. This module keeps that off the critical path:
+# one shared keep-alive HTTP client, a per-key cache of override decisions,
+# single-flight coalescing of concurrent lookups for the same key, and a
+# circuit breaker that fails open immediately while the remote is unhealthy.
+import os
+import time
+from typing import Dict, Optional
+
+import httpx
+
+from cache import TTLCache, SingleFlight
+from metrics import Counter, Histogram
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+REMOTE_TIMEOUT = float(os.getenv("REMOTE_TIMEOUT", "10"))
+REMOTE_CONNECT_TIMEOUT = float(os.getenv("REMOTE_CONNECT_TIMEOUT", "3"))
+REMOTE_MAX_CONNECTIONS = int(os.getenv("REMOTE_MAX_CONNECTIONS", "20"))
+# Seconds an override decision is reused before asking the remote again
+REMOTE_OVERRIDE_TTL = float(os.getenv("REMOTE_OVERRIDE_TTL", "60"))
+REMOTE_OVERRIDE_CACHE_SIZE = int(os.getenv("REMOTE_OVERRIDE_CACHE_SIZE", "10000"))
+# Consecutive failures that open the breaker, and how long it stays open
+REMOTE_BREAKER_THRESHOLD = int(os.getenv("REMOTE_BREAKER_THRESHOLD", "5"))
+REMOTE_BREAKER_RESET = float(os.getenv("REMOTE_BREAKER_RESET", "30"))
+
+# Decision used whenever the remote cannot be asked (fail-open)
+FAIL_OPEN = {"allowed": True}
+
+REMOTE_REQUESTS = Counter(
+    "remote_requests", "Calls to the remote registry by endpoint and outcome "
+    "(ok, error, server_error, short_circuited)", ("endpoint", "outcome"),
+)
+REMOTE_REQUEST_SECONDS = Histogram(
+    "remote_request_duration_seconds", "Latency of calls to the remote registry", ("endpoint",)
+)
+
+def _endpoint_label(path: str) -> str:
+    """/sys/license/WB-1234 -> /sys/license (keeps license keys out of labels)."""
+    return "/".join(path.split("/")[:3])
+
+# ============================================================================
+# Circuit Breaker
+# ============================================================================
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker (closed -> open -> half-open).
+
+    While open every call is refused without touching the network. After
+    `reset_timeout` seconds a single probe is let through; its outcome closes
+    the breaker again or re-opens it for another period.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probing = False
+
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._probing = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+                print(f"⚠️ Remote circuit opened after {self.failures} failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+        }
+
+# ============================================================================
+# Remote Client
+# ============================================================================
+
+class RemoteClient:
+    """Shared async client for the remote registry's public endpoints."""
+
+    def __init__(self, base_url: str, timeout: float = REMOTE_TIMEOUT,
+                 override_ttl: float = REMOTE_OVERRIDE_TTL):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.override_cache = TTLCache(
+            maxsize=REMOTE_OVERRIDE_CACHE_SIZE, ttl=override_ttl, name="remote_override"
+        )
+        self.breaker = CircuitBreaker(REMOTE_BREAKER_THRESHOLD, REMOTE_BREAKER_RESET)
+        self._flights = SingleFlight(name="remote_override")
+        self._client: Optional[httpx.AsyncClient] = None
+        self.requests = 0
+        self.errors = 0
+        self.short_circuited = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, connect=REMOTE_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=REMOTE_MAX_CONNECTIONS,
+                    max_keepalive_connections=REMOTE_MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(self, method: str, path: str, **kwargs) -> Optional[httpx.Response]:
+        """Send a request through the breaker. Returns None when it is open or the call fails."""
+        endpoint = _endpoint_label(path)
+        if not self.breaker.allow():
+            self.short_circuited += 1
+            REMOTE_REQUESTS.inc(endpoint, "short_circuited")
+            return None
+
+        self.requests += 1
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, **kwargs)
+        except Exception as e:
+            self.errors += 1
+            self.breaker.record_failure()
+            REMOTE_REQUESTS.inc(endpoint, "error")
+            print(f"⚠️ Remote {method} {path} failed: {e!r}")
+            return None
+        finally:
+            REMOTE_REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint)
+
+        if response.status_code >= 500:
+            self.errors += 1
+            self.breaker.record_failure()
+            REMOTE_REQUESTS.inc(endpoint, "server_error")
+            print(f"⚠️ Remote {method} {path} returned {response.status_code}")
+            return None
+
+        self.breaker.record_success()
+        REMOTE_REQUESTS.inc(endpoint, "ok")
+        return response
+
+    async def check_override(self, license_key: str) -> Dict:
+        """Get the remote override decision for a key (cached, coalesced, fail-open)."""
+        cached = self.override_cache.get(license_key)
+        if cached is not None:
+            return cached
+        return await self._flights.do(license_key, self._fetch_override, license_key)
+
+    async def _fetch_override(self, license_key: str) -> Dict:
+        epoch = self.override_cache.epoch
+        response = await self._request("POST", "/sys/validate", params={"license_key": license_key})
+        if response is None:
+            return FAIL_OPEN
+
+        try:
+            data = response.json()
+        except ValueError:
+            print(f"⚠️ Remote check returned invalid JSON for {license_key}")
+            return FAIL_OPEN
+
+        if not isinstance(data, dict):
+            return FAIL_OPEN
+
+        print(f"📡 Remote Validation for {license_key}: {data}")
+        self.override_cache.set(license_key, data, epoch=epoch)
+        return data
+
+    async def fetch_license(self, license_key: str, timeout: float = 60.0) -> Optional[Dict]:
+        """Fetch a license record from the remote registry (None if unknown or unreachable)."""
+        response = await self._request("GET", f"/sys/license/{license_key}", timeout=timeout)
+        if response is None or response.status_code != 200:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def stats(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "short_circuited": self.short_circuited,
+            "breaker": self.breaker.stats(),
+            "override_cache": self.override_cache.stats(),
+            "coalescing": self._flights.stats(),
+        }
@@ -0,0 +1,304 @@
+# Layer 1 License Server - Incremental Remote Sync
+#
+# Pushes local license changes to the remote registry. Instead of re-posting
+# the whole catalog every run, the syncer remembers the (updated_at, id) of
+# the last license it pushed (the watermark, stored in server_state so it
+# survives restarts and is shared by all workers) and only pages through
+# rows changed since then. Sync cost therefore scales with churn.
+#
+# Pushes run concurrently (bounded by SYNC_CONCURRENCY) over one keep-alive
+# client, with jittered exponential backoff per request, and every run
+# produces a report with counts and latency percentiles. Run this module
+# directly to perform a single sync, e.g. against a local stub:
+#
+#     REMOTE_URL=http://127.0.0.1:9000 python remote_sync.py --full
+import os
+import sys
+import time
+import random
+import socket
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import httpx
+
+if __name__ == "__main__":
+    # Run as a script: load backend/.env before database reads DB_TYPE and
+    # DATABASE_URL at import time and before the SYNC_* settings below
+    from dotenv import load_dotenv
+    load_dotenv(override=True)
+
+import async_database as db
+from database import encode_cursor, decode_cursor
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+SYNC_INTERVAL = float(os.getenv("SYNC_INTERVAL", "900"))
+SYNC_PAGE_SIZE = int(os.getenv("SYNC_PAGE_SIZE", "500"))
+SYNC_TIMEOUT = float(os.getenv("SYNC_TIMEOUT", "60"))  # long, for remote cold starts
+# Re-scan this many seconds before the watermark to catch rows whose
+# transaction committed after a later-stamped row was already pushed.
+SYNC_WATERMARK_OVERLAP = float(os.getenv("SYNC_WATERMARK_OVERLAP", "60"))
+# Optional remote endpoint accepting a JSON list of licenses in one request.
+# When unset, licenses are posted one by one to /m4st3r/license/sync.
+REMOTE_SYNC_BULK_PATH = os.getenv("REMOTE_SYNC_BULK_PATH", "")
+# Parallel pushes in flight, and per-request retry policy
+SYNC_CONCURRENCY = int(os.getenv("SYNC_CONCURRENCY", "8"))
+SYNC_RETRIES = int(os.getenv("SYNC_RETRIES", "3"))
+SYNC_BACKOFF_BASE = float(os.getenv("SYNC_BACKOFF_BASE", "0.5"))
+SYNC_BACKOFF_MAX = float(os.getenv("SYNC_BACKOFF_MAX", "10"))
+
+WATERMARK_STATE = "remote_sync_watermark"
+LEASE_STATE = "remote_sync_lease"
+
+def license_payload(license: Dict) -> Dict:
+    """JSON-safe copy of a license row for the remote sync endpoint."""
+    payload = dict(license)
+    for field in ('expires_at', 'generated_at', 'updated_at'):
+        if isinstance(payload.get(field), datetime):
+            payload[field] = payload[field].isoformat()
+    return payload
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+# Push outcomes
+PUSHED = "pushed"
+REJECTED = "rejected"   # remote answered 4xx: retrying cannot help
+FAILED = "failed"       # network error / 5xx / 429 after all retries
+
+class SyncReport:
+    """Counters and latencies collected during one sync run."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.pushed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.retries = 0
+        self.latencies: List[float] = []
+        self.complete = True
+
+    def as_dict(self) -> Dict:
+        elapsed = time.monotonic() - self.started
+        latencies = sorted(self.latencies)
+        to_ms = lambda value: round(value * 1000, 1) if value is not None else None
+        return {
+            "pushed": self.pushed,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "retries": self.retries,
+            "complete": self.complete,
+            "seconds": round(elapsed, 3),
+            "per_second": round(self.pushed / elapsed, 1) if elapsed else None,
+            "latency_ms": {
+                "p50": to_ms(percentile(latencies, 50)),
+                "p95": to_ms(percentile(latencies, 95)),
+                "p99": to_ms(percentile(latencies, 99)),
+                "max": to_ms(latencies[-1] if latencies else None),
+            },
+        }
+
+# ============================================================================
+# Syncer
+# ============================================================================
+
+class LicenseSyncer:
+    """Pushes licenses changed since the stored watermark to the remote."""
+
+    def __init__(self, base_url: str, token: str, concurrency: int = SYNC_CONCURRENCY):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.concurrency = max(1, concurrency)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._client: Optional[httpx.AsyncClient] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.last_report: Optional[Dict] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=SYNC_TIMEOUT,
+                headers={"Authorization": f"Bearer {self.token}"} if self.token else None,
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency,
+                ),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def load_watermark(self) -> Optional[tuple]:
+        value = await db.get_state(WATERMARK_STATE)
+        if not value:
+            return None
+        try:
+            return decode_cursor(value)
+        except ValueError:
+            print(f"⚠️ Ignoring invalid sync watermark: {value!r}")
+            return None
+
+    def wake(self):
+        """Sync now instead of at the next interval (call after creating licenses)."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def reset_watermark(self):
+        """Forget the watermark so the next run pushes every license."""
+        await db.set_state(WATERMARK_STATE, None)
+
+    async def _post(self, path: str, payload, report: SyncReport, label: str) -> str:
+        """POST with retries and full-jitter exponential backoff."""
+        for attempt in range(SYNC_RETRIES + 1):
+            if attempt:
+                report.retries += 1
+                delay = min(SYNC_BACKOFF_MAX, SYNC_BACKOFF_BASE * (2 ** (attempt - 1)))
+                await asyncio.sleep(random.uniform(0, delay))
+
+            started = time.monotonic()
+            try:
+                response = await self.client.post(path, json=payload)
+            except Exception as ex:
+                error = repr(ex)
+            else:
+                report.latencies.append(time.monotonic() - started)
+                if response.status_code in (200, 201):
+                    return PUSHED
+                if response.status_code < 500 and response.status_code != 429:
+                    print(f"⚠️ Remote rejected {label}: {response.status_code} {response.text[:200]}")
+                    return REJECTED
+                error = f"HTTP {response.status_code}"
+
+        print(f"⚠️ Failed to push {label} after {SYNC_RETRIES + 1} attempts: {error}")
+        return FAILED
+
+    async def push_page(self, licenses: List[Dict], report: SyncReport) -> int:
+        """Push a page concurrently.
+
+        Returns how many leading rows are settled (pushed or rejected), i.e.
+        how far the watermark may advance.
+        """
+        if REMOTE_SYNC_BULK_PATH:
+            payload = [license_payload(lic) for lic in licenses]
+            outcomes = [await self._post(REMOTE_SYNC_BULK_PATH, payload, report, f"{len(licenses)} licenses")]
+            outcomes *= len(licenses)
+        else:
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def push(license):
+                async with semaphore:
+                    return await self._post(
+                        "/m4st3r/license/sync", license_payload(license), report, license['license_key']
+                    )
+
+            outcomes = await asyncio.gather(*(push(lic) for lic in licenses))
+
+        report.pushed += outcomes.count(PUSHED)
+        report.rejected += outcomes.count(REJECTED)
+        report.failed += outcomes.count(FAILED)
+        return outcomes.index(FAILED) if FAILED in outcomes else len(outcomes)
+
+    async def run_once(self) -> Dict:
+        """Push everything changed since the watermark, one page at a time."""
+        report = SyncReport()
+        watermark = await self.load_watermark()
+        position = None
+        if watermark:
+            position = (watermark[0] - timedelta(seconds=SYNC_WATERMARK_OVERLAP), 0)
+
+        while True:
+            licenses = await db.get_licenses_changed_since(position, SYNC_PAGE_SIZE)
+            if not licenses:
+                break
+
+            settled = await self.push_page(licenses, report)
+            if settled:
+                # Only advance past rows that are known to be settled
+                last = licenses[settled - 1]
+                position = (last['updated_at'], last['id'])
+                if watermark is None or position > watermark:
+                    watermark = position
+                    await db.set_state(WATERMARK_STATE, encode_cursor(*watermark))
+
+            if settled < len(licenses):
+                # The remote is struggling; the next run resumes from here
+                report.complete = False
+                break
+            if len(licenses) < SYNC_PAGE_SIZE:
+                break
+
+        self.last_report = report.as_dict()
+        return self.last_report
+
+    async def run_forever(self):
+        """Background loop: one incremental sync every SYNC_INTERVAL seconds, or sooner when woken."""
+        self._wake = asyncio.Event()
+        # Initial delay to let server start up completely
+        await asyncio.sleep(5)
+
+        while True:
+            try:
+                # Only one worker (across all nodes) pushes at a time
+                if await db.try_acquire_lease(LEASE_STATE, self.owner, SYNC_INTERVAL * 2):
+                    report = await self.run_once()
+                    status = "complete" if report["complete"] else "incomplete"
+                    print(
+                        f"✅ Incremental sync {status}: pushed {report['pushed']}, "
+                        f"rejected {report['rejected']}, failed {report['failed']} "
+                        f"in {report['seconds']}s (p95 {report['latency_ms']['p95']} ms)"
+                    )
+            except Exception as e:
+                print(f"❌ Scheduled sync error: {e}")
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), SYNC_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+# ============================================================================
+# Command Line
+# ============================================================================
+
+async def _main(args):
+    import database
+
+    syncer = LicenseSyncer(
+        args.remote_url or os.getenv("REMOTE_URL", ""),
+        os.getenv("REMOTE_ADMIN_TOKEN", ""),
+        concurrency=args.concurrency,
+    )
+    try:
+        await db.init_database()
+        if args.full:
+            await syncer.reset_watermark()
+        report = await syncer.run_once()
+    finally:
+        await syncer.close()
+        db.shutdown()
+        database.close_pool()
+
+    for key, value in report.items():
+        print(f"{key:>12}: {value}")
+    return 0 if report["complete"] else 1
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run one license sync to the remote registry.")
+    parser.add_argument("--full", action="store_true", help="reset the watermark and push every license")
+    parser.add_argument("--concurrency", type=int, default=SYNC_CONCURRENCY)
+    parser.add_argument("--remote-url", help="override REMOTE_URL (e.g. a local stub)")
+    sys.exit(asyncio.run(_main(parser.parse_args())))
@@ -0,0 +1,16 @@
+# Layer 1 License Server - Test Setup
+#
+# Tests import the backend modules the way main.py does (flat, from backend/).
+# database.py reads DB_TYPE/DATABASE_URL at import, so they are pointed at
+# TEST_DATABASE_URL (a scratch PostgreSQL database) or a placeholder, never at
+# whatever DATABASE_URL the shell or backend/.env holds. Tests that need a
+# server skip when TEST_DATABASE_URL is unset.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+
+os.environ["DB_TYPE"] = "postgresql"
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL or "postgresql://localhost/license_server_test"
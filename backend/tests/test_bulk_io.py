@@ -0,0 +1,68 @@
+# Layer 1 License Server - Bulk Import Parsing Tests
+import io
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+import bulk_io
+from bulk_io import clean_row, _records
+
+def _text(content: str) -> io.StringIO:
+    return io.StringIO(content, newline="")
+
+def test_clean_row_converts_license_columns():
+    row = clean_row("licenses", {
+        "license_key": "WB-1", "customer_name": "Acme", "expires_at": "2027-01-31T00:00:00",
+        "is_blocked": "yes", "max_activations": "3", "email": "", "unknown": "dropped",
+    })
+    assert row["expires_at"] == datetime(2027, 1, 31)
+    assert row["is_blocked"] is True
+    assert row["max_activations"] == 3
+    assert row["email"] is None
+    assert row["created_by"] == "import"
+    assert "unknown" not in row
+
+def test_clean_row_defaults_activations_to_active():
+    row = clean_row("activations", {"license_key": "WB-1", "hardware_fingerprint": "fp"})
+    assert row["is_active"] is True
+    assert isinstance(row["activated_at"], datetime)
+
+@pytest.mark.parametrize("raw, message", [
+    ({"license_key": "WB-1", "customer_name": "Acme"}, "missing expires_at"),
+    ({"license_key": "WB-1", "customer_name": "Acme", "expires_at": "soon"}, "expires_at"),
+    ({"license_key": "WB-1", "customer_name": "Acme", "expires_at": "2027-01-01", "is_blocked": "maybe"},
+     "is_blocked"),
+    (["not", "an", "object"], "expected an object"),
+])
+def test_clean_row_rejects_bad_rows(raw, message):
+    with pytest.raises(ValueError, match=message):
+        clean_row("licenses", raw)
+
+def test_ndjson_records_keep_line_numbers_and_skip_blank_lines():
+    records = list(_records(_text('{"a": 1}\n\n{broken\n{"a": 2}\n'), "ndjson"))
+    assert [line for line, _ in records] == [1, 3, 4]
+    assert records[0][1] == {"a": 1}
+    assert isinstance(records[1][1], ValueError)
+
+def test_csv_records_report_the_line_a_row_ends_on():
+    records = list(_records(_text('license_key,notes\nWB-1,"two\nlines"\nWB-2,x\n'), "csv"))
+    assert records == [(3, {"license_key": "WB-1", "notes": "two\nlines"}), (4, {"license_key": "WB-2", "notes": "x"})]
+
+def test_import_counts_invalid_rows_and_failed_batches():
+    lines = [
+        '{"license_key": "WB-1", "customer_name": "A", "expires_at": "2027-01-01"}',
+        '{"license_key": "WB-2", "customer_name": "B"}',
+        '{"license_key": "WB-3", "customer_name": "C", "expires_at": "2027-01-01"}',
+        '{"license_key": "WB-4", "customer_name": "D", "expires_at": "2027-01-01"}',
+    ]
+    upsert = mock.Mock(side_effect=[1, RuntimeError("deadlock"), 1])
+
+    with mock.patch.object(bulk_io.database, "upsert_licenses", upsert), \
+            mock.patch.object(bulk_io.database, "notify_bulk_change") as notify:
+        report = bulk_io.import_file(io.BytesIO("\n".join(lines).encode()), "licenses", "ndjson", batch_size=1)
+
+    assert (report["rows"], report["imported"], report["invalid"], report["failed"]) == (4, 2, 1, 1)
+    assert {"line": 2, "error": "missing expires_at"} in report["errors"]
+    assert any(error.get("lines") == "3-3" for error in report["errors"])
+    notify.assert_called_once()
@@ -0,0 +1,116 @@
+# Layer 1 License Server - Cache Tests
+import asyncio
+from unittest import mock
+
+import pytest
+
+from cache import TTLCache, SingleFlight
+
+def test_get_returns_value_until_ttl():
+    cache = TTLCache(ttl=10)
+    with mock.patch("cache.time.monotonic", return_value=100.0):
+        cache.set("k", "v")
+    with mock.patch("cache.time.monotonic", return_value=109.9):
+        assert cache.get("k") == "v"
+    with mock.patch("cache.time.monotonic", return_value=110.0):
+        assert cache.get("k") is None
+    assert cache.expirations == 1
+    assert len(cache) == 0
+
+def test_set_refuses_value_loaded_before_an_invalidation():
+    cache = TTLCache()
+    epoch = cache.epoch
+    cache.invalidate("k")
+    assert cache.set("k", "stale", epoch=epoch) is False
+    assert cache.get("k") is None
+    assert cache.set("k", "fresh", epoch=cache.epoch) is True
+    assert cache.get("k") == "fresh"
+
+def test_every_invalidation_bumps_the_epoch():
+    cache = TTLCache()
+    epochs = [cache.epoch]
+    cache.invalidate("missing")
+    epochs.append(cache.epoch)
+    cache.invalidate_where(lambda key: False)
+    epochs.append(cache.epoch)
+    cache.clear()
+    epochs.append(cache.epoch)
+    assert epochs == sorted(set(epochs))
+
+def test_invalidate_where_drops_matching_keys():
+    cache = TTLCache()
+    cache.set(("A", "fp1"), 1)
+    cache.set(("A", "fp2"), 2)
+    cache.set(("B", "fp1"), 3)
+    cache.invalidate_where(lambda key: key[0] == "A")
+    assert cache.get(("A", "fp1")) is None
+    assert cache.get(("B", "fp1")) == 3
+    assert cache.invalidations == 2
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.evictions == 1
+
+# ============================================================================
+# SingleFlight
+# ============================================================================
+
+def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    calls = []
+
+    async def load(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return f"row-{key}"
+
+    async def main():
+        return await asyncio.gather(*(flights.do("k", load, "k") for _ in range(5)), flights.do("j", load, "j"))
+
+    assert asyncio.run(main()) == ["row-k"] * 5 + ["row-j"]
+    assert calls == ["k", "j"]
+    assert (flights.calls, flights.shared, len(flights)) == (2, 4, 0)
+
+def test_waiters_get_the_same_exception_and_nothing_is_cached():
+    flights = SingleFlight()
+    attempts = []
+
+    async def fail():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    async def main():
+        return await asyncio.gather(*(flights.do("k", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results) and len(attempts) == 1
+
+    async def ok():
+        return "up"
+
+    assert asyncio.run(flights.do("k", ok)) == "up"
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    flights = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def main():
+        first = asyncio.ensure_future(flights.do("k", slow))
+        second = asyncio.ensure_future(flights.do("k", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == "done"
@@ -0,0 +1,37 @@
+# Layer 1 License Server - Cache Event Poller Tests
+from datetime import datetime, timedelta
+from unittest import mock
+
+import database
+from cache_events import CacheInvalidationListener
+
+def _event(event_id: int, age_seconds: float) -> dict:
+    return {
+        "id": event_id, "license_key": f"WB-{event_id}", "event": "blocked",
+        "hardware_fingerprint": None, "created_at": datetime.now() - timedelta(seconds=age_seconds),
+    }
+
+def test_poll_applies_each_event_once_and_only_passes_settled_ones():
+    polls = [
+        [_event(11, 60), _event(12, 1)],
+        [_event(12, 60), _event(13, 60)],
+    ]
+    listener = CacheInvalidationListener(poll_interval=0)
+    listener.last_event_id = 10
+    seen_since = []
+
+    def get_events(since, limit, settled=True):
+        seen_since.append(since)
+        events = polls.pop(0)
+        if not polls:
+            listener._stop.set()
+        return events
+
+    with mock.patch.object(database, "get_license_events", side_effect=get_events), \
+            mock.patch.object(database, "apply_license_event") as apply:
+        listener._poll()
+
+    assert [c.args[0] for c in apply.call_args_list] == ["WB-11", "WB-12", "WB-13"]
+    # 12 was unsettled after the first poll, so it was read again (not skipped)
+    assert seen_since == [10, 11]
+    assert listener.last_event_id == 13
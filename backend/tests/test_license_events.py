@@ -0,0 +1,64 @@
+# Layer 1 License Server - License Event Feed Tests
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import database
+from database import settled_license_events
+
+def _event(event_id: int, age_seconds: float) -> dict:
+    return {"id": event_id, "created_at": datetime.now() - timedelta(seconds=age_seconds)}
+
+def test_settled_events_stop_at_the_first_recent_one():
+    events = [_event(1, 60), _event(2, 30), _event(3, 1), _event(4, 60)]
+    assert [e["id"] for e in settled_license_events(events, settle_seconds=10)] == [1, 2]
+
+def test_no_events_settle_inside_the_window():
+    assert settled_license_events([_event(1, 1)], settle_seconds=10) == []
+
+# ============================================================================
+# Against a database (TEST_DATABASE_URL)
+# ============================================================================
+
+requires_db = pytest.mark.skipif(not os.getenv("TEST_DATABASE_URL"), reason="TEST_DATABASE_URL not set")
+
+@pytest.fixture
+def events_db(monkeypatch):
+    from migrations import migrate
+    migrate()
+    monkeypatch.setattr(database, "LICENSE_EVENT_SETTLE_SECONDS", 1.0)
+    with database.db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM license_events")
+        conn.commit()
+        cursor.close()
+    yield
+    database.close_pool()
+
+@requires_db
+def test_late_commit_is_not_skipped(events_db):
+    since = database.get_latest_license_event_id()
+
+    # A takes the lower id but commits after B
+    slow = database.get_connection()
+    slow_cursor = slow.cursor()
+    database._record_license_event(slow_cursor, "WB-SLOW", "blocked")
+    with database.db_connection() as conn:
+        cursor = conn.cursor()
+        database._record_license_event(cursor, "WB-FAST", "blocked")
+        conn.commit()
+        cursor.close()
+
+    # B is visible but unsettled, so a reader does not move past A's id
+    assert database.get_license_events(since) == []
+    assert [e["license_key"] for e in database.get_license_events(since, settled=False)] == ["WB-FAST"]
+
+    slow.commit()
+    slow.close()
+    time.sleep(1.1)
+
+    events = database.get_license_events(since)
+    assert [e["license_key"] for e in events] == ["WB-SLOW", "WB-FAST"]
+    assert database.get_latest_license_event_id() == events[-1]["id"]
@@ -0,0 +1,64 @@
+# Layer 1 License Server - License Token Tests
+import hashlib
+from datetime import datetime, timedelta
+
+import pytest
+from jose import jwt, JWTError
+
+import license_tokens
+from license_tokens import TokenSigner, ALGORITHM, feed_hash, revocation_entry
+
+@pytest.fixture
+def signer(monkeypatch):
+    monkeypatch.setattr(license_tokens, "LICENSE_TOKEN_PRIVATE_KEY", license_tokens._generate_private_key())
+    signer = TokenSigner()
+    signer.load()
+    return signer
+
+def _license(days: float) -> dict:
+    return {"license_key": "WB-AAAA1111-BBBB2222", "expires_at": datetime.now() + timedelta(days=days)}
+
+def test_issued_token_verifies_with_the_published_key(signer):
+    license = _license(30)
+    issued = signer.issue(license, "fp-1")
+
+    claims = jwt.decode(
+        issued["token"], signer.jwks()["keys"][0], algorithms=[ALGORITHM],
+        issuer=license_tokens.LICENSE_TOKEN_ISSUER,
+    )
+    assert claims["sub"] == license["license_key"]
+    assert claims["fp"] == "fp-1"
+    assert claims["lic_exp"] == int(license["expires_at"].timestamp())
+    assert jwt.get_unverified_header(issued["token"])["kid"] == signer.kid
+
+def test_token_never_outlives_the_license(signer):
+    license = _license(0.5)
+    issued = signer.issue(license, "fp-1")
+    assert issued["token_expires_at"] == license["expires_at"]
+
+def test_token_from_another_key_is_rejected(signer, monkeypatch):
+    issued = signer.issue(_license(30), "fp-1")
+
+    monkeypatch.setattr(license_tokens, "LICENSE_TOKEN_PRIVATE_KEY", license_tokens._generate_private_key())
+    other = TokenSigner()
+    other.load()
+    with pytest.raises(JWTError):
+        jwt.decode(issued["token"], other.public_pem, algorithms=[ALGORITHM])
+
+def test_tampered_token_is_rejected(signer):
+    header, payload, signature = signer.issue(_license(30), "fp-1")["token"].split(".")
+    forged = jwt.encode({"sub": "WB-FORGED"}, "secret", algorithm="HS256").split(".")[1]
+    with pytest.raises(JWTError):
+        jwt.decode(".".join([header, forged, signature]), signer.public_pem, algorithms=[ALGORITHM])
+
+def test_revocation_entry_publishes_hashes_only():
+    event = {
+        "id": 7, "license_key": "WB-AAAA1111-BBBB2222", "event": "deactivated",
+        "hardware_fingerprint": "fp-1", "expires_at": None, "created_at": datetime(2026, 1, 1),
+    }
+    entry = revocation_entry(event)
+
+    assert entry["key_hash"] == hashlib.sha256(b"WB-AAAA1111-BBBB2222").hexdigest()
+    assert entry["device_hash"] == feed_hash("WB-AAAA1111-BBBB2222", "fp-1")
+    assert "expires_at" not in entry
+    assert "WB-AAAA1111-BBBB2222" not in repr(entry) and "fp-1" not in repr(entry)
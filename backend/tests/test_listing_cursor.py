@@ -0,0 +1,25 @@
+# Layer 1 License Server - Keyset Cursor Tests
+from datetime import datetime
+
+import pytest
+
+from database import encode_cursor, decode_cursor
+
+def test_cursor_round_trips_timestamp_and_id():
+    position = (datetime(2026, 3, 1, 12, 30, 5, 123456), 42)
+    assert decode_cursor(encode_cursor(*position)) == position
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime(2026, 12, 31, 23, 59, 59, 999999), 2**40)
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor)[1] == 2**40
+
+def test_cursors_sort_like_their_positions():
+    earlier = decode_cursor(encode_cursor(datetime(2026, 1, 1), 9))
+    later = decode_cursor(encode_cursor(datetime(2026, 1, 1), 10))
+    assert earlier < later
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", encode_cursor(None, 1)])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
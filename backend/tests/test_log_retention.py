@@ -0,0 +1,98 @@
+# Layer 1 License Server - Log Retention Tests
+from datetime import datetime
+
+import pytest
+
+import log_retention
+from log_retention import month_start, add_months, partition_name, ROTATING_TABLE
+
+def test_month_start_truncates_to_the_first():
+    assert month_start(datetime(2026, 2, 28, 23, 59, 59)) == datetime(2026, 2, 1)
+
+@pytest.mark.parametrize("month, count, expected", [
+    (datetime(2026, 1, 1), 1, datetime(2026, 2, 1)),
+    (datetime(2026, 12, 1), 1, datetime(2027, 1, 1)),
+    (datetime(2026, 1, 1), -1, datetime(2025, 12, 1)),
+    (datetime(2026, 3, 1), -14, datetime(2025, 1, 1)),
+    (datetime(2026, 6, 1), 0, datetime(2026, 6, 1)),
+])
+def test_add_months_crosses_years(month, count, expected):
+    assert add_months(month, count) == expected
+
+def test_partition_names_sort_by_month():
+    names = [partition_name(datetime(2025, month, 1)) for month in (1, 10, 12)]
+    assert names == ["validation_logs_p202501", "validation_logs_p202510", "validation_logs_p202512"]
+    assert names == sorted(names)
+
+def test_retention_window_includes_the_current_month():
+    # LOG_RETENTION_MONTHS=6 in March keeps October through March
+    cutoff = add_months(month_start(datetime(2026, 3, 15)), -(6 - 1))
+    assert cutoff == datetime(2025, 10, 1)
+
+# ============================================================================
+# MySQL rolling tables (scripted cursor; no server needed)
+# ============================================================================
+
+class ScriptedCursor:
+    """Answers queries by substring and records every statement."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.statements = []
+        self._result = []
+
+    def execute(self, sql, params=None):
+        sql = " ".join(sql.split())
+        self.statements.append((sql, params))
+        self._result = next((rows for match, rows in self.answers if match in sql), [])
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return self._result
+
+    def close(self):
+        pass
+
+class ScriptedConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        pass
+
+def test_rotation_swaps_the_live_table_and_splits_finished_months():
+    cursor = ScriptedCursor([
+        ("information_schema.tables", [(0,)]),
+        ("ORDER BY id LIMIT 1", [(datetime(2026, 1, 20),)]),
+        ("MAX(id)", [(101,)]),
+        ("SELECT DISTINCT YEAR", [(2026, 2), (2026, 1)]),
+    ])
+    written = log_retention.rotate_table(ScriptedConnection(cursor), now=datetime(2026, 3, 5))
+
+    assert written == ["validation_logs_p202601", "validation_logs_p202602"]
+    sql = [statement for statement, _ in cursor.statements]
+    assert any(s.startswith(f"RENAME TABLE validation_logs TO {ROTATING_TABLE}") for s in sql)
+    assert "ALTER TABLE validation_logs_next AUTO_INCREMENT = 101" in sql
+    copies = [params for statement, params in cursor.statements
+              if statement.startswith("INSERT IGNORE INTO validation_logs_p")]
+    assert copies == [
+        (datetime(2026, 1, 1), datetime(2026, 2, 1)),
+        (datetime(2026, 2, 1), datetime(2026, 3, 1)),
+    ]
+    # Current-month rows go back to the live table before the rotated table is dropped
+    assert sql.index(f"DROP TABLE {ROTATING_TABLE}") > max(
+        i for i, s in enumerate(sql) if s.startswith("INSERT IGNORE INTO validation_logs SELECT")
+    )
+
+def test_no_rotation_while_the_live_table_only_has_this_month():
+    cursor = ScriptedCursor([
+        ("information_schema.tables", [(0,)]),
+        ("ORDER BY id LIMIT 1", [(datetime(2026, 3, 1, 0, 0, 1),)]),
+    ])
+    assert log_retention.rotate_table(ScriptedConnection(cursor), now=datetime(2026, 3, 5)) == []
+    assert not any("RENAME" in statement for statement, _ in cursor.statements)
@@ -0,0 +1,247 @@
+# Layer 1 License Server - Write-Behind Buffers
+#
+# Writes that are not needed to answer the current request are buffered in
+# memory and flushed in bulk by a background thread, so client endpoints do
+# not pay for an INSERT + COMMIT on every call.
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import database
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+VALIDATION_LOG_QUEUE_MAX = int(os.getenv("VALIDATION_LOG_QUEUE_MAX", "10000"))
+VALIDATION_LOG_BATCH_SIZE = int(os.getenv("VALIDATION_LOG_BATCH_SIZE", "500"))
+VALIDATION_LOG_FLUSH_INTERVAL = float(os.getenv("VALIDATION_LOG_FLUSH_INTERVAL", "1.0"))
+# What to do when the queue is full: "drop_oldest" or "drop_newest"
+VALIDATION_LOG_FULL_POLICY = os.getenv("VALIDATION_LOG_FULL_POLICY", "drop_oldest")
+
+# How stale activations.last_validated may get before it is written
+LAST_VALIDATED_FLUSH_INTERVAL = float(os.getenv("LAST_VALIDATED_FLUSH_INTERVAL", "30"))
+# Flush early once this many distinct activations are pending
+LAST_VALIDATED_MAX_PENDING = int(os.getenv("LAST_VALIDATED_MAX_PENDING", "5000"))
+
+# ============================================================================
+# Background Flusher
+# ============================================================================
+
+class BackgroundFlusher:
+    """Base class for buffers drained by a daemon thread.
+
+    The thread wakes every `flush_interval` seconds, or earlier when a
+    subclass calls `_wake()` because a batch is ready, and calls `flush()`.
+    `stop()` performs a final flush so nothing buffered is lost on shutdown.
+    """
+
+    def __init__(self, name: str, flush_interval: float):
+        self.name = name
+        self.flush_interval = flush_interval
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._ready = False
+        self.flushes = 0
+        self.failed_flushes = 0
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def _wake(self):
+        """Ask the thread to flush now. Caller must hold `self._cond`."""
+        self._ready = True
+        self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._ready and not self._stopping:
+                    self._cond.wait(self.flush_interval)
+                self._ready = False
+                if self._stopping:
+                    return
+            self.flush()
+
+    def flush(self):
+        raise NotImplementedError
+
+# ============================================================================
+# Validation Logs
+# ============================================================================
+
+class ValidationLogWriter(BackgroundFlusher):
+    """Bounded queue of validation_logs rows written as multi-row INSERTs."""
+
+    def __init__(self, max_queue: int = VALIDATION_LOG_QUEUE_MAX,
+                 batch_size: int = VALIDATION_LOG_BATCH_SIZE,
+                 flush_interval: float = VALIDATION_LOG_FLUSH_INTERVAL,
+                 full_policy: str = VALIDATION_LOG_FULL_POLICY):
+        super().__init__("validation-log-writer", flush_interval)
+        if full_policy not in ("drop_oldest", "drop_newest"):
+            raise ValueError(f"Unknown VALIDATION_LOG_FULL_POLICY: {full_policy}")
+        self.max_queue = max(1, max_queue)
+        self.batch_size = max(1, batch_size)
+        self.full_policy = full_policy
+        self._queue = deque()
+        self._flush_lock = threading.Lock()
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+
+    def add(self, license_key: str, hardware_fingerprint: str, status: str,
+            remote_override: bool = False, message: str = None):
+        row = (license_key, hardware_fingerprint, status, remote_override, message, datetime.now())
+        with self._cond:
+            if len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                if self.full_policy == "drop_newest":
+                    return
+                self._queue.popleft()
+            self._queue.append(row)
+            self.enqueued += 1
+            if len(self._queue) >= self.batch_size:
+                self._wake()
+
+    def _take(self) -> List[tuple]:
+        with self._cond:
+            count = min(self.batch_size, len(self._queue))
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _restore(self, rows: List[tuple]):
+        """Put a failed batch back at the head of the queue, as far as it fits."""
+        with self._cond:
+            room = self.max_queue - len(self._queue)
+            keep = rows[:max(0, room)]
+            self.dropped += len(rows) - len(keep)
+            self._queue.extendleft(reversed(keep))
+
+    def flush(self):
+        with self._flush_lock:
+            while True:
+                rows = self._take()
+                if not rows:
+                    return
+                try:
+                    database.insert_validation_logs(rows)
+                except Exception as e:
+                    self.failed_flushes += 1
+                    self._restore(rows)
+                    print(f"⚠️ Validation log flush failed ({len(rows)} rows kept): {e}")
+                    return
+                self.flushes += 1
+                self.written += len(rows)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> Dict:
+        return {
+            "queued": len(self._queue),
+            "max_queue": self.max_queue,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+        }
+
+validation_log_writer = ValidationLogWriter()
+
+def log_validation(license_key: str, hardware_fingerprint: str, status: str,
+                   remote_override: bool = False, message: str = None):
+    """Queue a validation attempt for the next bulk write (never blocks on the DB)."""
+    validation_log_writer.add(license_key, hardware_fingerprint, status, remote_override, message)
+
+# ============================================================================
+# Activation last_validated
+# ============================================================================
+
+class LastValidatedWriter(BackgroundFlusher):
+    """Keeps the newest validation time per activation and writes them in bulk.
+
+    A device validating every few minutes produces one row update per flush
+    interval instead of one per request.
+    """
+
+    def __init__(self, flush_interval: float = LAST_VALIDATED_FLUSH_INTERVAL,
+                 max_pending: int = LAST_VALIDATED_MAX_PENDING):
+        super().__init__("last-validated-writer", flush_interval)
+        self.max_pending = max(1, max_pending)
+        self._pending: Dict[int, datetime] = {}
+        self._flush_lock = threading.Lock()
+        self.touches = 0
+        self.written = 0
+
+    def touch(self, activation_id: int, when: Optional[datetime] = None):
+        with self._cond:
+            self._pending[activation_id] = when or datetime.now()
+            self.touches += 1
+            if len(self._pending) >= self.max_pending:
+                self._wake()
+
+    def flush(self):
+        with self._flush_lock:
+            with self._cond:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            try:
+                database.bulk_update_last_validated(pending)
+            except Exception as e:
+                self.failed_flushes += 1
+                with self._cond:
+                    # Keep newer timestamps recorded while the flush was running
+                    for activation_id, when in pending.items():
+                        self._pending.setdefault(activation_id, when)
+                print(f"⚠️ last_validated flush failed ({len(pending)} kept): {e}")
+                return
+            self.flushes += 1
+            self.written += len(pending)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> Dict:
+        return {
+            "pending": len(self._pending),
+            "touches": self.touches,
+            "written": self.written,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+        }
+
+last_validated_writer = LastValidatedWriter()
+
+def touch_last_validated(activation_id: int):
+    """Record a successful validation; the timestamp is written on the next flush."""
+    last_validated_writer.touch(activation_id)
+
+# ============================================================================
+# Lifecycle
+# ============================================================================
+
+def start_writers():
+    validation_log_writer.start()
+    last_validated_writer.start()
+
+def stop_writers():
+    """Stop the background threads and flush whatever is still buffered."""
+    validation_log_writer.stop()
+    last_validated_writer.stop()
@@ -1,67 +0,0 @@
-function Jc(e,t){for(var n=0;n<t.length;n++){const r=t[n];if(typeof r!="string"&&!Array.isArray(r)){for(const l in r)if(l!=="default"&&!(l in e)){const i=Object.getOwnPropertyDescriptor(r,l);i&&Object.defineProperty(e,l,i.get?i:{enumerable:!0,get:()=>r[l]})}}}return Object.freeze(Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}))}(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const l of document.querySelectorAll('link[rel="modulepreload"]'))r(l);new MutationObserver(l=>{for(const i of l)if(i.type==="childList")for(const o of i.addedNodes)o.tagName==="LINK"&&o.rel==="modulepreload"&&r(o)}).observe(document,{childList:!0,subtree:!0});function n(l){const i={};return l.integrity&&(i.integrity=l.integrity),l.referrerPolicy&&(i.referrerPolicy=l.referrerPolicy),l.crossOrigin==="use-credentials"?i.credentials="include":l.crossOrigin==="anonymous"?i.credentials="omit":i.credentials="same-origin",i}function r(l){if(l.ep)return;l.ep=!0;const i=n(l);fetch(l.href,i)}})();function Zc(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var _s={exports:{}},dl={},Ns={exports:{}},R={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var ir=Symbol.for("react.element"),qc=Symbol.for("react.portal"),bc=Symbol.for("react.fragment"),ef=Symbol.for("react.strict_mode"),tf=Symbol.for("react.profiler"),nf=Symbol.for("react.provider"),rf=Symbol.for("react.context"),lf=Symbol.for("react.forward_ref"),of=Symbol.for("react.suspense"),uf=Symbol.for("react.memo"),sf=Symbol.for("react.lazy"),nu=Symbol.iterator;function af(e){return e===null||typeof e!="object"?null:(e=nu&&e[nu]||e["@@iterator"],typeof e=="function"?e:null)}var js={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},Ps=Object.assign,Ls={};function fn(e,t,n){this.props=e,this.context=t,this.refs=Ls,this.updater=n||js}fn.prototype.isReactComponent={};fn.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};fn.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function zs(){}zs.prototype=fn.prototype;function to(e,t,n){this.props=e,this.context=t,this.refs=Ls,this.updater=n||js}var no=to.prototype=new zs;no.constructor=to;Ps(no,fn.prototype);no.isPureReactComponent=!0;var ru=Array.isArray,Ts=Object.prototype.hasOwnProperty,ro={current:null},Rs={key:!0,ref:!0,__self:!0,__source:!0};function Os(e,t,n){var r,l={},i=null,o=null;if(t!=null)for(r in t.ref!==void 0&&(o=t.ref),t.key!==void 0&&(i=""+t.key),t)Ts.call(t,r)&&!Rs.hasOwnProperty(r)&&(l[r]=t[r]);var u=arguments.length-2;if(u===1)l.children=n;else if(1<u){for(var s=Array(u),a=0;a<u;a++)s[a]=arguments[a+2];l.children=s}if(e&&e.defaultProps)for(r in u=e.defaultProps,u)l[r]===void 0&&(l[r]=u[r]);return{$$typeof:ir,type:e,key:i,ref:o,props:l,_owner:ro.current}}function cf(e,t){return{$$typeof:ir,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function lo(e){return typeof e=="object"&&e!==null&&e.$$typeof===ir}function ff(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var lu=/\/+/g;function Rl(e,t){return typeof e=="object"&&e!==null&&e.key!=null?ff(""+e.key):t.toString(36)}function Lr(e,t,n,r,l){var i=typeof e;(i==="undefined"||i==="boolean")&&(e=null);var o=!1;if(e===null)o=!0;else switch(i){case"string":case"number":o=!0;break;case"object":switch(e.$$typeof){case ir:case qc:o=!0}}if(o)return o=e,l=l(o),e=r===""?"."+Rl(o,0):r,ru(l)?(n="",e!=null&&(n=e.replace(lu,"$&/")+"/"),Lr(l,t,n,"",function(a){return a})):l!=null&&(lo(l)&&(l=cf(l,n+(!l.key||o&&o.key===l.key?"":(""+l.key).replace(lu,"$&/")+"/")+e)),t.push(l)),1;if(o=0,r=r===""?".":r+":",ru(e))for(var u=0;u<e.length;u++){i=e[u];var s=r+Rl(i,u);o+=Lr(i,t,n,s,l)}else if(s=af(e),typeof s=="function")for(e=s.call(e),u=0;!(i=e.next()).done;)i=i.value,s=r+Rl(i,u++),o+=Lr(i,t,n,s,l);else if(i==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return o}function dr(e,t,n){if(e==null)return e;var r=[],l=0;return Lr(e,r,"","",function(i){return t.call(n,i,l++)}),r}function df(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var ae={current:null},zr={transition:null},pf={ReactCurrentDispatcher:ae,ReactCurrentBatchConfig:zr,ReactCurrentOwner:ro};function Ds(){throw Error("act(...) is not supported in production builds of React.")}R.Children={map:dr,forEach:function(e,t,n){dr(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return dr(e,function(){t++}),t},toArray:function(e){return dr(e,function(t){return t})||[]},only:function(e){if(!lo(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};R.Component=fn;R.Fragment=bc;R.Profiler=tf;R.PureComponent=to;R.StrictMode=ef;R.Suspense=of;R.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=pf;R.act=Ds;R.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=Ps({},e.props),l=e.key,i=e.ref,o=e._owner;if(t!=null){if(t.ref!==void 0&&(i=t.ref,o=ro.current),t.key!==void 0&&(l=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in t)Ts.call(t,s)&&!Rs.hasOwnProperty(s)&&(r[s]=t[s]===void 0&&u!==void 0?u[s]:t[s])}var s=arguments.length-2;if(s===1)r.children=n;else if(1<s){u=Array(s);for(var a=0;a<s;a++)u[a]=arguments[a+2];r.children=u}return{$$typeof:ir,type:e.type,key:l,ref:i,props:r,_owner:o}};R.createContext=function(e){return e={$$typeof:rf,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:nf,_context:e},e.Consumer=e};R.createElement=Os;R.createFactory=function(e){var t=Os.bind(null,e);return t.type=e,t};R.createRef=function(){return{current:null}};R.forwardRef=function(e){return{$$typeof:lf,render:e}};R.isValidElement=lo;R.lazy=function(e){return{$$typeof:sf,_payload:{_status:-1,_result:e},_init:df}};R.memo=function(e,t){return{$$typeof:uf,type:e,compare:t===void 0?null:t}};R.startTransition=function(e){var t=zr.transition;zr.transition={};try{e()}finally{zr.transition=t}};R.unstable_act=Ds;R.useCallback=function(e,t){return ae.current.useCallback(e,t)};R.useContext=function(e){return ae.current.useContext(e)};R.useDebugValue=function(){};R.useDeferredValue=function(e){return ae.current.useDeferredValue(e)};R.useEffect=function(e,t){return ae.current.useEffect(e,t)};R.useId=function(){return ae.current.useId()};R.useImperativeHandle=function(e,t,n){return ae.current.useImperativeHandle(e,t,n)};R.useInsertionEffect=function(e,t){return ae.current.useInsertionEffect(e,t)};R.useLayoutEffect=function(e,t){return ae.current.useLayoutEffect(e,t)};R.useMemo=function(e,t){return ae.current.useMemo(e,t)};R.useReducer=function(e,t,n){return ae.current.useReducer(e,t,n)};R.useRef=function(e){return ae.current.useRef(e)};R.useState=function(e){return ae.current.useState(e)};R.useSyncExternalStore=function(e,t,n){return ae.current.useSyncExternalStore(e,t,n)};R.useTransition=function(){return ae.current.useTransition()};R.version="18.3.1";Ns.exports=R;var k=Ns.exports;const Is=Zc(k),hf=Jc({__proto__:null,default:Is},[k]);/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var mf=k,vf=Symbol.for("react.element"),yf=Symbol.for("react.fragment"),gf=Object.prototype.hasOwnProperty,wf=mf.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,xf={key:!0,ref:!0,__self:!0,__source:!0};function Ms(e,t,n){var r,l={},i=null,o=null;n!==void 0&&(i=""+n),t.key!==void 0&&(i=""+t.key),t.ref!==void 0&&(o=t.ref);for(r in t)gf.call(t,r)&&!xf.hasOwnProperty(r)&&(l[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)l[r]===void 0&&(l[r]=t[r]);return{$$typeof:vf,type:e,key:i,ref:o,props:l,_owner:wf.current}}dl.Fragment=yf;dl.jsx=Ms;dl.jsxs=Ms;_s.exports=dl;var h=_s.exports,ii={},Fs={exports:{}},xe={},Us={exports:{}},As={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(N,z){var T=N.length;N.push(z);e:for(;0<T;){var Q=T-1>>>1,Z=N[Q];if(0<l(Z,z))N[Q]=z,N[T]=Z,T=Q;else break e}}function n(N){return N.length===0?null:N[0]}function r(N){if(N.length===0)return null;var z=N[0],T=N.pop();if(T!==z){N[0]=T;e:for(var Q=0,Z=N.length,cr=Z>>>1;Q<cr;){var St=2*(Q+1)-1,Tl=N[St],kt=St+1,fr=N[kt];if(0>l(Tl,T))kt<Z&&0>l(fr,Tl)?(N[Q]=fr,N[kt]=T,Q=kt):(N[Q]=Tl,N[St]=T,Q=St);else if(kt<Z&&0>l(fr,T))N[Q]=fr,N[kt]=T,Q=kt;else break e}}return z}function l(N,z){var T=N.sortIndex-z.sortIndex;return T!==0?T:N.id-z.id}if(typeof performance=="object"&&typeof performance.now=="function"){var i=performance;e.unstable_now=function(){return i.now()}}else{var o=Date,u=o.now();e.unstable_now=function(){return o.now()-u}}var s=[],a=[],m=1,d=null,v=3,y=!1,g=!1,x=!1,C=typeof setTimeout=="function"?setTimeout:null,f=typeof clearTimeout=="function"?clearTimeout:null,c=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function p(N){for(var z=n(a);z!==null;){if(z.callback===null)r(a);else if(z.startTime<=N)r(a),z.sortIndex=z.expirationTime,t(s,z);else break;z=n(a)}}function w(N){if(x=!1,p(N),!g)if(n(s)!==null)g=!0,Ll(E);else{var z=n(a);z!==null&&zl(w,z.startTime-N)}}function E(N,z){g=!1,x&&(x=!1,f(L),L=-1),y=!0;var T=v;try{for(p(z),d=n(s);d!==null&&(!(d.expirationTime>z)||N&&!Pe());){var Q=d.callback;if(typeof Q=="function"){d.callback=null,v=d.priorityLevel;var Z=Q(d.expirationTime<=z);z=e.unstable_now(),typeof Z=="function"?d.callback=Z:d===n(s)&&r(s),p(z)}else r(s);d=n(s)}if(d!==null)var cr=!0;else{var St=n(a);St!==null&&zl(w,St.startTime-z),cr=!1}return cr}finally{d=null,v=T,y=!1}}var j=!1,P=null,L=-1,H=5,O=-1;function Pe(){return!(e.unstable_now()-O<H)}function yn(){if(P!==null){var N=e.unstable_now();O=N;var z=!0;try{z=P(!0,N)}finally{z?gn():(j=!1,P=null)}}else j=!1}var gn;if(typeof c=="function")gn=function(){c(yn)};else if(typeof MessageChannel<"u"){var tu=new MessageChannel,Xc=tu.port2;tu.port1.onmessage=yn,gn=function(){Xc.postMessage(null)}}else gn=function(){C(yn,0)};function Ll(N){P=N,j||(j=!0,gn())}function zl(N,z){L=C(function(){N(e.unstable_now())},z)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(N){N.callback=null},e.unstable_continueExecution=function(){g||y||(g=!0,Ll(E))},e.unstable_forceFrameRate=function(N){0>N||125<N?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):H=0<N?Math.floor(1e3/N):5},e.unstable_getCurrentPriorityLevel=function(){return v},e.unstable_getFirstCallbackNode=function(){return n(s)},e.unstable_next=function(N){switch(v){case 1:case 2:case 3:var z=3;break;default:z=v}var T=v;v=z;try{return N()}finally{v=T}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(N,z){switch(N){case 1:case 2:case 3:case 4:case 5:break;default:N=3}var T=v;v=N;try{return z()}finally{v=T}},e.unstable_scheduleCallback=function(N,z,T){var Q=e.unstable_now();switch(typeof T=="object"&&T!==null?(T=T.delay,T=typeof T=="number"&&0<T?Q+T:Q):T=Q,N){case 1:var Z=-1;break;case 2:Z=250;break;case 5:Z=1073741823;break;case 4:Z=1e4;break;default:Z=5e3}return Z=T+Z,N={id:m++,callback:z,priorityLevel:N,startTime:T,expirationTime:Z,sortIndex:-1},T>Q?(N.sortIndex=T,t(a,N),n(s)===null&&N===n(a)&&(x?(f(L),L=-1):x=!0,zl(w,T-Q))):(N.sortIndex=Z,t(s,N),g||y||(g=!0,Ll(E))),N},e.unstable_shouldYield=Pe,e.unstable_wrapCallback=function(N){var z=v;return function(){var T=v;v=z;try{return N.apply(this,arguments)}finally{v=T}}}})(As);Us.exports=As;var Sf=Us.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var kf=k,we=Sf;function S(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var Bs=new Set,Bn={};function Mt(e,t){rn(e,t),rn(e+"Capture",t)}function rn(e,t){for(Bn[e]=t,e=0;e<t.length;e++)Bs.add(t[e])}var Ke=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),oi=Object.prototype.hasOwnProperty,Ef=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,iu={},ou={};function Cf(e){return oi.call(ou,e)?!0:oi.call(iu,e)?!1:Ef.test(e)?ou[e]=!0:(iu[e]=!0,!1)}function _f(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function Nf(e,t,n,r){if(t===null||typeof t>"u"||_f(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function ce(e,t,n,r,l,i,o){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=i,this.removeEmptyString=o}var ne={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){ne[e]=new ce(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];ne[t]=new ce(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){ne[e]=new ce(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){ne[e]=new ce(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){ne[e]=new ce(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){ne[e]=new ce(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){ne[e]=new ce(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){ne[e]=new ce(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){ne[e]=new ce(e,5,!1,e.toLowerCase(),null,!1,!1)});var io=/[\-:]([a-z])/g;function oo(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(io,oo);ne[t]=new ce(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(io,oo);ne[t]=new ce(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(io,oo);ne[t]=new ce(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){ne[e]=new ce(e,1,!1,e.toLowerCase(),null,!1,!1)});ne.xlinkHref=new ce("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){ne[e]=new ce(e,1,!1,e.toLowerCase(),null,!0,!0)});function uo(e,t,n,r){var l=ne.hasOwnProperty(t)?ne[t]:null;(l!==null?l.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(Nf(t,n,l,r)&&(n=null),r||l===null?Cf(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):l.mustUseProperty?e[l.propertyName]=n===null?l.type===3?!1:"":n:(t=l.attributeName,r=l.attributeNamespace,n===null?e.removeAttribute(t):(l=l.type,n=l===3||l===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var Je=kf.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,pr=Symbol.for("react.element"),At=Symbol.for("react.portal"),Bt=Symbol.for("react.fragment"),so=Symbol.for("react.strict_mode"),ui=Symbol.for("react.profiler"),$s=Symbol.for("react.provider"),Vs=Symbol.for("react.context"),ao=Symbol.for("react.forward_ref"),si=Symbol.for("react.suspense"),ai=Symbol.for("react.suspense_list"),co=Symbol.for("react.memo"),qe=Symbol.for("react.lazy"),Ws=Symbol.for("react.offscreen"),uu=Symbol.iterator;function wn(e){return e===null||typeof e!="object"?null:(e=uu&&e[uu]||e["@@iterator"],typeof e=="function"?e:null)}var V=Object.assign,Ol;function jn(e){if(Ol===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ol=t&&t[1]||""}return`
-`+Ol+e}var Dl=!1;function Il(e,t){if(!e||Dl)return"";Dl=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(a){var r=a}Reflect.construct(e,[],t)}else{try{t.call()}catch(a){r=a}e.call(t.prototype)}else{try{throw Error()}catch(a){r=a}e()}}catch(a){if(a&&r&&typeof a.stack=="string"){for(var l=a.stack.split(`
-`),i=r.stack.split(`
-`),o=l.length-1,u=i.length-1;1<=o&&0<=u&&l[o]!==i[u];)u--;for(;1<=o&&0<=u;o--,u--)if(l[o]!==i[u]){if(o!==1||u!==1)do if(o--,u--,0>u||l[o]!==i[u]){var s=`
-`+l[o].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=o&&0<=u);break}}}finally{Dl=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?jn(e):""}function jf(e){switch(e.tag){case 5:return jn(e.type);case 16:return jn("Lazy");case 13:return jn("Suspense");case 19:return jn("SuspenseList");case 0:case 2:case 15:return e=Il(e.type,!1),e;case 11:return e=Il(e.type.render,!1),e;case 1:return e=Il(e.type,!0),e;default:return""}}function ci(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case Bt:return"Fragment";case At:return"Portal";case ui:return"Profiler";case so:return"StrictMode";case si:return"Suspense";case ai:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case Vs:return(e.displayName||"Context")+".Consumer";case $s:return(e._context.displayName||"Context")+".Provider";case ao:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case co:return t=e.displayName||null,t!==null?t:ci(e.type)||"Memo";case qe:t=e._payload,e=e._init;try{return ci(e(t))}catch{}}return null}function Pf(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return ci(t);case 8:return t===so?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function ht(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Hs(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Lf(e){var t=Hs(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,i=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(o){r=""+o,i.call(this,o)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(o){r=""+o},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function hr(e){e._valueTracker||(e._valueTracker=Lf(e))}function Qs(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Hs(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function $r(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function fi(e,t){var n=t.checked;return V({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function su(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=ht(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function Ks(e,t){t=t.checked,t!=null&&uo(e,"checked",t,!1)}function di(e,t){Ks(e,t);var n=ht(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?pi(e,t.type,n):t.hasOwnProperty("defaultValue")&&pi(e,t.type,ht(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function au(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function pi(e,t,n){(t!=="number"||$r(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var Pn=Array.isArray;function Zt(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ht(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function hi(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(S(91));return V({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function cu(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(S(92));if(Pn(n)){if(1<n.length)throw Error(S(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:ht(n)}}function Ys(e,t){var n=ht(t.value),r=ht(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function fu(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function Gs(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function mi(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?Gs(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var mr,Xs=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(mr=mr||document.createElement("div"),mr.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=mr.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function $n(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Tn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},zf=["Webkit","ms","Moz","O"];Object.keys(Tn).forEach(function(e){zf.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Tn[t]=Tn[e]})});function Js(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Tn.hasOwnProperty(e)&&Tn[e]?(""+t).trim():t+"px"}function Zs(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=Js(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var Tf=V({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function vi(e,t){if(t){if(Tf[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(S(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(S(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(S(61))}if(t.style!=null&&typeof t.style!="object")throw Error(S(62))}}function yi(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var gi=null;function fo(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var wi=null,qt=null,bt=null;function du(e){if(e=sr(e)){if(typeof wi!="function")throw Error(S(280));var t=e.stateNode;t&&(t=yl(t),wi(e.stateNode,e.type,t))}}function qs(e){qt?bt?bt.push(e):bt=[e]:qt=e}function bs(){if(qt){var e=qt,t=bt;if(bt=qt=null,du(e),t)for(e=0;e<t.length;e++)du(t[e])}}function ea(e,t){return e(t)}function ta(){}var Ml=!1;function na(e,t,n){if(Ml)return e(t,n);Ml=!0;try{return ea(e,t,n)}finally{Ml=!1,(qt!==null||bt!==null)&&(ta(),bs())}}function Vn(e,t){var n=e.stateNode;if(n===null)return null;var r=yl(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(S(231,t,typeof n));return n}var xi=!1;if(Ke)try{var xn={};Object.defineProperty(xn,"passive",{get:function(){xi=!0}}),window.addEventListener("test",xn,xn),window.removeEventListener("test",xn,xn)}catch{xi=!1}function Rf(e,t,n,r,l,i,o,u,s){var a=Array.prototype.slice.call(arguments,3);try{t.apply(n,a)}catch(m){this.onError(m)}}var Rn=!1,Vr=null,Wr=!1,Si=null,Of={onError:function(e){Rn=!0,Vr=e}};function Df(e,t,n,r,l,i,o,u,s){Rn=!1,Vr=null,Rf.apply(Of,arguments)}function If(e,t,n,r,l,i,o,u,s){if(Df.apply(this,arguments),Rn){if(Rn){var a=Vr;Rn=!1,Vr=null}else throw Error(S(198));Wr||(Wr=!0,Si=a)}}function Ft(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function ra(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function pu(e){if(Ft(e)!==e)throw Error(S(188))}function Mf(e){var t=e.alternate;if(!t){if(t=Ft(e),t===null)throw Error(S(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var i=l.alternate;if(i===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===i.child){for(i=l.child;i;){if(i===n)return pu(l),e;if(i===r)return pu(l),t;i=i.sibling}throw Error(S(188))}if(n.return!==r.return)n=l,r=i;else{for(var o=!1,u=l.child;u;){if(u===n){o=!0,n=l,r=i;break}if(u===r){o=!0,r=l,n=i;break}u=u.sibling}if(!o){for(u=i.child;u;){if(u===n){o=!0,n=i,r=l;break}if(u===r){o=!0,r=i,n=l;break}u=u.sibling}if(!o)throw Error(S(189))}}if(n.alternate!==r)throw Error(S(190))}if(n.tag!==3)throw Error(S(188));return n.stateNode.current===n?e:t}function la(e){return e=Mf(e),e!==null?ia(e):null}function ia(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=ia(e);if(t!==null)return t;e=e.sibling}return null}var oa=we.unstable_scheduleCallback,hu=we.unstable_cancelCallback,Ff=we.unstable_shouldYield,Uf=we.unstable_requestPaint,K=we.unstable_now,Af=we.unstable_getCurrentPriorityLevel,po=we.unstable_ImmediatePriority,ua=we.unstable_UserBlockingPriority,Hr=we.unstable_NormalPriority,Bf=we.unstable_LowPriority,sa=we.unstable_IdlePriority,pl=null,Ae=null;function $f(e){if(Ae&&typeof Ae.onCommitFiberRoot=="function")try{Ae.onCommitFiberRoot(pl,e,void 0,(e.current.flags&128)===128)}catch{}}var Oe=Math.clz32?Math.clz32:Hf,Vf=Math.log,Wf=Math.LN2;function Hf(e){return e>>>=0,e===0?32:31-(Vf(e)/Wf|0)|0}var vr=64,yr=4194304;function Ln(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Qr(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,i=e.pingedLanes,o=n&268435455;if(o!==0){var u=o&~l;u!==0?r=Ln(u):(i&=o,i!==0&&(r=Ln(i)))}else o=n&~l,o!==0?r=Ln(o):i!==0&&(r=Ln(i));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,i=t&-t,l>=i||l===16&&(i&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Oe(t),l=1<<n,r|=e[n],t&=~l;return r}function Qf(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Kf(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,i=e.pendingLanes;0<i;){var o=31-Oe(i),u=1<<o,s=l[o];s===-1?(!(u&n)||u&r)&&(l[o]=Qf(u,t)):s<=t&&(e.expiredLanes|=u),i&=~u}}function ki(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function aa(){var e=vr;return vr<<=1,!(vr&4194240)&&(vr=64),e}function Fl(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function or(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Oe(t),e[t]=n}function Yf(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Oe(n),i=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~i}}function ho(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Oe(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var I=0;function ca(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var fa,mo,da,pa,ha,Ei=!1,gr=[],it=null,ot=null,ut=null,Wn=new Map,Hn=new Map,et=[],Gf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function mu(e,t){switch(e){case"focusin":case"focusout":it=null;break;case"dragenter":case"dragleave":ot=null;break;case"mouseover":case"mouseout":ut=null;break;case"pointerover":case"pointerout":Wn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Hn.delete(t.pointerId)}}function Sn(e,t,n,r,l,i){return e===null||e.nativeEvent!==i?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:i,targetContainers:[l]},t!==null&&(t=sr(t),t!==null&&mo(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function Xf(e,t,n,r,l){switch(t){case"focusin":return it=Sn(it,e,t,n,r,l),!0;case"dragenter":return ot=Sn(ot,e,t,n,r,l),!0;case"mouseover":return ut=Sn(ut,e,t,n,r,l),!0;case"pointerover":var i=l.pointerId;return Wn.set(i,Sn(Wn.get(i)||null,e,t,n,r,l)),!0;case"gotpointercapture":return i=l.pointerId,Hn.set(i,Sn(Hn.get(i)||null,e,t,n,r,l)),!0}return!1}function ma(e){var t=_t(e.target);if(t!==null){var n=Ft(t);if(n!==null){if(t=n.tag,t===13){if(t=ra(n),t!==null){e.blockedOn=t,ha(e.priority,function(){da(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Tr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=Ci(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);gi=r,n.target.dispatchEvent(r),gi=null}else return t=sr(n),t!==null&&mo(t),e.blockedOn=n,!1;t.shift()}return!0}function vu(e,t,n){Tr(e)&&n.delete(t)}function Jf(){Ei=!1,it!==null&&Tr(it)&&(it=null),ot!==null&&Tr(ot)&&(ot=null),ut!==null&&Tr(ut)&&(ut=null),Wn.forEach(vu),Hn.forEach(vu)}function kn(e,t){e.blockedOn===t&&(e.blockedOn=null,Ei||(Ei=!0,we.unstable_scheduleCallback(we.unstable_NormalPriority,Jf)))}function Qn(e){function t(l){return kn(l,e)}if(0<gr.length){kn(gr[0],e);for(var n=1;n<gr.length;n++){var r=gr[n];r.blockedOn===e&&(r.blockedOn=null)}}for(it!==null&&kn(it,e),ot!==null&&kn(ot,e),ut!==null&&kn(ut,e),Wn.forEach(t),Hn.forEach(t),n=0;n<et.length;n++)r=et[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<et.length&&(n=et[0],n.blockedOn===null);)ma(n),n.blockedOn===null&&et.shift()}var en=Je.ReactCurrentBatchConfig,Kr=!0;function Zf(e,t,n,r){var l=I,i=en.transition;en.transition=null;try{I=1,vo(e,t,n,r)}finally{I=l,en.transition=i}}function qf(e,t,n,r){var l=I,i=en.transition;en.transition=null;try{I=4,vo(e,t,n,r)}finally{I=l,en.transition=i}}function vo(e,t,n,r){if(Kr){var l=Ci(e,t,n,r);if(l===null)Yl(e,t,r,Yr,n),mu(e,r);else if(Xf(l,e,t,n,r))r.stopPropagation();else if(mu(e,r),t&4&&-1<Gf.indexOf(e)){for(;l!==null;){var i=sr(l);if(i!==null&&fa(i),i=Ci(e,t,n,r),i===null&&Yl(e,t,r,Yr,n),i===l)break;l=i}l!==null&&r.stopPropagation()}else Yl(e,t,r,null,n)}}var Yr=null;function Ci(e,t,n,r){if(Yr=null,e=fo(r),e=_t(e),e!==null)if(t=Ft(e),t===null)e=null;else if(n=t.tag,n===13){if(e=ra(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Yr=e,null}function va(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Af()){case po:return 1;case ua:return 4;case Hr:case Bf:return 16;case sa:return 536870912;default:return 16}default:return 16}}var nt=null,yo=null,Rr=null;function ya(){if(Rr)return Rr;var e,t=yo,n=t.length,r,l="value"in nt?nt.value:nt.textContent,i=l.length;for(e=0;e<n&&t[e]===l[e];e++);var o=n-e;for(r=1;r<=o&&t[n-r]===l[i-r];r++);return Rr=l.slice(e,1<r?1-r:void 0)}function Or(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function wr(){return!0}function yu(){return!1}function Se(e){function t(n,r,l,i,o){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=i,this.target=o,this.currentTarget=null;for(var u in e)e.hasOwnProperty(u)&&(n=e[u],this[u]=n?n(i):i[u]);return this.isDefaultPrevented=(i.defaultPrevented!=null?i.defaultPrevented:i.returnValue===!1)?wr:yu,this.isPropagationStopped=yu,this}return V(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=wr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=wr)},persist:function(){},isPersistent:wr}),t}var dn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},go=Se(dn),ur=V({},dn,{view:0,detail:0}),bf=Se(ur),Ul,Al,En,hl=V({},ur,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:wo,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==En&&(En&&e.type==="mousemove"?(Ul=e.screenX-En.screenX,Al=e.screenY-En.screenY):Al=Ul=0,En=e),Ul)},movementY:function(e){return"movementY"in e?e.movementY:Al}}),gu=Se(hl),ed=V({},hl,{dataTransfer:0}),td=Se(ed),nd=V({},ur,{relatedTarget:0}),Bl=Se(nd),rd=V({},dn,{animationName:0,elapsedTime:0,pseudoElement:0}),ld=Se(rd),id=V({},dn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),od=Se(id),ud=V({},dn,{data:0}),wu=Se(ud),sd={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},ad={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},cd={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function fd(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=cd[e])?!!t[e]:!1}function wo(){return fd}var dd=V({},ur,{key:function(e){if(e.key){var t=sd[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Or(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?ad[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:wo,charCode:function(e){return e.type==="keypress"?Or(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Or(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),pd=Se(dd),hd=V({},hl,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),xu=Se(hd),md=V({},ur,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:wo}),vd=Se(md),yd=V({},dn,{propertyName:0,elapsedTime:0,pseudoElement:0}),gd=Se(yd),wd=V({},hl,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),xd=Se(wd),Sd=[9,13,27,32],xo=Ke&&"CompositionEvent"in window,On=null;Ke&&"documentMode"in document&&(On=document.documentMode);var kd=Ke&&"TextEvent"in window&&!On,ga=Ke&&(!xo||On&&8<On&&11>=On),Su=" ",ku=!1;function wa(e,t){switch(e){case"keyup":return Sd.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function xa(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var $t=!1;function Ed(e,t){switch(e){case"compositionend":return xa(t);case"keypress":return t.which!==32?null:(ku=!0,Su);case"textInput":return e=t.data,e===Su&&ku?null:e;default:return null}}function Cd(e,t){if($t)return e==="compositionend"||!xo&&wa(e,t)?(e=ya(),Rr=yo=nt=null,$t=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return ga&&t.locale!=="ko"?null:t.data;default:return null}}var _d={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Eu(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!_d[e.type]:t==="textarea"}function Sa(e,t,n,r){qs(r),t=Gr(t,"onChange"),0<t.length&&(n=new go("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Dn=null,Kn=null;function Nd(e){Ra(e,0)}function ml(e){var t=Ht(e);if(Qs(t))return e}function jd(e,t){if(e==="change")return t}var ka=!1;if(Ke){var $l;if(Ke){var Vl="oninput"in document;if(!Vl){var Cu=document.createElement("div");Cu.setAttribute("oninput","return;"),Vl=typeof Cu.oninput=="function"}$l=Vl}else $l=!1;ka=$l&&(!document.documentMode||9<document.documentMode)}function _u(){Dn&&(Dn.detachEvent("onpropertychange",Ea),Kn=Dn=null)}function Ea(e){if(e.propertyName==="value"&&ml(Kn)){var t=[];Sa(t,Kn,e,fo(e)),na(Nd,t)}}function Pd(e,t,n){e==="focusin"?(_u(),Dn=t,Kn=n,Dn.attachEvent("onpropertychange",Ea)):e==="focusout"&&_u()}function Ld(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return ml(Kn)}function zd(e,t){if(e==="click")return ml(t)}function Td(e,t){if(e==="input"||e==="change")return ml(t)}function Rd(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Ie=typeof Object.is=="function"?Object.is:Rd;function Yn(e,t){if(Ie(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!oi.call(t,l)||!Ie(e[l],t[l]))return!1}return!0}function Nu(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function ju(e,t){var n=Nu(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=Nu(n)}}function Ca(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Ca(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function _a(){for(var e=window,t=$r();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=$r(e.document)}return t}function So(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Od(e){var t=_a(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Ca(n.ownerDocument.documentElement,n)){if(r!==null&&So(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,i=Math.min(r.start,l);r=r.end===void 0?i:Math.min(r.end,l),!e.extend&&i>r&&(l=r,r=i,i=l),l=ju(n,i);var o=ju(n,r);l&&o&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),i>r?(e.addRange(t),e.extend(o.node,o.offset)):(t.setEnd(o.node,o.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var Dd=Ke&&"documentMode"in document&&11>=document.documentMode,Vt=null,_i=null,In=null,Ni=!1;function Pu(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;Ni||Vt==null||Vt!==$r(r)||(r=Vt,"selectionStart"in r&&So(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),In&&Yn(In,r)||(In=r,r=Gr(_i,"onSelect"),0<r.length&&(t=new go("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=Vt)))}function xr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Wt={animationend:xr("Animation","AnimationEnd"),animationiteration:xr("Animation","AnimationIteration"),animationstart:xr("Animation","AnimationStart"),transitionend:xr("Transition","TransitionEnd")},Wl={},Na={};Ke&&(Na=document.createElement("div").style,"AnimationEvent"in window||(delete Wt.animationend.animation,delete Wt.animationiteration.animation,delete Wt.animationstart.animation),"TransitionEvent"in window||delete Wt.transitionend.transition);function vl(e){if(Wl[e])return Wl[e];if(!Wt[e])return e;var t=Wt[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Na)return Wl[e]=t[n];return e}var ja=vl("animationend"),Pa=vl("animationiteration"),La=vl("animationstart"),za=vl("transitionend"),Ta=new Map,Lu="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function vt(e,t){Ta.set(e,t),Mt(t,[e])}for(var Hl=0;Hl<Lu.length;Hl++){var Ql=Lu[Hl],Id=Ql.toLowerCase(),Md=Ql[0].toUpperCase()+Ql.slice(1);vt(Id,"on"+Md)}vt(ja,"onAnimationEnd");vt(Pa,"onAnimationIteration");vt(La,"onAnimationStart");vt("dblclick","onDoubleClick");vt("focusin","onFocus");vt("focusout","onBlur");vt(za,"onTransitionEnd");rn("onMouseEnter",["mouseout","mouseover"]);rn("onMouseLeave",["mouseout","mouseover"]);rn("onPointerEnter",["pointerout","pointerover"]);rn("onPointerLeave",["pointerout","pointerover"]);Mt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Mt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Mt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Mt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Mt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Mt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var zn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Fd=new Set("cancel close invalid load scroll toggle".split(" ").concat(zn));function zu(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,If(r,t,void 0,e),e.currentTarget=null}function Ra(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var i=void 0;if(t)for(var o=r.length-1;0<=o;o--){var u=r[o],s=u.instance,a=u.currentTarget;if(u=u.listener,s!==i&&l.isPropagationStopped())break e;zu(l,u,a),i=s}else for(o=0;o<r.length;o++){if(u=r[o],s=u.instance,a=u.currentTarget,u=u.listener,s!==i&&l.isPropagationStopped())break e;zu(l,u,a),i=s}}}if(Wr)throw e=Si,Wr=!1,Si=null,e}function F(e,t){var n=t[Ti];n===void 0&&(n=t[Ti]=new Set);var r=e+"__bubble";n.has(r)||(Oa(t,e,2,!1),n.add(r))}function Kl(e,t,n){var r=0;t&&(r|=4),Oa(n,e,r,t)}var Sr="_reactListening"+Math.random().toString(36).slice(2);function Gn(e){if(!e[Sr]){e[Sr]=!0,Bs.forEach(function(n){n!=="selectionchange"&&(Fd.has(n)||Kl(n,!1,e),Kl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Sr]||(t[Sr]=!0,Kl("selectionchange",!1,t))}}function Oa(e,t,n,r){switch(va(t)){case 1:var l=Zf;break;case 4:l=qf;break;default:l=vo}n=l.bind(null,t,n,e),l=void 0,!xi||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Yl(e,t,n,r,l){var i=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var o=r.tag;if(o===3||o===4){var u=r.stateNode.containerInfo;if(u===l||u.nodeType===8&&u.parentNode===l)break;if(o===4)for(o=r.return;o!==null;){var s=o.tag;if((s===3||s===4)&&(s=o.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;o=o.return}for(;u!==null;){if(o=_t(u),o===null)return;if(s=o.tag,s===5||s===6){r=i=o;continue e}u=u.parentNode}}r=r.return}na(function(){var a=i,m=fo(n),d=[];e:{var v=Ta.get(e);if(v!==void 0){var y=go,g=e;switch(e){case"keypress":if(Or(n)===0)break e;case"keydown":case"keyup":y=pd;break;case"focusin":g="focus",y=Bl;break;case"focusout":g="blur",y=Bl;break;case"beforeblur":case"afterblur":y=Bl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":y=gu;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":y=td;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":y=vd;break;case ja:case Pa:case La:y=ld;break;case za:y=gd;break;case"scroll":y=bf;break;case"wheel":y=xd;break;case"copy":case"cut":case"paste":y=od;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":y=xu}var x=(t&4)!==0,C=!x&&e==="scroll",f=x?v!==null?v+"Capture":null:v;x=[];for(var c=a,p;c!==null;){p=c;var w=p.stateNode;if(p.tag===5&&w!==null&&(p=w,f!==null&&(w=Vn(c,f),w!=null&&x.push(Xn(c,w,p)))),C)break;c=c.return}0<x.length&&(v=new y(v,g,null,n,m),d.push({event:v,listeners:x}))}}if(!(t&7)){e:{if(v=e==="mouseover"||e==="pointerover",y=e==="mouseout"||e==="pointerout",v&&n!==gi&&(g=n.relatedTarget||n.fromElement)&&(_t(g)||g[Ye]))break e;if((y||v)&&(v=m.window===m?m:(v=m.ownerDocument)?v.defaultView||v.parentWindow:window,y?(g=n.relatedTarget||n.toElement,y=a,g=g?_t(g):null,g!==null&&(C=Ft(g),g!==C||g.tag!==5&&g.tag!==6)&&(g=null)):(y=null,g=a),y!==g)){if(x=gu,w="onMouseLeave",f="onMouseEnter",c="mouse",(e==="pointerout"||e==="pointerover")&&(x=xu,w="onPointerLeave",f="onPointerEnter",c="pointer"),C=y==null?v:Ht(y),p=g==null?v:Ht(g),v=new x(w,c+"leave",y,n,m),v.target=C,v.relatedTarget=p,w=null,_t(m)===a&&(x=new x(f,c+"enter",g,n,m),x.target=p,x.relatedTarget=C,w=x),C=w,y&&g)t:{for(x=y,f=g,c=0,p=x;p;p=Ut(p))c++;for(p=0,w=f;w;w=Ut(w))p++;for(;0<c-p;)x=Ut(x),c--;for(;0<p-c;)f=Ut(f),p--;for(;c--;){if(x===f||f!==null&&x===f.alternate)break t;x=Ut(x),f=Ut(f)}x=null}else x=null;y!==null&&Tu(d,v,y,x,!1),g!==null&&C!==null&&Tu(d,C,g,x,!0)}}e:{if(v=a?Ht(a):window,y=v.nodeName&&v.nodeName.toLowerCase(),y==="select"||y==="input"&&v.type==="file")var E=jd;else if(Eu(v))if(ka)E=Td;else{E=Ld;var j=Pd}else(y=v.nodeName)&&y.toLowerCase()==="input"&&(v.type==="checkbox"||v.type==="radio")&&(E=zd);if(E&&(E=E(e,a))){Sa(d,E,n,m);break e}j&&j(e,v,a),e==="focusout"&&(j=v._wrapperState)&&j.controlled&&v.type==="number"&&pi(v,"number",v.value)}switch(j=a?Ht(a):window,e){case"focusin":(Eu(j)||j.contentEditable==="true")&&(Vt=j,_i=a,In=null);break;case"focusout":In=_i=Vt=null;break;case"mousedown":Ni=!0;break;case"contextmenu":case"mouseup":case"dragend":Ni=!1,Pu(d,n,m);break;case"selectionchange":if(Dd)break;case"keydown":case"keyup":Pu(d,n,m)}var P;if(xo)e:{switch(e){case"compositionstart":var L="onCompositionStart";break e;case"compositionend":L="onCompositionEnd";break e;case"compositionupdate":L="onCompositionUpdate";break e}L=void 0}else $t?wa(e,n)&&(L="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(L="onCompositionStart");L&&(ga&&n.locale!=="ko"&&($t||L!=="onCompositionStart"?L==="onCompositionEnd"&&$t&&(P=ya()):(nt=m,yo="value"in nt?nt.value:nt.textContent,$t=!0)),j=Gr(a,L),0<j.length&&(L=new wu(L,e,null,n,m),d.push({event:L,listeners:j}),P?L.data=P:(P=xa(n),P!==null&&(L.data=P)))),(P=kd?Ed(e,n):Cd(e,n))&&(a=Gr(a,"onBeforeInput"),0<a.length&&(m=new wu("onBeforeInput","beforeinput",null,n,m),d.push({event:m,listeners:a}),m.data=P))}Ra(d,t)})}function Xn(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Gr(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,i=l.stateNode;l.tag===5&&i!==null&&(l=i,i=Vn(e,n),i!=null&&r.unshift(Xn(e,i,l)),i=Vn(e,t),i!=null&&r.push(Xn(e,i,l))),e=e.return}return r}function Ut(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Tu(e,t,n,r,l){for(var i=t._reactName,o=[];n!==null&&n!==r;){var u=n,s=u.alternate,a=u.stateNode;if(s!==null&&s===r)break;u.tag===5&&a!==null&&(u=a,l?(s=Vn(n,i),s!=null&&o.unshift(Xn(n,s,u))):l||(s=Vn(n,i),s!=null&&o.push(Xn(n,s,u)))),n=n.return}o.length!==0&&e.push({event:t,listeners:o})}var Ud=/\r\n?/g,Ad=/\u0000|\uFFFD/g;function Ru(e){return(typeof e=="string"?e:""+e).replace(Ud,`
-`).replace(Ad,"")}function kr(e,t,n){if(t=Ru(t),Ru(e)!==t&&n)throw Error(S(425))}function Xr(){}var ji=null,Pi=null;function Li(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var zi=typeof setTimeout=="function"?setTimeout:void 0,Bd=typeof clearTimeout=="function"?clearTimeout:void 0,Ou=typeof Promise=="function"?Promise:void 0,$d=typeof queueMicrotask=="function"?queueMicrotask:typeof Ou<"u"?function(e){return Ou.resolve(null).then(e).catch(Vd)}:zi;function Vd(e){setTimeout(function(){throw e})}function Gl(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),Qn(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);Qn(t)}function st(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function Du(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var pn=Math.random().toString(36).slice(2),Ue="__reactFiber$"+pn,Jn="__reactProps$"+pn,Ye="__reactContainer$"+pn,Ti="__reactEvents$"+pn,Wd="__reactListeners$"+pn,Hd="__reactHandles$"+pn;function _t(e){var t=e[Ue];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Ye]||n[Ue]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Du(e);e!==null;){if(n=e[Ue])return n;e=Du(e)}return t}e=n,n=e.parentNode}return null}function sr(e){return e=e[Ue]||e[Ye],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Ht(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(S(33))}function yl(e){return e[Jn]||null}var Ri=[],Qt=-1;function yt(e){return{current:e}}function U(e){0>Qt||(e.current=Ri[Qt],Ri[Qt]=null,Qt--)}function M(e,t){Qt++,Ri[Qt]=e.current,e.current=t}var mt={},oe=yt(mt),pe=yt(!1),Tt=mt;function ln(e,t){var n=e.type.contextTypes;if(!n)return mt;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},i;for(i in n)l[i]=t[i];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function he(e){return e=e.childContextTypes,e!=null}function Jr(){U(pe),U(oe)}function Iu(e,t,n){if(oe.current!==mt)throw Error(S(168));M(oe,t),M(pe,n)}function Da(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(S(108,Pf(e)||"Unknown",l));return V({},n,r)}function Zr(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||mt,Tt=oe.current,M(oe,e),M(pe,pe.current),!0}function Mu(e,t,n){var r=e.stateNode;if(!r)throw Error(S(169));n?(e=Da(e,t,Tt),r.__reactInternalMemoizedMergedChildContext=e,U(pe),U(oe),M(oe,e)):U(pe),M(pe,n)}var Ve=null,gl=!1,Xl=!1;function Ia(e){Ve===null?Ve=[e]:Ve.push(e)}function Qd(e){gl=!0,Ia(e)}function gt(){if(!Xl&&Ve!==null){Xl=!0;var e=0,t=I;try{var n=Ve;for(I=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}Ve=null,gl=!1}catch(l){throw Ve!==null&&(Ve=Ve.slice(e+1)),oa(po,gt),l}finally{I=t,Xl=!1}}return null}var Kt=[],Yt=0,qr=null,br=0,ke=[],Ee=0,Rt=null,We=1,He="";function Et(e,t){Kt[Yt++]=br,Kt[Yt++]=qr,qr=e,br=t}function Ma(e,t,n){ke[Ee++]=We,ke[Ee++]=He,ke[Ee++]=Rt,Rt=e;var r=We;e=He;var l=32-Oe(r)-1;r&=~(1<<l),n+=1;var i=32-Oe(t)+l;if(30<i){var o=l-l%5;i=(r&(1<<o)-1).toString(32),r>>=o,l-=o,We=1<<32-Oe(t)+l|n<<l|r,He=i+e}else We=1<<i|n<<l|r,He=e}function ko(e){e.return!==null&&(Et(e,1),Ma(e,1,0))}function Eo(e){for(;e===qr;)qr=Kt[--Yt],Kt[Yt]=null,br=Kt[--Yt],Kt[Yt]=null;for(;e===Rt;)Rt=ke[--Ee],ke[Ee]=null,He=ke[--Ee],ke[Ee]=null,We=ke[--Ee],ke[Ee]=null}var ge=null,ye=null,A=!1,Re=null;function Fa(e,t){var n=Ce(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Fu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,ge=e,ye=st(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,ge=e,ye=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Rt!==null?{id:We,overflow:He}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=Ce(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,ge=e,ye=null,!0):!1;default:return!1}}function Oi(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Di(e){if(A){var t=ye;if(t){var n=t;if(!Fu(e,t)){if(Oi(e))throw Error(S(418));t=st(n.nextSibling);var r=ge;t&&Fu(e,t)?Fa(r,n):(e.flags=e.flags&-4097|2,A=!1,ge=e)}}else{if(Oi(e))throw Error(S(418));e.flags=e.flags&-4097|2,A=!1,ge=e}}}function Uu(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;ge=e}function Er(e){if(e!==ge)return!1;if(!A)return Uu(e),A=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!Li(e.type,e.memoizedProps)),t&&(t=ye)){if(Oi(e))throw Ua(),Error(S(418));for(;t;)Fa(e,t),t=st(t.nextSibling)}if(Uu(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(S(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){ye=st(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}ye=null}}else ye=ge?st(e.stateNode.nextSibling):null;return!0}function Ua(){for(var e=ye;e;)e=st(e.nextSibling)}function on(){ye=ge=null,A=!1}function Co(e){Re===null?Re=[e]:Re.push(e)}var Kd=Je.ReactCurrentBatchConfig;function Cn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(S(309));var r=n.stateNode}if(!r)throw Error(S(147,e));var l=r,i=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===i?t.ref:(t=function(o){var u=l.refs;o===null?delete u[i]:u[i]=o},t._stringRef=i,t)}if(typeof e!="string")throw Error(S(284));if(!n._owner)throw Error(S(290,e))}return e}function Cr(e,t){throw e=Object.prototype.toString.call(t),Error(S(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Au(e){var t=e._init;return t(e._payload)}function Aa(e){function t(f,c){if(e){var p=f.deletions;p===null?(f.deletions=[c],f.flags|=16):p.push(c)}}function n(f,c){if(!e)return null;for(;c!==null;)t(f,c),c=c.sibling;return null}function r(f,c){for(f=new Map;c!==null;)c.key!==null?f.set(c.key,c):f.set(c.index,c),c=c.sibling;return f}function l(f,c){return f=dt(f,c),f.index=0,f.sibling=null,f}function i(f,c,p){return f.index=p,e?(p=f.alternate,p!==null?(p=p.index,p<c?(f.flags|=2,c):p):(f.flags|=2,c)):(f.flags|=1048576,c)}function o(f){return e&&f.alternate===null&&(f.flags|=2),f}function u(f,c,p,w){return c===null||c.tag!==6?(c=ni(p,f.mode,w),c.return=f,c):(c=l(c,p),c.return=f,c)}function s(f,c,p,w){var E=p.type;return E===Bt?m(f,c,p.props.children,w,p.key):c!==null&&(c.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===qe&&Au(E)===c.type)?(w=l(c,p.props),w.ref=Cn(f,c,p),w.return=f,w):(w=Br(p.type,p.key,p.props,null,f.mode,w),w.ref=Cn(f,c,p),w.return=f,w)}function a(f,c,p,w){return c===null||c.tag!==4||c.stateNode.containerInfo!==p.containerInfo||c.stateNode.implementation!==p.implementation?(c=ri(p,f.mode,w),c.return=f,c):(c=l(c,p.children||[]),c.return=f,c)}function m(f,c,p,w,E){return c===null||c.tag!==7?(c=zt(p,f.mode,w,E),c.return=f,c):(c=l(c,p),c.return=f,c)}function d(f,c,p){if(typeof c=="string"&&c!==""||typeof c=="number")return c=ni(""+c,f.mode,p),c.return=f,c;if(typeof c=="object"&&c!==null){switch(c.$$typeof){case pr:return p=Br(c.type,c.key,c.props,null,f.mode,p),p.ref=Cn(f,null,c),p.return=f,p;case At:return c=ri(c,f.mode,p),c.return=f,c;case qe:var w=c._init;return d(f,w(c._payload),p)}if(Pn(c)||wn(c))return c=zt(c,f.mode,p,null),c.return=f,c;Cr(f,c)}return null}function v(f,c,p,w){var E=c!==null?c.key:null;if(typeof p=="string"&&p!==""||typeof p=="number")return E!==null?null:u(f,c,""+p,w);if(typeof p=="object"&&p!==null){switch(p.$$typeof){case pr:return p.key===E?s(f,c,p,w):null;case At:return p.key===E?a(f,c,p,w):null;case qe:return E=p._init,v(f,c,E(p._payload),w)}if(Pn(p)||wn(p))return E!==null?null:m(f,c,p,w,null);Cr(f,p)}return null}function y(f,c,p,w,E){if(typeof w=="string"&&w!==""||typeof w=="number")return f=f.get(p)||null,u(c,f,""+w,E);if(typeof w=="object"&&w!==null){switch(w.$$typeof){case pr:return f=f.get(w.key===null?p:w.key)||null,s(c,f,w,E);case At:return f=f.get(w.key===null?p:w.key)||null,a(c,f,w,E);case qe:var j=w._init;return y(f,c,p,j(w._payload),E)}if(Pn(w)||wn(w))return f=f.get(p)||null,m(c,f,w,E,null);Cr(c,w)}return null}function g(f,c,p,w){for(var E=null,j=null,P=c,L=c=0,H=null;P!==null&&L<p.length;L++){P.index>L?(H=P,P=null):H=P.sibling;var O=v(f,P,p[L],w);if(O===null){P===null&&(P=H);break}e&&P&&O.alternate===null&&t(f,P),c=i(O,c,L),j===null?E=O:j.sibling=O,j=O,P=H}if(L===p.length)return n(f,P),A&&Et(f,L),E;if(P===null){for(;L<p.length;L++)P=d(f,p[L],w),P!==null&&(c=i(P,c,L),j===null?E=P:j.sibling=P,j=P);return A&&Et(f,L),E}for(P=r(f,P);L<p.length;L++)H=y(P,f,L,p[L],w),H!==null&&(e&&H.alternate!==null&&P.delete(H.key===null?L:H.key),c=i(H,c,L),j===null?E=H:j.sibling=H,j=H);return e&&P.forEach(function(Pe){return t(f,Pe)}),A&&Et(f,L),E}function x(f,c,p,w){var E=wn(p);if(typeof E!="function")throw Error(S(150));if(p=E.call(p),p==null)throw Error(S(151));for(var j=E=null,P=c,L=c=0,H=null,O=p.next();P!==null&&!O.done;L++,O=p.next()){P.index>L?(H=P,P=null):H=P.sibling;var Pe=v(f,P,O.value,w);if(Pe===null){P===null&&(P=H);break}e&&P&&Pe.alternate===null&&t(f,P),c=i(Pe,c,L),j===null?E=Pe:j.sibling=Pe,j=Pe,P=H}if(O.done)return n(f,P),A&&Et(f,L),E;if(P===null){for(;!O.done;L++,O=p.next())O=d(f,O.value,w),O!==null&&(c=i(O,c,L),j===null?E=O:j.sibling=O,j=O);return A&&Et(f,L),E}for(P=r(f,P);!O.done;L++,O=p.next())O=y(P,f,L,O.value,w),O!==null&&(e&&O.alternate!==null&&P.delete(O.key===null?L:O.key),c=i(O,c,L),j===null?E=O:j.sibling=O,j=O);return e&&P.forEach(function(yn){return t(f,yn)}),A&&Et(f,L),E}function C(f,c,p,w){if(typeof p=="object"&&p!==null&&p.type===Bt&&p.key===null&&(p=p.props.children),typeof p=="object"&&p!==null){switch(p.$$typeof){case pr:e:{for(var E=p.key,j=c;j!==null;){if(j.key===E){if(E=p.type,E===Bt){if(j.tag===7){n(f,j.sibling),c=l(j,p.props.children),c.return=f,f=c;break e}}else if(j.elementType===E||typeof E=="object"&&E!==null&&E.$$typeof===qe&&Au(E)===j.type){n(f,j.sibling),c=l(j,p.props),c.ref=Cn(f,j,p),c.return=f,f=c;break e}n(f,j);break}else t(f,j);j=j.sibling}p.type===Bt?(c=zt(p.props.children,f.mode,w,p.key),c.return=f,f=c):(w=Br(p.type,p.key,p.props,null,f.mode,w),w.ref=Cn(f,c,p),w.return=f,f=w)}return o(f);case At:e:{for(j=p.key;c!==null;){if(c.key===j)if(c.tag===4&&c.stateNode.containerInfo===p.containerInfo&&c.stateNode.implementation===p.implementation){n(f,c.sibling),c=l(c,p.children||[]),c.return=f,f=c;break e}else{n(f,c);break}else t(f,c);c=c.sibling}c=ri(p,f.mode,w),c.return=f,f=c}return o(f);case qe:return j=p._init,C(f,c,j(p._payload),w)}if(Pn(p))return g(f,c,p,w);if(wn(p))return x(f,c,p,w);Cr(f,p)}return typeof p=="string"&&p!==""||typeof p=="number"?(p=""+p,c!==null&&c.tag===6?(n(f,c.sibling),c=l(c,p),c.return=f,f=c):(n(f,c),c=ni(p,f.mode,w),c.return=f,f=c),o(f)):n(f,c)}return C}var un=Aa(!0),Ba=Aa(!1),el=yt(null),tl=null,Gt=null,_o=null;function No(){_o=Gt=tl=null}function jo(e){var t=el.current;U(el),e._currentValue=t}function Ii(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function tn(e,t){tl=e,_o=Gt=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(de=!0),e.firstContext=null)}function Ne(e){var t=e._currentValue;if(_o!==e)if(e={context:e,memoizedValue:t,next:null},Gt===null){if(tl===null)throw Error(S(308));Gt=e,tl.dependencies={lanes:0,firstContext:e}}else Gt=Gt.next=e;return t}var Nt=null;function Po(e){Nt===null?Nt=[e]:Nt.push(e)}function $a(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,Po(t)):(n.next=l.next,l.next=n),t.interleaved=n,Ge(e,r)}function Ge(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var be=!1;function Lo(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Va(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Qe(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function at(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,D&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,Ge(e,n)}return l=r.interleaved,l===null?(t.next=t,Po(r)):(t.next=l.next,l.next=t),r.interleaved=t,Ge(e,n)}function Dr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,ho(e,n)}}function Bu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,i=null;if(n=n.firstBaseUpdate,n!==null){do{var o={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};i===null?l=i=o:i=i.next=o,n=n.next}while(n!==null);i===null?l=i=t:i=i.next=t}else l=i=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:i,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function nl(e,t,n,r){var l=e.updateQueue;be=!1;var i=l.firstBaseUpdate,o=l.lastBaseUpdate,u=l.shared.pending;if(u!==null){l.shared.pending=null;var s=u,a=s.next;s.next=null,o===null?i=a:o.next=a,o=s;var m=e.alternate;m!==null&&(m=m.updateQueue,u=m.lastBaseUpdate,u!==o&&(u===null?m.firstBaseUpdate=a:u.next=a,m.lastBaseUpdate=s))}if(i!==null){var d=l.baseState;o=0,m=a=s=null,u=i;do{var v=u.lane,y=u.eventTime;if((r&v)===v){m!==null&&(m=m.next={eventTime:y,lane:0,tag:u.tag,payload:u.payload,callback:u.callback,next:null});e:{var g=e,x=u;switch(v=t,y=n,x.tag){case 1:if(g=x.payload,typeof g=="function"){d=g.call(y,d,v);break e}d=g;break e;case 3:g.flags=g.flags&-65537|128;case 0:if(g=x.payload,v=typeof g=="function"?g.call(y,d,v):g,v==null)break e;d=V({},d,v);break e;case 2:be=!0}}u.callback!==null&&u.lane!==0&&(e.flags|=64,v=l.effects,v===null?l.effects=[u]:v.push(u))}else y={eventTime:y,lane:v,tag:u.tag,payload:u.payload,callback:u.callback,next:null},m===null?(a=m=y,s=d):m=m.next=y,o|=v;if(u=u.next,u===null){if(u=l.shared.pending,u===null)break;v=u,u=v.next,v.next=null,l.lastBaseUpdate=v,l.shared.pending=null}}while(!0);if(m===null&&(s=d),l.baseState=s,l.firstBaseUpdate=a,l.lastBaseUpdate=m,t=l.shared.interleaved,t!==null){l=t;do o|=l.lane,l=l.next;while(l!==t)}else i===null&&(l.shared.lanes=0);Dt|=o,e.lanes=o,e.memoizedState=d}}function $u(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(S(191,l));l.call(r)}}}var ar={},Be=yt(ar),Zn=yt(ar),qn=yt(ar);function jt(e){if(e===ar)throw Error(S(174));return e}function zo(e,t){switch(M(qn,t),M(Zn,e),M(Be,ar),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:mi(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=mi(t,e)}U(Be),M(Be,t)}function sn(){U(Be),U(Zn),U(qn)}function Wa(e){jt(qn.current);var t=jt(Be.current),n=mi(t,e.type);t!==n&&(M(Zn,e),M(Be,n))}function To(e){Zn.current===e&&(U(Be),U(Zn))}var B=yt(0);function rl(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Jl=[];function Ro(){for(var e=0;e<Jl.length;e++)Jl[e]._workInProgressVersionPrimary=null;Jl.length=0}var Ir=Je.ReactCurrentDispatcher,Zl=Je.ReactCurrentBatchConfig,Ot=0,$=null,X=null,q=null,ll=!1,Mn=!1,bn=0,Yd=0;function re(){throw Error(S(321))}function Oo(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Ie(e[n],t[n]))return!1;return!0}function Do(e,t,n,r,l,i){if(Ot=i,$=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Ir.current=e===null||e.memoizedState===null?Zd:qd,e=n(r,l),Mn){i=0;do{if(Mn=!1,bn=0,25<=i)throw Error(S(301));i+=1,q=X=null,t.updateQueue=null,Ir.current=bd,e=n(r,l)}while(Mn)}if(Ir.current=il,t=X!==null&&X.next!==null,Ot=0,q=X=$=null,ll=!1,t)throw Error(S(300));return e}function Io(){var e=bn!==0;return bn=0,e}function Fe(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return q===null?$.memoizedState=q=e:q=q.next=e,q}function je(){if(X===null){var e=$.alternate;e=e!==null?e.memoizedState:null}else e=X.next;var t=q===null?$.memoizedState:q.next;if(t!==null)q=t,X=e;else{if(e===null)throw Error(S(310));X=e,e={memoizedState:X.memoizedState,baseState:X.baseState,baseQueue:X.baseQueue,queue:X.queue,next:null},q===null?$.memoizedState=q=e:q=q.next=e}return q}function er(e,t){return typeof t=="function"?t(e):t}function ql(e){var t=je(),n=t.queue;if(n===null)throw Error(S(311));n.lastRenderedReducer=e;var r=X,l=r.baseQueue,i=n.pending;if(i!==null){if(l!==null){var o=l.next;l.next=i.next,i.next=o}r.baseQueue=l=i,n.pending=null}if(l!==null){i=l.next,r=r.baseState;var u=o=null,s=null,a=i;do{var m=a.lane;if((Ot&m)===m)s!==null&&(s=s.next={lane:0,action:a.action,hasEagerState:a.hasEagerState,eagerState:a.eagerState,next:null}),r=a.hasEagerState?a.eagerState:e(r,a.action);else{var d={lane:m,action:a.action,hasEagerState:a.hasEagerState,eagerState:a.eagerState,next:null};s===null?(u=s=d,o=r):s=s.next=d,$.lanes|=m,Dt|=m}a=a.next}while(a!==null&&a!==i);s===null?o=r:s.next=u,Ie(r,t.memoizedState)||(de=!0),t.memoizedState=r,t.baseState=o,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do i=l.lane,$.lanes|=i,Dt|=i,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function bl(e){var t=je(),n=t.queue;if(n===null)throw Error(S(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,i=t.memoizedState;if(l!==null){n.pending=null;var o=l=l.next;do i=e(i,o.action),o=o.next;while(o!==l);Ie(i,t.memoizedState)||(de=!0),t.memoizedState=i,t.baseQueue===null&&(t.baseState=i),n.lastRenderedState=i}return[i,r]}function Ha(){}function Qa(e,t){var n=$,r=je(),l=t(),i=!Ie(r.memoizedState,l);if(i&&(r.memoizedState=l,de=!0),r=r.queue,Mo(Ga.bind(null,n,r,e),[e]),r.getSnapshot!==t||i||q!==null&&q.memoizedState.tag&1){if(n.flags|=2048,tr(9,Ya.bind(null,n,r,l,t),void 0,null),b===null)throw Error(S(349));Ot&30||Ka(n,t,l)}return l}function Ka(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=$.updateQueue,t===null?(t={lastEffect:null,stores:null},$.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function Ya(e,t,n,r){t.value=n,t.getSnapshot=r,Xa(t)&&Ja(e)}function Ga(e,t,n){return n(function(){Xa(t)&&Ja(e)})}function Xa(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Ie(e,n)}catch{return!0}}function Ja(e){var t=Ge(e,1);t!==null&&De(t,e,1,-1)}function Vu(e){var t=Fe();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:er,lastRenderedState:e},t.queue=e,e=e.dispatch=Jd.bind(null,$,e),[t.memoizedState,e]}function tr(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=$.updateQueue,t===null?(t={lastEffect:null,stores:null},$.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function Za(){return je().memoizedState}function Mr(e,t,n,r){var l=Fe();$.flags|=e,l.memoizedState=tr(1|t,n,void 0,r===void 0?null:r)}function wl(e,t,n,r){var l=je();r=r===void 0?null:r;var i=void 0;if(X!==null){var o=X.memoizedState;if(i=o.destroy,r!==null&&Oo(r,o.deps)){l.memoizedState=tr(t,n,i,r);return}}$.flags|=e,l.memoizedState=tr(1|t,n,i,r)}function Wu(e,t){return Mr(8390656,8,e,t)}function Mo(e,t){return wl(2048,8,e,t)}function qa(e,t){return wl(4,2,e,t)}function ba(e,t){return wl(4,4,e,t)}function ec(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function tc(e,t,n){return n=n!=null?n.concat([e]):null,wl(4,4,ec.bind(null,t,e),n)}function Fo(){}function nc(e,t){var n=je();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Oo(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function rc(e,t){var n=je();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&Oo(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function lc(e,t,n){return Ot&21?(Ie(n,t)||(n=aa(),$.lanes|=n,Dt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,de=!0),e.memoizedState=n)}function Gd(e,t){var n=I;I=n!==0&&4>n?n:4,e(!0);var r=Zl.transition;Zl.transition={};try{e(!1),t()}finally{I=n,Zl.transition=r}}function ic(){return je().memoizedState}function Xd(e,t,n){var r=ft(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},oc(e))uc(t,n);else if(n=$a(e,t,n,r),n!==null){var l=se();De(n,e,r,l),sc(n,t,r)}}function Jd(e,t,n){var r=ft(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(oc(e))uc(t,l);else{var i=e.alternate;if(e.lanes===0&&(i===null||i.lanes===0)&&(i=t.lastRenderedReducer,i!==null))try{var o=t.lastRenderedState,u=i(o,n);if(l.hasEagerState=!0,l.eagerState=u,Ie(u,o)){var s=t.interleaved;s===null?(l.next=l,Po(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=$a(e,t,l,r),n!==null&&(l=se(),De(n,e,r,l),sc(n,t,r))}}function oc(e){var t=e.alternate;return e===$||t!==null&&t===$}function uc(e,t){Mn=ll=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function sc(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,ho(e,n)}}var il={readContext:Ne,useCallback:re,useContext:re,useEffect:re,useImperativeHandle:re,useInsertionEffect:re,useLayoutEffect:re,useMemo:re,useReducer:re,useRef:re,useState:re,useDebugValue:re,useDeferredValue:re,useTransition:re,useMutableSource:re,useSyncExternalStore:re,useId:re,unstable_isNewReconciler:!1},Zd={readContext:Ne,useCallback:function(e,t){return Fe().memoizedState=[e,t===void 0?null:t],e},useContext:Ne,useEffect:Wu,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Mr(4194308,4,ec.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Mr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Mr(4,2,e,t)},useMemo:function(e,t){var n=Fe();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Fe();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Xd.bind(null,$,e),[r.memoizedState,e]},useRef:function(e){var t=Fe();return e={current:e},t.memoizedState=e},useState:Vu,useDebugValue:Fo,useDeferredValue:function(e){return Fe().memoizedState=e},useTransition:function(){var e=Vu(!1),t=e[0];return e=Gd.bind(null,e[1]),Fe().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=$,l=Fe();if(A){if(n===void 0)throw Error(S(407));n=n()}else{if(n=t(),b===null)throw Error(S(349));Ot&30||Ka(r,t,n)}l.memoizedState=n;var i={value:n,getSnapshot:t};return l.queue=i,Wu(Ga.bind(null,r,i,e),[e]),r.flags|=2048,tr(9,Ya.bind(null,r,i,n,t),void 0,null),n},useId:function(){var e=Fe(),t=b.identifierPrefix;if(A){var n=He,r=We;n=(r&~(1<<32-Oe(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=bn++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=Yd++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},qd={readContext:Ne,useCallback:nc,useContext:Ne,useEffect:Mo,useImperativeHandle:tc,useInsertionEffect:qa,useLayoutEffect:ba,useMemo:rc,useReducer:ql,useRef:Za,useState:function(){return ql(er)},useDebugValue:Fo,useDeferredValue:function(e){var t=je();return lc(t,X.memoizedState,e)},useTransition:function(){var e=ql(er)[0],t=je().memoizedState;return[e,t]},useMutableSource:Ha,useSyncExternalStore:Qa,useId:ic,unstable_isNewReconciler:!1},bd={readContext:Ne,useCallback:nc,useContext:Ne,useEffect:Mo,useImperativeHandle:tc,useInsertionEffect:qa,useLayoutEffect:ba,useMemo:rc,useReducer:bl,useRef:Za,useState:function(){return bl(er)},useDebugValue:Fo,useDeferredValue:function(e){var t=je();return X===null?t.memoizedState=e:lc(t,X.memoizedState,e)},useTransition:function(){var e=bl(er)[0],t=je().memoizedState;return[e,t]},useMutableSource:Ha,useSyncExternalStore:Qa,useId:ic,unstable_isNewReconciler:!1};function ze(e,t){if(e&&e.defaultProps){t=V({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Mi(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:V({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var xl={isMounted:function(e){return(e=e._reactInternals)?Ft(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=se(),l=ft(e),i=Qe(r,l);i.payload=t,n!=null&&(i.callback=n),t=at(e,i,l),t!==null&&(De(t,e,l,r),Dr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=se(),l=ft(e),i=Qe(r,l);i.tag=1,i.payload=t,n!=null&&(i.callback=n),t=at(e,i,l),t!==null&&(De(t,e,l,r),Dr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=se(),r=ft(e),l=Qe(n,r);l.tag=2,t!=null&&(l.callback=t),t=at(e,l,r),t!==null&&(De(t,e,r,n),Dr(t,e,r))}};function Hu(e,t,n,r,l,i,o){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,i,o):t.prototype&&t.prototype.isPureReactComponent?!Yn(n,r)||!Yn(l,i):!0}function ac(e,t,n){var r=!1,l=mt,i=t.contextType;return typeof i=="object"&&i!==null?i=Ne(i):(l=he(t)?Tt:oe.current,r=t.contextTypes,i=(r=r!=null)?ln(e,l):mt),t=new t(n,i),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=xl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=i),t}function Qu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&xl.enqueueReplaceState(t,t.state,null)}function Fi(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},Lo(e);var i=t.contextType;typeof i=="object"&&i!==null?l.context=Ne(i):(i=he(t)?Tt:oe.current,l.context=ln(e,i)),l.state=e.memoizedState,i=t.getDerivedStateFromProps,typeof i=="function"&&(Mi(e,t,i,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&xl.enqueueReplaceState(l,l.state,null),nl(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function an(e,t){try{var n="",r=t;do n+=jf(r),r=r.return;while(r);var l=n}catch(i){l=`
-Error generating stack: `+i.message+`
-`+i.stack}return{value:e,source:t,stack:l,digest:null}}function ei(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Ui(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var ep=typeof WeakMap=="function"?WeakMap:Map;function cc(e,t,n){n=Qe(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){ul||(ul=!0,Gi=r),Ui(e,t)},n}function fc(e,t,n){n=Qe(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){Ui(e,t)}}var i=e.stateNode;return i!==null&&typeof i.componentDidCatch=="function"&&(n.callback=function(){Ui(e,t),typeof r!="function"&&(ct===null?ct=new Set([this]):ct.add(this));var o=t.stack;this.componentDidCatch(t.value,{componentStack:o!==null?o:""})}),n}function Ku(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new ep;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=hp.bind(null,e,t,n),t.then(e,e))}function Yu(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Gu(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=Qe(-1,1),t.tag=2,at(n,t,1))),n.lanes|=1),e)}var tp=Je.ReactCurrentOwner,de=!1;function ue(e,t,n,r){t.child=e===null?Ba(t,null,n,r):un(t,e.child,n,r)}function Xu(e,t,n,r,l){n=n.render;var i=t.ref;return tn(t,l),r=Do(e,t,n,r,i,l),n=Io(),e!==null&&!de?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Xe(e,t,l)):(A&&n&&ko(t),t.flags|=1,ue(e,t,r,l),t.child)}function Ju(e,t,n,r,l){if(e===null){var i=n.type;return typeof i=="function"&&!Qo(i)&&i.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=i,dc(e,t,i,r,l)):(e=Br(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(i=e.child,!(e.lanes&l)){var o=i.memoizedProps;if(n=n.compare,n=n!==null?n:Yn,n(o,r)&&e.ref===t.ref)return Xe(e,t,l)}return t.flags|=1,e=dt(i,r),e.ref=t.ref,e.return=t,t.child=e}function dc(e,t,n,r,l){if(e!==null){var i=e.memoizedProps;if(Yn(i,r)&&e.ref===t.ref)if(de=!1,t.pendingProps=r=i,(e.lanes&l)!==0)e.flags&131072&&(de=!0);else return t.lanes=e.lanes,Xe(e,t,l)}return Ai(e,t,n,r,l)}function pc(e,t,n){var r=t.pendingProps,l=r.children,i=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},M(Jt,ve),ve|=n;else{if(!(n&1073741824))return e=i!==null?i.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,M(Jt,ve),ve|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=i!==null?i.baseLanes:n,M(Jt,ve),ve|=r}else i!==null?(r=i.baseLanes|n,t.memoizedState=null):r=n,M(Jt,ve),ve|=r;return ue(e,t,l,n),t.child}function hc(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Ai(e,t,n,r,l){var i=he(n)?Tt:oe.current;return i=ln(t,i),tn(t,l),n=Do(e,t,n,r,i,l),r=Io(),e!==null&&!de?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Xe(e,t,l)):(A&&r&&ko(t),t.flags|=1,ue(e,t,n,l),t.child)}function Zu(e,t,n,r,l){if(he(n)){var i=!0;Zr(t)}else i=!1;if(tn(t,l),t.stateNode===null)Fr(e,t),ac(t,n,r),Fi(t,n,r,l),r=!0;else if(e===null){var o=t.stateNode,u=t.memoizedProps;o.props=u;var s=o.context,a=n.contextType;typeof a=="object"&&a!==null?a=Ne(a):(a=he(n)?Tt:oe.current,a=ln(t,a));var m=n.getDerivedStateFromProps,d=typeof m=="function"||typeof o.getSnapshotBeforeUpdate=="function";d||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(u!==r||s!==a)&&Qu(t,o,r,a),be=!1;var v=t.memoizedState;o.state=v,nl(t,r,o,l),s=t.memoizedState,u!==r||v!==s||pe.current||be?(typeof m=="function"&&(Mi(t,n,m,r),s=t.memoizedState),(u=be||Hu(t,n,u,r,v,s,a))?(d||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount()),typeof o.componentDidMount=="function"&&(t.flags|=4194308)):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),o.props=r,o.state=s,o.context=a,r=u):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{o=t.stateNode,Va(e,t),u=t.memoizedProps,a=t.type===t.elementType?u:ze(t.type,u),o.props=a,d=t.pendingProps,v=o.context,s=n.contextType,typeof s=="object"&&s!==null?s=Ne(s):(s=he(n)?Tt:oe.current,s=ln(t,s));var y=n.getDerivedStateFromProps;(m=typeof y=="function"||typeof o.getSnapshotBeforeUpdate=="function")||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(u!==d||v!==s)&&Qu(t,o,r,s),be=!1,v=t.memoizedState,o.state=v,nl(t,r,o,l);var g=t.memoizedState;u!==d||v!==g||pe.current||be?(typeof y=="function"&&(Mi(t,n,y,r),g=t.memoizedState),(a=be||Hu(t,n,a,r,v,g,s)||!1)?(m||typeof o.UNSAFE_componentWillUpdate!="function"&&typeof o.componentWillUpdate!="function"||(typeof o.componentWillUpdate=="function"&&o.componentWillUpdate(r,g,s),typeof o.UNSAFE_componentWillUpdate=="function"&&o.UNSAFE_componentWillUpdate(r,g,s)),typeof o.componentDidUpdate=="function"&&(t.flags|=4),typeof o.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof o.componentDidUpdate!="function"||u===e.memoizedProps&&v===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&v===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=g),o.props=r,o.state=g,o.context=s,r=a):(typeof o.componentDidUpdate!="function"||u===e.memoizedProps&&v===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||u===e.memoizedProps&&v===e.memoizedState||(t.flags|=1024),r=!1)}return Bi(e,t,n,r,i,l)}function Bi(e,t,n,r,l,i){hc(e,t);var o=(t.flags&128)!==0;if(!r&&!o)return l&&Mu(t,n,!1),Xe(e,t,i);r=t.stateNode,tp.current=t;var u=o&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&o?(t.child=un(t,e.child,null,i),t.child=un(t,null,u,i)):ue(e,t,u,i),t.memoizedState=r.state,l&&Mu(t,n,!0),t.child}function mc(e){var t=e.stateNode;t.pendingContext?Iu(e,t.pendingContext,t.pendingContext!==t.context):t.context&&Iu(e,t.context,!1),zo(e,t.containerInfo)}function qu(e,t,n,r,l){return on(),Co(l),t.flags|=256,ue(e,t,n,r),t.child}var $i={dehydrated:null,treeContext:null,retryLane:0};function Vi(e){return{baseLanes:e,cachePool:null,transitions:null}}function vc(e,t,n){var r=t.pendingProps,l=B.current,i=!1,o=(t.flags&128)!==0,u;if((u=o)||(u=e!==null&&e.memoizedState===null?!1:(l&2)!==0),u?(i=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),M(B,l&1),e===null)return Di(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(o=r.children,e=r.fallback,i?(r=t.mode,i=t.child,o={mode:"hidden",children:o},!(r&1)&&i!==null?(i.childLanes=0,i.pendingProps=o):i=El(o,r,0,null),e=zt(e,r,n,null),i.return=t,e.return=t,i.sibling=e,t.child=i,t.child.memoizedState=Vi(n),t.memoizedState=$i,e):Uo(t,o));if(l=e.memoizedState,l!==null&&(u=l.dehydrated,u!==null))return np(e,t,o,r,u,l,n);if(i){i=r.fallback,o=t.mode,l=e.child,u=l.sibling;var s={mode:"hidden",children:r.children};return!(o&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=dt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),u!==null?i=dt(u,i):(i=zt(i,o,n,null),i.flags|=2),i.return=t,r.return=t,r.sibling=i,t.child=r,r=i,i=t.child,o=e.child.memoizedState,o=o===null?Vi(n):{baseLanes:o.baseLanes|n,cachePool:null,transitions:o.transitions},i.memoizedState=o,i.childLanes=e.childLanes&~n,t.memoizedState=$i,r}return i=e.child,e=i.sibling,r=dt(i,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Uo(e,t){return t=El({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function _r(e,t,n,r){return r!==null&&Co(r),un(t,e.child,null,n),e=Uo(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function np(e,t,n,r,l,i,o){if(n)return t.flags&256?(t.flags&=-257,r=ei(Error(S(422))),_r(e,t,o,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(i=r.fallback,l=t.mode,r=El({mode:"visible",children:r.children},l,0,null),i=zt(i,l,o,null),i.flags|=2,r.return=t,i.return=t,r.sibling=i,t.child=r,t.mode&1&&un(t,e.child,null,o),t.child.memoizedState=Vi(o),t.memoizedState=$i,i);if(!(t.mode&1))return _r(e,t,o,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var u=r.dgst;return r=u,i=Error(S(419)),r=ei(i,r,void 0),_r(e,t,o,r)}if(u=(o&e.childLanes)!==0,de||u){if(r=b,r!==null){switch(o&-o){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|o)?0:l,l!==0&&l!==i.retryLane&&(i.retryLane=l,Ge(e,l),De(r,e,l,-1))}return Ho(),r=ei(Error(S(421))),_r(e,t,o,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=mp.bind(null,e),l._reactRetry=t,null):(e=i.treeContext,ye=st(l.nextSibling),ge=t,A=!0,Re=null,e!==null&&(ke[Ee++]=We,ke[Ee++]=He,ke[Ee++]=Rt,We=e.id,He=e.overflow,Rt=t),t=Uo(t,r.children),t.flags|=4096,t)}function bu(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Ii(e.return,t,n)}function ti(e,t,n,r,l){var i=e.memoizedState;i===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=r,i.tail=n,i.tailMode=l)}function yc(e,t,n){var r=t.pendingProps,l=r.revealOrder,i=r.tail;if(ue(e,t,r.children,n),r=B.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&bu(e,n,t);else if(e.tag===19)bu(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(M(B,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&rl(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),ti(t,!1,l,n,i);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&rl(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}ti(t,!0,n,null,i);break;case"together":ti(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Fr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Xe(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Dt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(S(153));if(t.child!==null){for(e=t.child,n=dt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=dt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function rp(e,t,n){switch(t.tag){case 3:mc(t),on();break;case 5:Wa(t);break;case 1:he(t.type)&&Zr(t);break;case 4:zo(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;M(el,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(M(B,B.current&1),t.flags|=128,null):n&t.child.childLanes?vc(e,t,n):(M(B,B.current&1),e=Xe(e,t,n),e!==null?e.sibling:null);M(B,B.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return yc(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),M(B,B.current),r)break;return null;case 22:case 23:return t.lanes=0,pc(e,t,n)}return Xe(e,t,n)}var gc,Wi,wc,xc;gc=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Wi=function(){};wc=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,jt(Be.current);var i=null;switch(n){case"input":l=fi(e,l),r=fi(e,r),i=[];break;case"select":l=V({},l,{value:void 0}),r=V({},r,{value:void 0}),i=[];break;case"textarea":l=hi(e,l),r=hi(e,r),i=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Xr)}vi(n,r);var o;n=null;for(a in l)if(!r.hasOwnProperty(a)&&l.hasOwnProperty(a)&&l[a]!=null)if(a==="style"){var u=l[a];for(o in u)u.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else a!=="dangerouslySetInnerHTML"&&a!=="children"&&a!=="suppressContentEditableWarning"&&a!=="suppressHydrationWarning"&&a!=="autoFocus"&&(Bn.hasOwnProperty(a)?i||(i=[]):(i=i||[]).push(a,null));for(a in r){var s=r[a];if(u=l!=null?l[a]:void 0,r.hasOwnProperty(a)&&s!==u&&(s!=null||u!=null))if(a==="style")if(u){for(o in u)!u.hasOwnProperty(o)||s&&s.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in s)s.hasOwnProperty(o)&&u[o]!==s[o]&&(n||(n={}),n[o]=s[o])}else n||(i||(i=[]),i.push(a,n)),n=s;else a==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,u=u?u.__html:void 0,s!=null&&u!==s&&(i=i||[]).push(a,s)):a==="children"?typeof s!="string"&&typeof s!="number"||(i=i||[]).push(a,""+s):a!=="suppressContentEditableWarning"&&a!=="suppressHydrationWarning"&&(Bn.hasOwnProperty(a)?(s!=null&&a==="onScroll"&&F("scroll",e),i||u===s||(i=[])):(i=i||[]).push(a,s))}n&&(i=i||[]).push("style",n);var a=i;(t.updateQueue=a)&&(t.flags|=4)}};xc=function(e,t,n,r){n!==r&&(t.flags|=4)};function _n(e,t){if(!A)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function le(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function lp(e,t,n){var r=t.pendingProps;switch(Eo(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return le(t),null;case 1:return he(t.type)&&Jr(),le(t),null;case 3:return r=t.stateNode,sn(),U(pe),U(oe),Ro(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Er(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,Re!==null&&(Zi(Re),Re=null))),Wi(e,t),le(t),null;case 5:To(t);var l=jt(qn.current);if(n=t.type,e!==null&&t.stateNode!=null)wc(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(S(166));return le(t),null}if(e=jt(Be.current),Er(t)){r=t.stateNode,n=t.type;var i=t.memoizedProps;switch(r[Ue]=t,r[Jn]=i,e=(t.mode&1)!==0,n){case"dialog":F("cancel",r),F("close",r);break;case"iframe":case"object":case"embed":F("load",r);break;case"video":case"audio":for(l=0;l<zn.length;l++)F(zn[l],r);break;case"source":F("error",r);break;case"img":case"image":case"link":F("error",r),F("load",r);break;case"details":F("toggle",r);break;case"input":su(r,i),F("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!i.multiple},F("invalid",r);break;case"textarea":cu(r,i),F("invalid",r)}vi(n,i),l=null;for(var o in i)if(i.hasOwnProperty(o)){var u=i[o];o==="children"?typeof u=="string"?r.textContent!==u&&(i.suppressHydrationWarning!==!0&&kr(r.textContent,u,e),l=["children",u]):typeof u=="number"&&r.textContent!==""+u&&(i.suppressHydrationWarning!==!0&&kr(r.textContent,u,e),l=["children",""+u]):Bn.hasOwnProperty(o)&&u!=null&&o==="onScroll"&&F("scroll",r)}switch(n){case"input":hr(r),au(r,i,!0);break;case"textarea":hr(r),fu(r);break;case"select":case"option":break;default:typeof i.onClick=="function"&&(r.onclick=Xr)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{o=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Gs(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=o.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=o.createElement(n,{is:r.is}):(e=o.createElement(n),n==="select"&&(o=e,r.multiple?o.multiple=!0:r.size&&(o.size=r.size))):e=o.createElementNS(e,n),e[Ue]=t,e[Jn]=r,gc(e,t,!1,!1),t.stateNode=e;e:{switch(o=yi(n,r),n){case"dialog":F("cancel",e),F("close",e),l=r;break;case"iframe":case"object":case"embed":F("load",e),l=r;break;case"video":case"audio":for(l=0;l<zn.length;l++)F(zn[l],e);l=r;break;case"source":F("error",e),l=r;break;case"img":case"image":case"link":F("error",e),F("load",e),l=r;break;case"details":F("toggle",e),l=r;break;case"input":su(e,r),l=fi(e,r),F("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=V({},r,{value:void 0}),F("invalid",e);break;case"textarea":cu(e,r),l=hi(e,r),F("invalid",e);break;default:l=r}vi(n,l),u=l;for(i in u)if(u.hasOwnProperty(i)){var s=u[i];i==="style"?Zs(e,s):i==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&Xs(e,s)):i==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&$n(e,s):typeof s=="number"&&$n(e,""+s):i!=="suppressContentEditableWarning"&&i!=="suppressHydrationWarning"&&i!=="autoFocus"&&(Bn.hasOwnProperty(i)?s!=null&&i==="onScroll"&&F("scroll",e):s!=null&&uo(e,i,s,o))}switch(n){case"input":hr(e),au(e,r,!1);break;case"textarea":hr(e),fu(e);break;case"option":r.value!=null&&e.setAttribute("value",""+ht(r.value));break;case"select":e.multiple=!!r.multiple,i=r.value,i!=null?Zt(e,!!r.multiple,i,!1):r.defaultValue!=null&&Zt(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=Xr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return le(t),null;case 6:if(e&&t.stateNode!=null)xc(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(S(166));if(n=jt(qn.current),jt(Be.current),Er(t)){if(r=t.stateNode,n=t.memoizedProps,r[Ue]=t,(i=r.nodeValue!==n)&&(e=ge,e!==null))switch(e.tag){case 3:kr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&kr(r.nodeValue,n,(e.mode&1)!==0)}i&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Ue]=t,t.stateNode=r}return le(t),null;case 13:if(U(B),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(A&&ye!==null&&t.mode&1&&!(t.flags&128))Ua(),on(),t.flags|=98560,i=!1;else if(i=Er(t),r!==null&&r.dehydrated!==null){if(e===null){if(!i)throw Error(S(318));if(i=t.memoizedState,i=i!==null?i.dehydrated:null,!i)throw Error(S(317));i[Ue]=t}else on(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;le(t),i=!1}else Re!==null&&(Zi(Re),Re=null),i=!0;if(!i)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||B.current&1?J===0&&(J=3):Ho())),t.updateQueue!==null&&(t.flags|=4),le(t),null);case 4:return sn(),Wi(e,t),e===null&&Gn(t.stateNode.containerInfo),le(t),null;case 10:return jo(t.type._context),le(t),null;case 17:return he(t.type)&&Jr(),le(t),null;case 19:if(U(B),i=t.memoizedState,i===null)return le(t),null;if(r=(t.flags&128)!==0,o=i.rendering,o===null)if(r)_n(i,!1);else{if(J!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(o=rl(e),o!==null){for(t.flags|=128,_n(i,!1),r=o.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)i=n,e=r,i.flags&=14680066,o=i.alternate,o===null?(i.childLanes=0,i.lanes=e,i.child=null,i.subtreeFlags=0,i.memoizedProps=null,i.memoizedState=null,i.updateQueue=null,i.dependencies=null,i.stateNode=null):(i.childLanes=o.childLanes,i.lanes=o.lanes,i.child=o.child,i.subtreeFlags=0,i.deletions=null,i.memoizedProps=o.memoizedProps,i.memoizedState=o.memoizedState,i.updateQueue=o.updateQueue,i.type=o.type,e=o.dependencies,i.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return M(B,B.current&1|2),t.child}e=e.sibling}i.tail!==null&&K()>cn&&(t.flags|=128,r=!0,_n(i,!1),t.lanes=4194304)}else{if(!r)if(e=rl(o),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),_n(i,!0),i.tail===null&&i.tailMode==="hidden"&&!o.alternate&&!A)return le(t),null}else 2*K()-i.renderingStartTime>cn&&n!==1073741824&&(t.flags|=128,r=!0,_n(i,!1),t.lanes=4194304);i.isBackwards?(o.sibling=t.child,t.child=o):(n=i.last,n!==null?n.sibling=o:t.child=o,i.last=o)}return i.tail!==null?(t=i.tail,i.rendering=t,i.tail=t.sibling,i.renderingStartTime=K(),t.sibling=null,n=B.current,M(B,r?n&1|2:n&1),t):(le(t),null);case 22:case 23:return Wo(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ve&1073741824&&(le(t),t.subtreeFlags&6&&(t.flags|=8192)):le(t),null;case 24:return null;case 25:return null}throw Error(S(156,t.tag))}function ip(e,t){switch(Eo(t),t.tag){case 1:return he(t.type)&&Jr(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return sn(),U(pe),U(oe),Ro(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return To(t),null;case 13:if(U(B),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(S(340));on()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return U(B),null;case 4:return sn(),null;case 10:return jo(t.type._context),null;case 22:case 23:return Wo(),null;case 24:return null;default:return null}}var Nr=!1,ie=!1,op=typeof WeakSet=="function"?WeakSet:Set,_=null;function Xt(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){W(e,t,r)}else n.current=null}function Hi(e,t,n){try{n()}catch(r){W(e,t,r)}}var es=!1;function up(e,t){if(ji=Kr,e=_a(),So(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,i=r.focusNode;r=r.focusOffset;try{n.nodeType,i.nodeType}catch{n=null;break e}var o=0,u=-1,s=-1,a=0,m=0,d=e,v=null;t:for(;;){for(var y;d!==n||l!==0&&d.nodeType!==3||(u=o+l),d!==i||r!==0&&d.nodeType!==3||(s=o+r),d.nodeType===3&&(o+=d.nodeValue.length),(y=d.firstChild)!==null;)v=d,d=y;for(;;){if(d===e)break t;if(v===n&&++a===l&&(u=o),v===i&&++m===r&&(s=o),(y=d.nextSibling)!==null)break;d=v,v=d.parentNode}d=y}n=u===-1||s===-1?null:{start:u,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(Pi={focusedElem:e,selectionRange:n},Kr=!1,_=t;_!==null;)if(t=_,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,_=e;else for(;_!==null;){t=_;try{var g=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(g!==null){var x=g.memoizedProps,C=g.memoizedState,f=t.stateNode,c=f.getSnapshotBeforeUpdate(t.elementType===t.type?x:ze(t.type,x),C);f.__reactInternalSnapshotBeforeUpdate=c}break;case 3:var p=t.stateNode.containerInfo;p.nodeType===1?p.textContent="":p.nodeType===9&&p.documentElement&&p.removeChild(p.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(S(163))}}catch(w){W(t,t.return,w)}if(e=t.sibling,e!==null){e.return=t.return,_=e;break}_=t.return}return g=es,es=!1,g}function Fn(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var i=l.destroy;l.destroy=void 0,i!==void 0&&Hi(t,n,i)}l=l.next}while(l!==r)}}function Sl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Qi(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function Sc(e){var t=e.alternate;t!==null&&(e.alternate=null,Sc(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Ue],delete t[Jn],delete t[Ti],delete t[Wd],delete t[Hd])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function kc(e){return e.tag===5||e.tag===3||e.tag===4}function ts(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||kc(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Ki(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Xr));else if(r!==4&&(e=e.child,e!==null))for(Ki(e,t,n),e=e.sibling;e!==null;)Ki(e,t,n),e=e.sibling}function Yi(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Yi(e,t,n),e=e.sibling;e!==null;)Yi(e,t,n),e=e.sibling}var ee=null,Te=!1;function Ze(e,t,n){for(n=n.child;n!==null;)Ec(e,t,n),n=n.sibling}function Ec(e,t,n){if(Ae&&typeof Ae.onCommitFiberUnmount=="function")try{Ae.onCommitFiberUnmount(pl,n)}catch{}switch(n.tag){case 5:ie||Xt(n,t);case 6:var r=ee,l=Te;ee=null,Ze(e,t,n),ee=r,Te=l,ee!==null&&(Te?(e=ee,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ee.removeChild(n.stateNode));break;case 18:ee!==null&&(Te?(e=ee,n=n.stateNode,e.nodeType===8?Gl(e.parentNode,n):e.nodeType===1&&Gl(e,n),Qn(e)):Gl(ee,n.stateNode));break;case 4:r=ee,l=Te,ee=n.stateNode.containerInfo,Te=!0,Ze(e,t,n),ee=r,Te=l;break;case 0:case 11:case 14:case 15:if(!ie&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var i=l,o=i.destroy;i=i.tag,o!==void 0&&(i&2||i&4)&&Hi(n,t,o),l=l.next}while(l!==r)}Ze(e,t,n);break;case 1:if(!ie&&(Xt(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(u){W(n,t,u)}Ze(e,t,n);break;case 21:Ze(e,t,n);break;case 22:n.mode&1?(ie=(r=ie)||n.memoizedState!==null,Ze(e,t,n),ie=r):Ze(e,t,n);break;default:Ze(e,t,n)}}function ns(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new op),t.forEach(function(r){var l=vp.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Le(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var i=e,o=t,u=o;e:for(;u!==null;){switch(u.tag){case 5:ee=u.stateNode,Te=!1;break e;case 3:ee=u.stateNode.containerInfo,Te=!0;break e;case 4:ee=u.stateNode.containerInfo,Te=!0;break e}u=u.return}if(ee===null)throw Error(S(160));Ec(i,o,l),ee=null,Te=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(a){W(l,t,a)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Cc(t,e),t=t.sibling}function Cc(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Le(t,e),Me(e),r&4){try{Fn(3,e,e.return),Sl(3,e)}catch(x){W(e,e.return,x)}try{Fn(5,e,e.return)}catch(x){W(e,e.return,x)}}break;case 1:Le(t,e),Me(e),r&512&&n!==null&&Xt(n,n.return);break;case 5:if(Le(t,e),Me(e),r&512&&n!==null&&Xt(n,n.return),e.flags&32){var l=e.stateNode;try{$n(l,"")}catch(x){W(e,e.return,x)}}if(r&4&&(l=e.stateNode,l!=null)){var i=e.memoizedProps,o=n!==null?n.memoizedProps:i,u=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{u==="input"&&i.type==="radio"&&i.name!=null&&Ks(l,i),yi(u,o);var a=yi(u,i);for(o=0;o<s.length;o+=2){var m=s[o],d=s[o+1];m==="style"?Zs(l,d):m==="dangerouslySetInnerHTML"?Xs(l,d):m==="children"?$n(l,d):uo(l,m,d,a)}switch(u){case"input":di(l,i);break;case"textarea":Ys(l,i);break;case"select":var v=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!i.multiple;var y=i.value;y!=null?Zt(l,!!i.multiple,y,!1):v!==!!i.multiple&&(i.defaultValue!=null?Zt(l,!!i.multiple,i.defaultValue,!0):Zt(l,!!i.multiple,i.multiple?[]:"",!1))}l[Jn]=i}catch(x){W(e,e.return,x)}}break;case 6:if(Le(t,e),Me(e),r&4){if(e.stateNode===null)throw Error(S(162));l=e.stateNode,i=e.memoizedProps;try{l.nodeValue=i}catch(x){W(e,e.return,x)}}break;case 3:if(Le(t,e),Me(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Qn(t.containerInfo)}catch(x){W(e,e.return,x)}break;case 4:Le(t,e),Me(e);break;case 13:Le(t,e),Me(e),l=e.child,l.flags&8192&&(i=l.memoizedState!==null,l.stateNode.isHidden=i,!i||l.alternate!==null&&l.alternate.memoizedState!==null||($o=K())),r&4&&ns(e);break;case 22:if(m=n!==null&&n.memoizedState!==null,e.mode&1?(ie=(a=ie)||m,Le(t,e),ie=a):Le(t,e),Me(e),r&8192){if(a=e.memoizedState!==null,(e.stateNode.isHidden=a)&&!m&&e.mode&1)for(_=e,m=e.child;m!==null;){for(d=_=m;_!==null;){switch(v=_,y=v.child,v.tag){case 0:case 11:case 14:case 15:Fn(4,v,v.return);break;case 1:Xt(v,v.return);var g=v.stateNode;if(typeof g.componentWillUnmount=="function"){r=v,n=v.return;try{t=r,g.props=t.memoizedProps,g.state=t.memoizedState,g.componentWillUnmount()}catch(x){W(r,n,x)}}break;case 5:Xt(v,v.return);break;case 22:if(v.memoizedState!==null){ls(d);continue}}y!==null?(y.return=v,_=y):ls(d)}m=m.sibling}e:for(m=null,d=e;;){if(d.tag===5){if(m===null){m=d;try{l=d.stateNode,a?(i=l.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none"):(u=d.stateNode,s=d.memoizedProps.style,o=s!=null&&s.hasOwnProperty("display")?s.display:null,u.style.display=Js("display",o))}catch(x){W(e,e.return,x)}}}else if(d.tag===6){if(m===null)try{d.stateNode.nodeValue=a?"":d.memoizedProps}catch(x){W(e,e.return,x)}}else if((d.tag!==22&&d.tag!==23||d.memoizedState===null||d===e)&&d.child!==null){d.child.return=d,d=d.child;continue}if(d===e)break e;for(;d.sibling===null;){if(d.return===null||d.return===e)break e;m===d&&(m=null),d=d.return}m===d&&(m=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:Le(t,e),Me(e),r&4&&ns(e);break;case 21:break;default:Le(t,e),Me(e)}}function Me(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(kc(n)){var r=n;break e}n=n.return}throw Error(S(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&($n(l,""),r.flags&=-33);var i=ts(e);Yi(e,i,l);break;case 3:case 4:var o=r.stateNode.containerInfo,u=ts(e);Ki(e,u,o);break;default:throw Error(S(161))}}catch(s){W(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function sp(e,t,n){_=e,_c(e)}function _c(e,t,n){for(var r=(e.mode&1)!==0;_!==null;){var l=_,i=l.child;if(l.tag===22&&r){var o=l.memoizedState!==null||Nr;if(!o){var u=l.alternate,s=u!==null&&u.memoizedState!==null||ie;u=Nr;var a=ie;if(Nr=o,(ie=s)&&!a)for(_=l;_!==null;)o=_,s=o.child,o.tag===22&&o.memoizedState!==null?is(l):s!==null?(s.return=o,_=s):is(l);for(;i!==null;)_=i,_c(i),i=i.sibling;_=l,Nr=u,ie=a}rs(e)}else l.subtreeFlags&8772&&i!==null?(i.return=l,_=i):rs(e)}}function rs(e){for(;_!==null;){var t=_;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ie||Sl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ie)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:ze(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var i=t.updateQueue;i!==null&&$u(t,i,r);break;case 3:var o=t.updateQueue;if(o!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}$u(t,o,n)}break;case 5:var u=t.stateNode;if(n===null&&t.flags&4){n=u;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var a=t.alternate;if(a!==null){var m=a.memoizedState;if(m!==null){var d=m.dehydrated;d!==null&&Qn(d)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(S(163))}ie||t.flags&512&&Qi(t)}catch(v){W(t,t.return,v)}}if(t===e){_=null;break}if(n=t.sibling,n!==null){n.return=t.return,_=n;break}_=t.return}}function ls(e){for(;_!==null;){var t=_;if(t===e){_=null;break}var n=t.sibling;if(n!==null){n.return=t.return,_=n;break}_=t.return}}function is(e){for(;_!==null;){var t=_;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Sl(4,t)}catch(s){W(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){W(t,l,s)}}var i=t.return;try{Qi(t)}catch(s){W(t,i,s)}break;case 5:var o=t.return;try{Qi(t)}catch(s){W(t,o,s)}}}catch(s){W(t,t.return,s)}if(t===e){_=null;break}var u=t.sibling;if(u!==null){u.return=t.return,_=u;break}_=t.return}}var ap=Math.ceil,ol=Je.ReactCurrentDispatcher,Ao=Je.ReactCurrentOwner,_e=Je.ReactCurrentBatchConfig,D=0,b=null,G=null,te=0,ve=0,Jt=yt(0),J=0,nr=null,Dt=0,kl=0,Bo=0,Un=null,fe=null,$o=0,cn=1/0,$e=null,ul=!1,Gi=null,ct=null,jr=!1,rt=null,sl=0,An=0,Xi=null,Ur=-1,Ar=0;function se(){return D&6?K():Ur!==-1?Ur:Ur=K()}function ft(e){return e.mode&1?D&2&&te!==0?te&-te:Kd.transition!==null?(Ar===0&&(Ar=aa()),Ar):(e=I,e!==0||(e=window.event,e=e===void 0?16:va(e.type)),e):1}function De(e,t,n,r){if(50<An)throw An=0,Xi=null,Error(S(185));or(e,n,r),(!(D&2)||e!==b)&&(e===b&&(!(D&2)&&(kl|=n),J===4&&tt(e,te)),me(e,r),n===1&&D===0&&!(t.mode&1)&&(cn=K()+500,gl&&gt()))}function me(e,t){var n=e.callbackNode;Kf(e,t);var r=Qr(e,e===b?te:0);if(r===0)n!==null&&hu(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&hu(n),t===1)e.tag===0?Qd(os.bind(null,e)):Ia(os.bind(null,e)),$d(function(){!(D&6)&&gt()}),n=null;else{switch(ca(r)){case 1:n=po;break;case 4:n=ua;break;case 16:n=Hr;break;case 536870912:n=sa;break;default:n=Hr}n=Oc(n,Nc.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Nc(e,t){if(Ur=-1,Ar=0,D&6)throw Error(S(327));var n=e.callbackNode;if(nn()&&e.callbackNode!==n)return null;var r=Qr(e,e===b?te:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=al(e,r);else{t=r;var l=D;D|=2;var i=Pc();(b!==e||te!==t)&&($e=null,cn=K()+500,Lt(e,t));do try{dp();break}catch(u){jc(e,u)}while(!0);No(),ol.current=i,D=l,G!==null?t=0:(b=null,te=0,t=J)}if(t!==0){if(t===2&&(l=ki(e),l!==0&&(r=l,t=Ji(e,l))),t===1)throw n=nr,Lt(e,0),tt(e,r),me(e,K()),n;if(t===6)tt(e,r);else{if(l=e.current.alternate,!(r&30)&&!cp(l)&&(t=al(e,r),t===2&&(i=ki(e),i!==0&&(r=i,t=Ji(e,i))),t===1))throw n=nr,Lt(e,0),tt(e,r),me(e,K()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(S(345));case 2:Ct(e,fe,$e);break;case 3:if(tt(e,r),(r&130023424)===r&&(t=$o+500-K(),10<t)){if(Qr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){se(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=zi(Ct.bind(null,e,fe,$e),t);break}Ct(e,fe,$e);break;case 4:if(tt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var o=31-Oe(r);i=1<<o,o=t[o],o>l&&(l=o),r&=~i}if(r=l,r=K()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*ap(r/1960))-r,10<r){e.timeoutHandle=zi(Ct.bind(null,e,fe,$e),r);break}Ct(e,fe,$e);break;case 5:Ct(e,fe,$e);break;default:throw Error(S(329))}}}return me(e,K()),e.callbackNode===n?Nc.bind(null,e):null}function Ji(e,t){var n=Un;return e.current.memoizedState.isDehydrated&&(Lt(e,t).flags|=256),e=al(e,t),e!==2&&(t=fe,fe=n,t!==null&&Zi(t)),e}function Zi(e){fe===null?fe=e:fe.push.apply(fe,e)}function cp(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],i=l.getSnapshot;l=l.value;try{if(!Ie(i(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function tt(e,t){for(t&=~Bo,t&=~kl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Oe(t),r=1<<n;e[n]=-1,t&=~r}}function os(e){if(D&6)throw Error(S(327));nn();var t=Qr(e,0);if(!(t&1))return me(e,K()),null;var n=al(e,t);if(e.tag!==0&&n===2){var r=ki(e);r!==0&&(t=r,n=Ji(e,r))}if(n===1)throw n=nr,Lt(e,0),tt(e,t),me(e,K()),n;if(n===6)throw Error(S(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,Ct(e,fe,$e),me(e,K()),null}function Vo(e,t){var n=D;D|=1;try{return e(t)}finally{D=n,D===0&&(cn=K()+500,gl&&gt())}}function It(e){rt!==null&&rt.tag===0&&!(D&6)&&nn();var t=D;D|=1;var n=_e.transition,r=I;try{if(_e.transition=null,I=1,e)return e()}finally{I=r,_e.transition=n,D=t,!(D&6)&&gt()}}function Wo(){ve=Jt.current,U(Jt)}function Lt(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Bd(n)),G!==null)for(n=G.return;n!==null;){var r=n;switch(Eo(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Jr();break;case 3:sn(),U(pe),U(oe),Ro();break;case 5:To(r);break;case 4:sn();break;case 13:U(B);break;case 19:U(B);break;case 10:jo(r.type._context);break;case 22:case 23:Wo()}n=n.return}if(b=e,G=e=dt(e.current,null),te=ve=t,J=0,nr=null,Bo=kl=Dt=0,fe=Un=null,Nt!==null){for(t=0;t<Nt.length;t++)if(n=Nt[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,i=n.pending;if(i!==null){var o=i.next;i.next=l,r.next=o}n.pending=r}Nt=null}return e}function jc(e,t){do{var n=G;try{if(No(),Ir.current=il,ll){for(var r=$.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}ll=!1}if(Ot=0,q=X=$=null,Mn=!1,bn=0,Ao.current=null,n===null||n.return===null){J=1,nr=t,G=null;break}e:{var i=e,o=n.return,u=n,s=t;if(t=te,u.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var a=s,m=u,d=m.tag;if(!(m.mode&1)&&(d===0||d===11||d===15)){var v=m.alternate;v?(m.updateQueue=v.updateQueue,m.memoizedState=v.memoizedState,m.lanes=v.lanes):(m.updateQueue=null,m.memoizedState=null)}var y=Yu(o);if(y!==null){y.flags&=-257,Gu(y,o,u,i,t),y.mode&1&&Ku(i,a,t),t=y,s=a;var g=t.updateQueue;if(g===null){var x=new Set;x.add(s),t.updateQueue=x}else g.add(s);break e}else{if(!(t&1)){Ku(i,a,t),Ho();break e}s=Error(S(426))}}else if(A&&u.mode&1){var C=Yu(o);if(C!==null){!(C.flags&65536)&&(C.flags|=256),Gu(C,o,u,i,t),Co(an(s,u));break e}}i=s=an(s,u),J!==4&&(J=2),Un===null?Un=[i]:Un.push(i),i=o;do{switch(i.tag){case 3:i.flags|=65536,t&=-t,i.lanes|=t;var f=cc(i,s,t);Bu(i,f);break e;case 1:u=s;var c=i.type,p=i.stateNode;if(!(i.flags&128)&&(typeof c.getDerivedStateFromError=="function"||p!==null&&typeof p.componentDidCatch=="function"&&(ct===null||!ct.has(p)))){i.flags|=65536,t&=-t,i.lanes|=t;var w=fc(i,u,t);Bu(i,w);break e}}i=i.return}while(i!==null)}zc(n)}catch(E){t=E,G===n&&n!==null&&(G=n=n.return);continue}break}while(!0)}function Pc(){var e=ol.current;return ol.current=il,e===null?il:e}function Ho(){(J===0||J===3||J===2)&&(J=4),b===null||!(Dt&268435455)&&!(kl&268435455)||tt(b,te)}function al(e,t){var n=D;D|=2;var r=Pc();(b!==e||te!==t)&&($e=null,Lt(e,t));do try{fp();break}catch(l){jc(e,l)}while(!0);if(No(),D=n,ol.current=r,G!==null)throw Error(S(261));return b=null,te=0,J}function fp(){for(;G!==null;)Lc(G)}function dp(){for(;G!==null&&!Ff();)Lc(G)}function Lc(e){var t=Rc(e.alternate,e,ve);e.memoizedProps=e.pendingProps,t===null?zc(e):G=t,Ao.current=null}function zc(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=ip(n,t),n!==null){n.flags&=32767,G=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{J=6,G=null;return}}else if(n=lp(n,t,ve),n!==null){G=n;return}if(t=t.sibling,t!==null){G=t;return}G=t=e}while(t!==null);J===0&&(J=5)}function Ct(e,t,n){var r=I,l=_e.transition;try{_e.transition=null,I=1,pp(e,t,n,r)}finally{_e.transition=l,I=r}return null}function pp(e,t,n,r){do nn();while(rt!==null);if(D&6)throw Error(S(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(S(177));e.callbackNode=null,e.callbackPriority=0;var i=n.lanes|n.childLanes;if(Yf(e,i),e===b&&(G=b=null,te=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||jr||(jr=!0,Oc(Hr,function(){return nn(),null})),i=(n.flags&15990)!==0,n.subtreeFlags&15990||i){i=_e.transition,_e.transition=null;var o=I;I=1;var u=D;D|=4,Ao.current=null,up(e,n),Cc(n,e),Od(Pi),Kr=!!ji,Pi=ji=null,e.current=n,sp(n),Uf(),D=u,I=o,_e.transition=i}else e.current=n;if(jr&&(jr=!1,rt=e,sl=l),i=e.pendingLanes,i===0&&(ct=null),$f(n.stateNode),me(e,K()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(ul)throw ul=!1,e=Gi,Gi=null,e;return sl&1&&e.tag!==0&&nn(),i=e.pendingLanes,i&1?e===Xi?An++:(An=0,Xi=e):An=0,gt(),null}function nn(){if(rt!==null){var e=ca(sl),t=_e.transition,n=I;try{if(_e.transition=null,I=16>e?16:e,rt===null)var r=!1;else{if(e=rt,rt=null,sl=0,D&6)throw Error(S(331));var l=D;for(D|=4,_=e.current;_!==null;){var i=_,o=i.child;if(_.flags&16){var u=i.deletions;if(u!==null){for(var s=0;s<u.length;s++){var a=u[s];for(_=a;_!==null;){var m=_;switch(m.tag){case 0:case 11:case 15:Fn(8,m,i)}var d=m.child;if(d!==null)d.return=m,_=d;else for(;_!==null;){m=_;var v=m.sibling,y=m.return;if(Sc(m),m===a){_=null;break}if(v!==null){v.return=y,_=v;break}_=y}}}var g=i.alternate;if(g!==null){var x=g.child;if(x!==null){g.child=null;do{var C=x.sibling;x.sibling=null,x=C}while(x!==null)}}_=i}}if(i.subtreeFlags&2064&&o!==null)o.return=i,_=o;else e:for(;_!==null;){if(i=_,i.flags&2048)switch(i.tag){case 0:case 11:case 15:Fn(9,i,i.return)}var f=i.sibling;if(f!==null){f.return=i.return,_=f;break e}_=i.return}}var c=e.current;for(_=c;_!==null;){o=_;var p=o.child;if(o.subtreeFlags&2064&&p!==null)p.return=o,_=p;else e:for(o=c;_!==null;){if(u=_,u.flags&2048)try{switch(u.tag){case 0:case 11:case 15:Sl(9,u)}}catch(E){W(u,u.return,E)}if(u===o){_=null;break e}var w=u.sibling;if(w!==null){w.return=u.return,_=w;break e}_=u.return}}if(D=l,gt(),Ae&&typeof Ae.onPostCommitFiberRoot=="function")try{Ae.onPostCommitFiberRoot(pl,e)}catch{}r=!0}return r}finally{I=n,_e.transition=t}}return!1}function us(e,t,n){t=an(n,t),t=cc(e,t,1),e=at(e,t,1),t=se(),e!==null&&(or(e,1,t),me(e,t))}function W(e,t,n){if(e.tag===3)us(e,e,n);else for(;t!==null;){if(t.tag===3){us(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(ct===null||!ct.has(r))){e=an(n,e),e=fc(t,e,1),t=at(t,e,1),e=se(),t!==null&&(or(t,1,e),me(t,e));break}}t=t.return}}function hp(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=se(),e.pingedLanes|=e.suspendedLanes&n,b===e&&(te&n)===n&&(J===4||J===3&&(te&130023424)===te&&500>K()-$o?Lt(e,0):Bo|=n),me(e,t)}function Tc(e,t){t===0&&(e.mode&1?(t=yr,yr<<=1,!(yr&130023424)&&(yr=4194304)):t=1);var n=se();e=Ge(e,t),e!==null&&(or(e,t,n),me(e,n))}function mp(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),Tc(e,n)}function vp(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(S(314))}r!==null&&r.delete(t),Tc(e,n)}var Rc;Rc=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||pe.current)de=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return de=!1,rp(e,t,n);de=!!(e.flags&131072)}else de=!1,A&&t.flags&1048576&&Ma(t,br,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Fr(e,t),e=t.pendingProps;var l=ln(t,oe.current);tn(t,n),l=Do(null,t,r,e,l,n);var i=Io();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,he(r)?(i=!0,Zr(t)):i=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,Lo(t),l.updater=xl,t.stateNode=l,l._reactInternals=t,Fi(t,r,e,n),t=Bi(null,t,r,!0,i,n)):(t.tag=0,A&&i&&ko(t),ue(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Fr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=gp(r),e=ze(r,e),l){case 0:t=Ai(null,t,r,e,n);break e;case 1:t=Zu(null,t,r,e,n);break e;case 11:t=Xu(null,t,r,e,n);break e;case 14:t=Ju(null,t,r,ze(r.type,e),n);break e}throw Error(S(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:ze(r,l),Ai(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:ze(r,l),Zu(e,t,r,l,n);case 3:e:{if(mc(t),e===null)throw Error(S(387));r=t.pendingProps,i=t.memoizedState,l=i.element,Va(e,t),nl(t,r,null,n);var o=t.memoizedState;if(r=o.element,i.isDehydrated)if(i={element:r,isDehydrated:!1,cache:o.cache,pendingSuspenseBoundaries:o.pendingSuspenseBoundaries,transitions:o.transitions},t.updateQueue.baseState=i,t.memoizedState=i,t.flags&256){l=an(Error(S(423)),t),t=qu(e,t,r,n,l);break e}else if(r!==l){l=an(Error(S(424)),t),t=qu(e,t,r,n,l);break e}else for(ye=st(t.stateNode.containerInfo.firstChild),ge=t,A=!0,Re=null,n=Ba(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(on(),r===l){t=Xe(e,t,n);break e}ue(e,t,r,n)}t=t.child}return t;case 5:return Wa(t),e===null&&Di(t),r=t.type,l=t.pendingProps,i=e!==null?e.memoizedProps:null,o=l.children,Li(r,l)?o=null:i!==null&&Li(r,i)&&(t.flags|=32),hc(e,t),ue(e,t,o,n),t.child;case 6:return e===null&&Di(t),null;case 13:return vc(e,t,n);case 4:return zo(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=un(t,null,r,n):ue(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:ze(r,l),Xu(e,t,r,l,n);case 7:return ue(e,t,t.pendingProps,n),t.child;case 8:return ue(e,t,t.pendingProps.children,n),t.child;case 12:return ue(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,i=t.memoizedProps,o=l.value,M(el,r._currentValue),r._currentValue=o,i!==null)if(Ie(i.value,o)){if(i.children===l.children&&!pe.current){t=Xe(e,t,n);break e}}else for(i=t.child,i!==null&&(i.return=t);i!==null;){var u=i.dependencies;if(u!==null){o=i.child;for(var s=u.firstContext;s!==null;){if(s.context===r){if(i.tag===1){s=Qe(-1,n&-n),s.tag=2;var a=i.updateQueue;if(a!==null){a=a.shared;var m=a.pending;m===null?s.next=s:(s.next=m.next,m.next=s),a.pending=s}}i.lanes|=n,s=i.alternate,s!==null&&(s.lanes|=n),Ii(i.return,n,t),u.lanes|=n;break}s=s.next}}else if(i.tag===10)o=i.type===t.type?null:i.child;else if(i.tag===18){if(o=i.return,o===null)throw Error(S(341));o.lanes|=n,u=o.alternate,u!==null&&(u.lanes|=n),Ii(o,n,t),o=i.sibling}else o=i.child;if(o!==null)o.return=i;else for(o=i;o!==null;){if(o===t){o=null;break}if(i=o.sibling,i!==null){i.return=o.return,o=i;break}o=o.return}i=o}ue(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,tn(t,n),l=Ne(l),r=r(l),t.flags|=1,ue(e,t,r,n),t.child;case 14:return r=t.type,l=ze(r,t.pendingProps),l=ze(r.type,l),Ju(e,t,r,l,n);case 15:return dc(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:ze(r,l),Fr(e,t),t.tag=1,he(r)?(e=!0,Zr(t)):e=!1,tn(t,n),ac(t,r,l),Fi(t,r,l,n),Bi(null,t,r,!0,e,n);case 19:return yc(e,t,n);case 22:return pc(e,t,n)}throw Error(S(156,t.tag))};function Oc(e,t){return oa(e,t)}function yp(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ce(e,t,n,r){return new yp(e,t,n,r)}function Qo(e){return e=e.prototype,!(!e||!e.isReactComponent)}function gp(e){if(typeof e=="function")return Qo(e)?1:0;if(e!=null){if(e=e.$$typeof,e===ao)return 11;if(e===co)return 14}return 2}function dt(e,t){var n=e.alternate;return n===null?(n=Ce(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Br(e,t,n,r,l,i){var o=2;if(r=e,typeof e=="function")Qo(e)&&(o=1);else if(typeof e=="string")o=5;else e:switch(e){case Bt:return zt(n.children,l,i,t);case so:o=8,l|=8;break;case ui:return e=Ce(12,n,t,l|2),e.elementType=ui,e.lanes=i,e;case si:return e=Ce(13,n,t,l),e.elementType=si,e.lanes=i,e;case ai:return e=Ce(19,n,t,l),e.elementType=ai,e.lanes=i,e;case Ws:return El(n,l,i,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case $s:o=10;break e;case Vs:o=9;break e;case ao:o=11;break e;case co:o=14;break e;case qe:o=16,r=null;break e}throw Error(S(130,e==null?e:typeof e,""))}return t=Ce(o,n,t,l),t.elementType=e,t.type=r,t.lanes=i,t}function zt(e,t,n,r){return e=Ce(7,e,r,t),e.lanes=n,e}function El(e,t,n,r){return e=Ce(22,e,r,t),e.elementType=Ws,e.lanes=n,e.stateNode={isHidden:!1},e}function ni(e,t,n){return e=Ce(6,e,null,t),e.lanes=n,e}function ri(e,t,n){return t=Ce(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function wp(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=Fl(0),this.expirationTimes=Fl(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Fl(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function Ko(e,t,n,r,l,i,o,u,s){return e=new wp(e,t,n,u,s),t===1?(t=1,i===!0&&(t|=8)):t=0,i=Ce(3,null,null,t),e.current=i,i.stateNode=e,i.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Lo(i),e}function xp(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:At,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function Dc(e){if(!e)return mt;e=e._reactInternals;e:{if(Ft(e)!==e||e.tag!==1)throw Error(S(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(he(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(S(171))}if(e.tag===1){var n=e.type;if(he(n))return Da(e,n,t)}return t}function Ic(e,t,n,r,l,i,o,u,s){return e=Ko(n,r,!0,e,l,i,o,u,s),e.context=Dc(null),n=e.current,r=se(),l=ft(n),i=Qe(r,l),i.callback=t??null,at(n,i,l),e.current.lanes=l,or(e,l,r),me(e,r),e}function Cl(e,t,n,r){var l=t.current,i=se(),o=ft(l);return n=Dc(n),t.context===null?t.context=n:t.pendingContext=n,t=Qe(i,o),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=at(l,t,o),e!==null&&(De(e,l,o,i),Dr(e,l,o)),o}function cl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function ss(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Yo(e,t){ss(e,t),(e=e.alternate)&&ss(e,t)}function Sp(){return null}var Mc=typeof reportError=="function"?reportError:function(e){console.error(e)};function Go(e){this._internalRoot=e}_l.prototype.render=Go.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(S(409));Cl(e,t,null,null)};_l.prototype.unmount=Go.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;It(function(){Cl(null,e,null,null)}),t[Ye]=null}};function _l(e){this._internalRoot=e}_l.prototype.unstable_scheduleHydration=function(e){if(e){var t=pa();e={blockedOn:null,target:e,priority:t};for(var n=0;n<et.length&&t!==0&&t<et[n].priority;n++);et.splice(n,0,e),n===0&&ma(e)}};function Xo(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function Nl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function as(){}function kp(e,t,n,r,l){if(l){if(typeof r=="function"){var i=r;r=function(){var a=cl(o);i.call(a)}}var o=Ic(t,r,e,0,null,!1,!1,"",as);return e._reactRootContainer=o,e[Ye]=o.current,Gn(e.nodeType===8?e.parentNode:e),It(),o}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var u=r;r=function(){var a=cl(s);u.call(a)}}var s=Ko(e,0,!1,null,null,!1,!1,"",as);return e._reactRootContainer=s,e[Ye]=s.current,Gn(e.nodeType===8?e.parentNode:e),It(function(){Cl(t,s,n,r)}),s}function jl(e,t,n,r,l){var i=n._reactRootContainer;if(i){var o=i;if(typeof l=="function"){var u=l;l=function(){var s=cl(o);u.call(s)}}Cl(t,o,e,l)}else o=kp(n,t,e,l,r);return cl(o)}fa=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Ln(t.pendingLanes);n!==0&&(ho(t,n|1),me(t,K()),!(D&6)&&(cn=K()+500,gt()))}break;case 13:It(function(){var r=Ge(e,1);if(r!==null){var l=se();De(r,e,1,l)}}),Yo(e,1)}};mo=function(e){if(e.tag===13){var t=Ge(e,134217728);if(t!==null){var n=se();De(t,e,134217728,n)}Yo(e,134217728)}};da=function(e){if(e.tag===13){var t=ft(e),n=Ge(e,t);if(n!==null){var r=se();De(n,e,t,r)}Yo(e,t)}};pa=function(){return I};ha=function(e,t){var n=I;try{return I=e,t()}finally{I=n}};wi=function(e,t,n){switch(t){case"input":if(di(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=yl(r);if(!l)throw Error(S(90));Qs(r),di(r,l)}}}break;case"textarea":Ys(e,n);break;case"select":t=n.value,t!=null&&Zt(e,!!n.multiple,t,!1)}};ea=Vo;ta=It;var Ep={usingClientEntryPoint:!1,Events:[sr,Ht,yl,qs,bs,Vo]},Nn={findFiberByHostInstance:_t,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},Cp={bundleType:Nn.bundleType,version:Nn.version,rendererPackageName:Nn.rendererPackageName,rendererConfig:Nn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Je.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=la(e),e===null?null:e.stateNode},findFiberByHostInstance:Nn.findFiberByHostInstance||Sp,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Pr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Pr.isDisabled&&Pr.supportsFiber)try{pl=Pr.inject(Cp),Ae=Pr}catch{}}xe.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Ep;xe.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Xo(t))throw Error(S(200));return xp(e,t,null,n)};xe.createRoot=function(e,t){if(!Xo(e))throw Error(S(299));var n=!1,r="",l=Mc;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=Ko(e,1,!1,null,null,n,!1,r,l),e[Ye]=t.current,Gn(e.nodeType===8?e.parentNode:e),new Go(t)};xe.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(S(188)):(e=Object.keys(e).join(","),Error(S(268,e)));return e=la(t),e=e===null?null:e.stateNode,e};xe.flushSync=function(e){return It(e)};xe.hydrate=function(e,t,n){if(!Nl(t))throw Error(S(200));return jl(null,e,t,!0,n)};xe.hydrateRoot=function(e,t,n){if(!Xo(e))throw Error(S(405));var r=n!=null&&n.hydratedSources||null,l=!1,i="",o=Mc;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(i=n.identifierPrefix),n.onRecoverableError!==void 0&&(o=n.onRecoverableError)),t=Ic(t,null,e,1,n??null,l,!1,i,o),e[Ye]=t.current,Gn(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new _l(t)};xe.render=function(e,t,n){if(!Nl(t))throw Error(S(200));return jl(null,e,t,!1,n)};xe.unmountComponentAtNode=function(e){if(!Nl(e))throw Error(S(40));return e._reactRootContainer?(It(function(){jl(null,null,e,!1,function(){e._reactRootContainer=null,e[Ye]=null})}),!0):!1};xe.unstable_batchedUpdates=Vo;xe.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Nl(n))throw Error(S(200));if(e==null||e._reactInternals===void 0)throw Error(S(38));return jl(e,t,n,!1,r)};xe.version="18.3.1-next-f1338f8080-20240426";function Fc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(Fc)}catch(e){console.error(e)}}Fc(),Fs.exports=xe;var _p=Fs.exports,cs=_p;ii.createRoot=cs.createRoot,ii.hydrateRoot=cs.hydrateRoot;/**
- * @remix-run/router v1.23.1
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function rr(){return rr=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},rr.apply(this,arguments)}var lt;(function(e){e.Pop="POP",e.Push="PUSH",e.Replace="REPLACE"})(lt||(lt={}));const fs="popstate";function Np(e){e===void 0&&(e={});function t(r,l){let{pathname:i,search:o,hash:u}=r.location;return qi("",{pathname:i,search:o,hash:u},l.state&&l.state.usr||null,l.state&&l.state.key||"default")}function n(r,l){return typeof l=="string"?l:fl(l)}return Pp(t,n,null,e)}function Y(e,t){if(e===!1||e===null||typeof e>"u")throw new Error(t)}function Jo(e,t){if(!e){typeof console<"u"&&console.warn(t);try{throw new Error(t)}catch{}}}function jp(){return Math.random().toString(36).substr(2,8)}function ds(e,t){return{usr:e.state,key:e.key,idx:t}}function qi(e,t,n,r){return n===void 0&&(n=null),rr({pathname:typeof e=="string"?e:e.pathname,search:"",hash:""},typeof t=="string"?hn(t):t,{state:n,key:t&&t.key||r||jp()})}function fl(e){let{pathname:t="/",search:n="",hash:r=""}=e;return n&&n!=="?"&&(t+=n.charAt(0)==="?"?n:"?"+n),r&&r!=="#"&&(t+=r.charAt(0)==="#"?r:"#"+r),t}function hn(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substr(n),e=e.substr(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substr(r),e=e.substr(0,r)),e&&(t.pathname=e)}return t}function Pp(e,t,n,r){r===void 0&&(r={});let{window:l=document.defaultView,v5Compat:i=!1}=r,o=l.history,u=lt.Pop,s=null,a=m();a==null&&(a=0,o.replaceState(rr({},o.state,{idx:a}),""));function m(){return(o.state||{idx:null}).idx}function d(){u=lt.Pop;let C=m(),f=C==null?null:C-a;a=C,s&&s({action:u,location:x.location,delta:f})}function v(C,f){u=lt.Push;let c=qi(x.location,C,f);a=m()+1;let p=ds(c,a),w=x.createHref(c);try{o.pushState(p,"",w)}catch(E){if(E instanceof DOMException&&E.name==="DataCloneError")throw E;l.location.assign(w)}i&&s&&s({action:u,location:x.location,delta:1})}function y(C,f){u=lt.Replace;let c=qi(x.location,C,f);a=m();let p=ds(c,a),w=x.createHref(c);o.replaceState(p,"",w),i&&s&&s({action:u,location:x.location,delta:0})}function g(C){let f=l.location.origin!=="null"?l.location.origin:l.location.href,c=typeof C=="string"?C:fl(C);return c=c.replace(/ $/,"%20"),Y(f,"No window.location.(origin|href) available to create URL for href: "+c),new URL(c,f)}let x={get action(){return u},get location(){return e(l,o)},listen(C){if(s)throw new Error("A history only accepts one active listener");return l.addEventListener(fs,d),s=C,()=>{l.removeEventListener(fs,d),s=null}},createHref(C){return t(l,C)},createURL:g,encodeLocation(C){let f=g(C);return{pathname:f.pathname,search:f.search,hash:f.hash}},push:v,replace:y,go(C){return o.go(C)}};return x}var ps;(function(e){e.data="data",e.deferred="deferred",e.redirect="redirect",e.error="error"})(ps||(ps={}));function Lp(e,t,n){return n===void 0&&(n="/"),zp(e,t,n)}function zp(e,t,n,r){let l=typeof t=="string"?hn(t):t,i=Zo(l.pathname||"/",n);if(i==null)return null;let o=Uc(e);Tp(o);let u=null;for(let s=0;u==null&&s<o.length;++s){let a=Wp(i);u=Bp(o[s],a)}return u}function Uc(e,t,n,r){t===void 0&&(t=[]),n===void 0&&(n=[]),r===void 0&&(r="");let l=(i,o,u)=>{let s={relativePath:u===void 0?i.path||"":u,caseSensitive:i.caseSensitive===!0,childrenIndex:o,route:i};s.relativePath.startsWith("/")&&(Y(s.relativePath.startsWith(r),'Absolute route path "'+s.relativePath+'" nested under path '+('"'+r+'" is not valid. An absolute child route path ')+"must start with the combined path of all its parent routes."),s.relativePath=s.relativePath.slice(r.length));let a=pt([r,s.relativePath]),m=n.concat(s);i.children&&i.children.length>0&&(Y(i.index!==!0,"Index routes must not have child routes. Please remove "+('all child routes from route path "'+a+'".')),Uc(i.children,t,m,a)),!(i.path==null&&!i.index)&&t.push({path:a,score:Up(a,i.index),routesMeta:m})};return e.forEach((i,o)=>{var u;if(i.path===""||!((u=i.path)!=null&&u.includes("?")))l(i,o);else for(let s of Ac(i.path))l(i,o,s)}),t}function Ac(e){let t=e.split("/");if(t.length===0)return[];let[n,...r]=t,l=n.endsWith("?"),i=n.replace(/\?$/,"");if(r.length===0)return l?[i,""]:[i];let o=Ac(r.join("/")),u=[];return u.push(...o.map(s=>s===""?i:[i,s].join("/"))),l&&u.push(...o),u.map(s=>e.startsWith("/")&&s===""?"/":s)}function Tp(e){e.sort((t,n)=>t.score!==n.score?n.score-t.score:Ap(t.routesMeta.map(r=>r.childrenIndex),n.routesMeta.map(r=>r.childrenIndex)))}const Rp=/^:[\w-]+$/,Op=3,Dp=2,Ip=1,Mp=10,Fp=-2,hs=e=>e==="*";function Up(e,t){let n=e.split("/"),r=n.length;return n.some(hs)&&(r+=Fp),t&&(r+=Dp),n.filter(l=>!hs(l)).reduce((l,i)=>l+(Rp.test(i)?Op:i===""?Ip:Mp),r)}function Ap(e,t){return e.length===t.length&&e.slice(0,-1).every((r,l)=>r===t[l])?e[e.length-1]-t[t.length-1]:0}function Bp(e,t,n){let{routesMeta:r}=e,l={},i="/",o=[];for(let u=0;u<r.length;++u){let s=r[u],a=u===r.length-1,m=i==="/"?t:t.slice(i.length)||"/",d=$p({path:s.relativePath,caseSensitive:s.caseSensitive,end:a},m),v=s.route;if(!d)return null;Object.assign(l,d.params),o.push({params:l,pathname:pt([i,d.pathname]),pathnameBase:Gp(pt([i,d.pathnameBase])),route:v}),d.pathnameBase!=="/"&&(i=pt([i,d.pathnameBase]))}return o}function $p(e,t){typeof e=="string"&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=Vp(e.path,e.caseSensitive,e.end),l=t.match(n);if(!l)return null;let i=l[0],o=i.replace(/(.)\/+$/,"$1"),u=l.slice(1);return{params:r.reduce((a,m,d)=>{let{paramName:v,isOptional:y}=m;if(v==="*"){let x=u[d]||"";o=i.slice(0,i.length-x.length).replace(/(.)\/+$/,"$1")}const g=u[d];return y&&!g?a[v]=void 0:a[v]=(g||"").replace(/%2F/g,"/"),a},{}),pathname:i,pathnameBase:o,pattern:e}}function Vp(e,t,n){t===void 0&&(t=!1),n===void 0&&(n=!0),Jo(e==="*"||!e.endsWith("*")||e.endsWith("/*"),'Route path "'+e+'" will be treated as if it were '+('"'+e.replace(/\*$/,"/*")+'" because the `*` character must ')+"always follow a `/` in the pattern. To get rid of this warning, "+('please change the route path to "'+e.replace(/\*$/,"/*")+'".'));let r=[],l="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(o,u,s)=>(r.push({paramName:u,isOptional:s!=null}),s?"/?([^\\/]+)?":"/([^\\/]+)"));return e.endsWith("*")?(r.push({paramName:"*"}),l+=e==="*"||e==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?l+="\\/*$":e!==""&&e!=="/"&&(l+="(?:(?=\\/|$))"),[new RegExp(l,t?void 0:"i"),r]}function Wp(e){try{return e.split("/").map(t=>decodeURIComponent(t).replace(/\//g,"%2F")).join("/")}catch(t){return Jo(!1,'The URL path "'+e+'" could not be decoded because it is is a malformed URL segment. This is probably due to a bad percent '+("encoding ("+t+").")),e}}function Zo(e,t){if(t==="/")return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&r!=="/"?null:e.slice(n)||"/"}const Hp=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,Qp=e=>Hp.test(e);function Kp(e,t){t===void 0&&(t="/");let{pathname:n,search:r="",hash:l=""}=typeof e=="string"?hn(e):e,i;if(n)if(Qp(n))i=n;else{if(n.includes("//")){let o=n;n=n.replace(/\/\/+/g,"/"),Jo(!1,"Pathnames cannot have embedded double slashes - normalizing "+(o+" -> "+n))}n.startsWith("/")?i=ms(n.substring(1),"/"):i=ms(n,t)}else i=t;return{pathname:i,search:Xp(r),hash:Jp(l)}}function ms(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach(l=>{l===".."?n.length>1&&n.pop():l!=="."&&n.push(l)}),n.length>1?n.join("/"):"/"}function li(e,t,n,r){return"Cannot include a '"+e+"' character in a manually specified "+("`to."+t+"` field ["+JSON.stringify(r)+"].  Please separate it out to the ")+("`to."+n+"` field. Alternatively you may provide the full path as ")+'a string in <Link to="..."> and the router will parse it for you.'}function Yp(e){return e.filter((t,n)=>n===0||t.route.path&&t.route.path.length>0)}function qo(e,t){let n=Yp(e);return t?n.map((r,l)=>l===n.length-1?r.pathname:r.pathnameBase):n.map(r=>r.pathnameBase)}function bo(e,t,n,r){r===void 0&&(r=!1);let l;typeof e=="string"?l=hn(e):(l=rr({},e),Y(!l.pathname||!l.pathname.includes("?"),li("?","pathname","search",l)),Y(!l.pathname||!l.pathname.includes("#"),li("#","pathname","hash",l)),Y(!l.search||!l.search.includes("#"),li("#","search","hash",l)));let i=e===""||l.pathname==="",o=i?"/":l.pathname,u;if(o==null)u=n;else{let d=t.length-1;if(!r&&o.startsWith("..")){let v=o.split("/");for(;v[0]==="..";)v.shift(),d-=1;l.pathname=v.join("/")}u=d>=0?t[d]:"/"}let s=Kp(l,u),a=o&&o!=="/"&&o.endsWith("/"),m=(i||o===".")&&n.endsWith("/");return!s.pathname.endsWith("/")&&(a||m)&&(s.pathname+="/"),s}const pt=e=>e.join("/").replace(/\/\/+/g,"/"),Gp=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),Xp=e=>!e||e==="?"?"":e.startsWith("?")?e:"?"+e,Jp=e=>!e||e==="#"?"":e.startsWith("#")?e:"#"+e;function Zp(e){return e!=null&&typeof e.status=="number"&&typeof e.statusText=="string"&&typeof e.internal=="boolean"&&"data"in e}const Bc=["post","put","patch","delete"];new Set(Bc);const qp=["get",...Bc];new Set(qp);/**
- * React Router v6.30.2
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function lr(){return lr=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},lr.apply(this,arguments)}const eu=k.createContext(null),bp=k.createContext(null),wt=k.createContext(null),Pl=k.createContext(null),xt=k.createContext({outlet:null,matches:[],isDataRoute:!1}),$c=k.createContext(null);function eh(e,t){let{relative:n}=t===void 0?{}:t;mn()||Y(!1);let{basename:r,navigator:l}=k.useContext(wt),{hash:i,pathname:o,search:u}=Hc(e,{relative:n}),s=o;return r!=="/"&&(s=o==="/"?r:pt([r,o])),l.createHref({pathname:s,search:u,hash:i})}function mn(){return k.useContext(Pl)!=null}function vn(){return mn()||Y(!1),k.useContext(Pl).location}function Vc(e){k.useContext(wt).static||k.useLayoutEffect(e)}function Wc(){let{isDataRoute:e}=k.useContext(xt);return e?ph():th()}function th(){mn()||Y(!1);let e=k.useContext(eu),{basename:t,future:n,navigator:r}=k.useContext(wt),{matches:l}=k.useContext(xt),{pathname:i}=vn(),o=JSON.stringify(qo(l,n.v7_relativeSplatPath)),u=k.useRef(!1);return Vc(()=>{u.current=!0}),k.useCallback(function(a,m){if(m===void 0&&(m={}),!u.current)return;if(typeof a=="number"){r.go(a);return}let d=bo(a,JSON.parse(o),i,m.relative==="path");e==null&&t!=="/"&&(d.pathname=d.pathname==="/"?t:pt([t,d.pathname])),(m.replace?r.replace:r.push)(d,m.state,m)},[t,r,o,i,e])}function Hc(e,t){let{relative:n}=t===void 0?{}:t,{future:r}=k.useContext(wt),{matches:l}=k.useContext(xt),{pathname:i}=vn(),o=JSON.stringify(qo(l,r.v7_relativeSplatPath));return k.useMemo(()=>bo(e,JSON.parse(o),i,n==="path"),[e,o,i,n])}function nh(e,t){return rh(e,t)}function rh(e,t,n,r){mn()||Y(!1);let{navigator:l}=k.useContext(wt),{matches:i}=k.useContext(xt),o=i[i.length-1],u=o?o.params:{};o&&o.pathname;let s=o?o.pathnameBase:"/";o&&o.route;let a=vn(),m;if(t){var d;let C=typeof t=="string"?hn(t):t;s==="/"||(d=C.pathname)!=null&&d.startsWith(s)||Y(!1),m=C}else m=a;let v=m.pathname||"/",y=v;if(s!=="/"){let C=s.replace(/^\//,"").split("/");y="/"+v.replace(/^\//,"").split("/").slice(C.length).join("/")}let g=Lp(e,{pathname:y}),x=sh(g&&g.map(C=>Object.assign({},C,{params:Object.assign({},u,C.params),pathname:pt([s,l.encodeLocation?l.encodeLocation(C.pathname).pathname:C.pathname]),pathnameBase:C.pathnameBase==="/"?s:pt([s,l.encodeLocation?l.encodeLocation(C.pathnameBase).pathname:C.pathnameBase])})),i,n,r);return t&&x?k.createElement(Pl.Provider,{value:{location:lr({pathname:"/",search:"",hash:"",state:null,key:"default"},m),navigationType:lt.Pop}},x):x}function lh(){let e=dh(),t=Zp(e)?e.status+" "+e.statusText:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,l={padding:"0.5rem",backgroundColor:"rgba(200,200,200, 0.5)"};return k.createElement(k.Fragment,null,k.createElement("h2",null,"Unexpected Application Error!"),k.createElement("h3",{style:{fontStyle:"italic"}},t),n?k.createElement("pre",{style:l},n):null,null)}const ih=k.createElement(lh,null);class oh extends k.Component{constructor(t){super(t),this.state={location:t.location,revalidation:t.revalidation,error:t.error}}static getDerivedStateFromError(t){return{error:t}}static getDerivedStateFromProps(t,n){return n.location!==t.location||n.revalidation!=="idle"&&t.revalidation==="idle"?{error:t.error,location:t.location,revalidation:t.revalidation}:{error:t.error!==void 0?t.error:n.error,location:n.location,revalidation:t.revalidation||n.revalidation}}componentDidCatch(t,n){console.error("React Router caught the following error during render",t,n)}render(){return this.state.error!==void 0?k.createElement(xt.Provider,{value:this.props.routeContext},k.createElement($c.Provider,{value:this.state.error,children:this.props.component})):this.props.children}}function uh(e){let{routeContext:t,match:n,children:r}=e,l=k.useContext(eu);return l&&l.static&&l.staticContext&&(n.route.errorElement||n.route.ErrorBoundary)&&(l.staticContext._deepestRenderedBoundaryId=n.route.id),k.createElement(xt.Provider,{value:t},r)}function sh(e,t,n,r){var l;if(t===void 0&&(t=[]),n===void 0&&(n=null),r===void 0&&(r=null),e==null){var i;if(!n)return null;if(n.errors)e=n.matches;else if((i=r)!=null&&i.v7_partialHydration&&t.length===0&&!n.initialized&&n.matches.length>0)e=n.matches;else return null}let o=e,u=(l=n)==null?void 0:l.errors;if(u!=null){let m=o.findIndex(d=>d.route.id&&(u==null?void 0:u[d.route.id])!==void 0);m>=0||Y(!1),o=o.slice(0,Math.min(o.length,m+1))}let s=!1,a=-1;if(n&&r&&r.v7_partialHydration)for(let m=0;m<o.length;m++){let d=o[m];if((d.route.HydrateFallback||d.route.hydrateFallbackElement)&&(a=m),d.route.id){let{loaderData:v,errors:y}=n,g=d.route.loader&&v[d.route.id]===void 0&&(!y||y[d.route.id]===void 0);if(d.route.lazy||g){s=!0,a>=0?o=o.slice(0,a+1):o=[o[0]];break}}}return o.reduceRight((m,d,v)=>{let y,g=!1,x=null,C=null;n&&(y=u&&d.route.id?u[d.route.id]:void 0,x=d.route.errorElement||ih,s&&(a<0&&v===0?(hh("route-fallback"),g=!0,C=null):a===v&&(g=!0,C=d.route.hydrateFallbackElement||null)));let f=t.concat(o.slice(0,v+1)),c=()=>{let p;return y?p=x:g?p=C:d.route.Component?p=k.createElement(d.route.Component,null):d.route.element?p=d.route.element:p=m,k.createElement(uh,{match:d,routeContext:{outlet:m,matches:f,isDataRoute:n!=null},children:p})};return n&&(d.route.ErrorBoundary||d.route.errorElement||v===0)?k.createElement(oh,{location:n.location,revalidation:n.revalidation,component:x,error:y,children:c(),routeContext:{outlet:null,matches:f,isDataRoute:!0}}):c()},null)}var Qc=function(e){return e.UseBlocker="useBlocker",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e}(Qc||{}),Kc=function(e){return e.UseBlocker="useBlocker",e.UseLoaderData="useLoaderData",e.UseActionData="useActionData",e.UseRouteError="useRouteError",e.UseNavigation="useNavigation",e.UseRouteLoaderData="useRouteLoaderData",e.UseMatches="useMatches",e.UseRevalidator="useRevalidator",e.UseNavigateStable="useNavigate",e.UseRouteId="useRouteId",e}(Kc||{});function ah(e){let t=k.useContext(eu);return t||Y(!1),t}function ch(e){let t=k.useContext(bp);return t||Y(!1),t}function fh(e){let t=k.useContext(xt);return t||Y(!1),t}function Yc(e){let t=fh(),n=t.matches[t.matches.length-1];return n.route.id||Y(!1),n.route.id}function dh(){var e;let t=k.useContext($c),n=ch(),r=Yc();return t!==void 0?t:(e=n.errors)==null?void 0:e[r]}function ph(){let{router:e}=ah(Qc.UseNavigateStable),t=Yc(Kc.UseNavigateStable),n=k.useRef(!1);return Vc(()=>{n.current=!0}),k.useCallback(function(l,i){i===void 0&&(i={}),n.current&&(typeof l=="number"?e.navigate(l):e.navigate(l,lr({fromRouteId:t},i)))},[e,t])}const vs={};function hh(e,t,n){vs[e]||(vs[e]=!0)}function mh(e,t){e==null||e.v7_startTransition,e==null||e.v7_relativeSplatPath}function ys(e){let{to:t,replace:n,state:r,relative:l}=e;mn()||Y(!1);let{future:i,static:o}=k.useContext(wt),{matches:u}=k.useContext(xt),{pathname:s}=vn(),a=Wc(),m=bo(t,qo(u,i.v7_relativeSplatPath),s,l==="path"),d=JSON.stringify(m);return k.useEffect(()=>a(JSON.parse(d),{replace:n,state:r,relative:l}),[a,d,l,n,r]),null}function Pt(e){Y(!1)}function vh(e){let{basename:t="/",children:n=null,location:r,navigationType:l=lt.Pop,navigator:i,static:o=!1,future:u}=e;mn()&&Y(!1);let s=t.replace(/^\/*/,"/"),a=k.useMemo(()=>({basename:s,navigator:i,static:o,future:lr({v7_relativeSplatPath:!1},u)}),[s,u,i,o]);typeof r=="string"&&(r=hn(r));let{pathname:m="/",search:d="",hash:v="",state:y=null,key:g="default"}=r,x=k.useMemo(()=>{let C=Zo(m,s);return C==null?null:{location:{pathname:C,search:d,hash:v,state:y,key:g},navigationType:l}},[s,m,d,v,y,g,l]);return x==null?null:k.createElement(wt.Provider,{value:a},k.createElement(Pl.Provider,{children:n,value:x}))}function Gc(e){let{children:t,location:n}=e;return nh(bi(t),n)}new Promise(()=>{});function bi(e,t){t===void 0&&(t=[]);let n=[];return k.Children.forEach(e,(r,l)=>{if(!k.isValidElement(r))return;let i=[...t,l];if(r.type===k.Fragment){n.push.apply(n,bi(r.props.children,i));return}r.type!==Pt&&Y(!1),!r.props.index||!r.props.children||Y(!1);let o={id:r.props.id||i.join("-"),caseSensitive:r.props.caseSensitive,element:r.props.element,Component:r.props.Component,index:r.props.index,path:r.props.path,loader:r.props.loader,action:r.props.action,errorElement:r.props.errorElement,ErrorBoundary:r.props.ErrorBoundary,hasErrorBoundary:r.props.ErrorBoundary!=null||r.props.errorElement!=null,shouldRevalidate:r.props.shouldRevalidate,handle:r.props.handle,lazy:r.props.lazy};r.props.children&&(o.children=bi(r.props.children,i)),n.push(o)}),n}/**
- * React Router DOM v6.30.2
- *
- * Copyright (c) Remix Software Inc.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE.md file in the root directory of this source tree.
- *
- * @license MIT
- */function eo(){return eo=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},eo.apply(this,arguments)}function yh(e,t){if(e==null)return{};var n={},r=Object.keys(e),l,i;for(i=0;i<r.length;i++)l=r[i],!(t.indexOf(l)>=0)&&(n[l]=e[l]);return n}function gh(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}function wh(e,t){return e.button===0&&(!t||t==="_self")&&!gh(e)}const xh=["onClick","relative","reloadDocument","replace","state","target","to","preventScrollReset","viewTransition"],Sh="6";try{window.__reactRouterVersion=Sh}catch{}const kh="startTransition",gs=hf[kh];function Eh(e){let{basename:t,children:n,future:r,window:l}=e,i=k.useRef();i.current==null&&(i.current=Np({window:l,v5Compat:!0}));let o=i.current,[u,s]=k.useState({action:o.action,location:o.location}),{v7_startTransition:a}=r||{},m=k.useCallback(d=>{a&&gs?gs(()=>s(d)):s(d)},[s,a]);return k.useLayoutEffect(()=>o.listen(m),[o,m]),k.useEffect(()=>mh(r),[r]),k.createElement(vh,{basename:t,children:n,location:u.location,navigationType:u.action,navigator:o,future:r})}const Ch=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u",_h=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,Nh=k.forwardRef(function(t,n){let{onClick:r,relative:l,reloadDocument:i,replace:o,state:u,target:s,to:a,preventScrollReset:m,viewTransition:d}=t,v=yh(t,xh),{basename:y}=k.useContext(wt),g,x=!1;if(typeof a=="string"&&_h.test(a)&&(g=a,Ch))try{let p=new URL(window.location.href),w=a.startsWith("//")?new URL(p.protocol+a):new URL(a),E=Zo(w.pathname,y);w.origin===p.origin&&E!=null?a=E+w.search+w.hash:x=!0}catch{}let C=eh(a,{relative:l}),f=jh(a,{replace:o,state:u,target:s,preventScrollReset:m,relative:l,viewTransition:d});function c(p){r&&r(p),p.defaultPrevented||f(p)}return k.createElement("a",eo({},v,{href:g||C,onClick:x||i?r:c,ref:n,target:s}))});var ws;(function(e){e.UseScrollRestoration="useScrollRestoration",e.UseSubmit="useSubmit",e.UseSubmitFetcher="useSubmitFetcher",e.UseFetcher="useFetcher",e.useViewTransitionState="useViewTransitionState"})(ws||(ws={}));var xs;(function(e){e.UseFetcher="useFetcher",e.UseFetchers="useFetchers",e.UseScrollRestoration="useScrollRestoration"})(xs||(xs={}));function jh(e,t){let{target:n,replace:r,state:l,preventScrollReset:i,relative:o,viewTransition:u}=t===void 0?{}:t,s=Wc(),a=vn(),m=Hc(e,{relative:o});return k.useCallback(d=>{if(wh(d,n)){d.preventDefault();let v=r!==void 0?r:fl(a)===fl(m);s(e,{replace:v,state:l,preventScrollReset:i,relative:o,viewTransition:u})}},[a,s,m,r,l,n,e,i,o,u])}function Ph({onLogin:e}){const[t,n]=k.useState(""),[r,l]=k.useState(""),[i,o]=k.useState(""),[u,s]=k.useState(!1),a=async m=>{m.preventDefault(),o(""),s(!0);try{const d=await fetch("/admin/login",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({username:t,password:r})});if(!d.ok)throw new Error("Invalid credentials");const v=await d.json();e(v.token)}catch(d){o(d.message||"Login failed")}finally{s(!1)}};return h.jsx("div",{className:"login-container",children:h.jsxs("div",{className:"login-card",children:[h.jsxs("div",{className:"login-header",children:[h.jsx("h1",{children:"🔑 License Admin Panel"}),h.jsx("p",{children:"License Management System"})]}),h.jsxs("form",{onSubmit:a,children:[h.jsxs("div",{className:"form-group",children:[h.jsx("label",{children:"Username"}),h.jsx("input",{type:"text",value:t,onChange:m=>n(m.target.value),placeholder:"admin",required:!0})]}),h.jsxs("div",{className:"form-group",children:[h.jsx("label",{children:"Password"}),h.jsx("input",{type:"password",value:r,onChange:m=>l(m.target.value),placeholder:"Enter password",required:!0})]}),i&&h.jsx("div",{className:"error",children:i}),h.jsx("button",{type:"submit",className:"login-btn",disabled:u,children:u?"Logging in...":"Login"})]}),h.jsx("div",{className:"login-footer",children:h.jsx("p",{children:"Default: admin / admin123"})})]})})}function Ss({token:e}){const[t,n]=k.useState(null),[r,l]=k.useState(!0);k.useEffect(()=>{i()},[]);const i=async()=>{try{const s=await(await fetch("/admin/stats",{headers:{Authorization:`Bearer ${e}`}})).json();n(s)}catch(u){console.error("Failed to fetch stats:",u)}finally{l(!1)}};if(r)return h.jsx("div",{className:"loading",children:"Loading stats..."});if(!t)return h.jsx("div",{className:"error",children:"Failed to load statistics"});const o=[{label:"Total Licenses",value:t.total_licenses,icon:"📜",color:"#667eea"},{label:"Active Licenses",value:t.active_licenses,icon:"✅",color:"#48bb78"},{label:"Expired Licenses",value:t.expired_licenses,icon:"⏰",color:"#ed8936"},{label:"Blocked Licenses",value:t.blocked_licenses,icon:"🚫",color:"#f56565"},{label:"Total Activations",value:t.total_activations,icon:"💻",color:"#4299e1"}];return h.jsxs("div",{className:"overview",children:[h.jsxs("div",{className:"page-header",children:[h.jsx("h2",{children:"Dashboard Overview"}),h.jsx("button",{onClick:i,className:"refresh-btn",children:"🔄 Refresh"})]}),h.jsx("div",{className:"stats-grid",children:o.map((u,s)=>h.jsxs("div",{className:"stat-card",style:{borderLeftColor:u.color},children:[h.jsx("div",{className:"stat-icon",style:{background:`${u.color}20`,color:u.color},children:u.icon}),h.jsxs("div",{className:"stat-info",children:[h.jsx("div",{className:"stat-label",children:u.label}),h.jsx("div",{className:"stat-value",children:u.value})]})]},s))}),h.jsx("div",{className:"info-section",children:h.jsxs("div",{className:"info-card",children:[h.jsx("h3",{children:"🎯 Quick Actions"}),h.jsxs("ul",{children:[h.jsx("li",{children:"Generate new license keys"}),h.jsx("li",{children:"View and manage all licenses"}),h.jsx("li",{children:"Monitor active device activations"}),h.jsx("li",{children:"Block/unblock licenses remotely"}),h.jsx("li",{children:"Extend expiry dates"})]})]})})]})}function ks({token:e}){const[t,n]=k.useState({customer_name:"",company_name:"",email:"",phone:"",expires_at:"",max_activations:1,restricted_fingerprint:"",notes:""}),[r,l]=k.useState(!1),[i,o]=k.useState(null),[u,s]=k.useState(""),a=d=>{n({...t,[d.target.name]:d.target.value})},m=async d=>{d.preventDefault(),l(!0),s(""),o(null);try{const v=await fetch("/admin/generate",{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${e}`},body:JSON.stringify(t)});if(!v.ok)throw new Error("Failed to generate license");const y=await v.json();o(y),n({customer_name:"",company_name:"",email:"",phone:"",expires_at:"",max_activations:1,restricted_fingerprint:"",notes:""})}catch(v){s(v.message)}finally{l(!1)}};return h.jsxs("div",{className:"generate-license",children:[h.jsx("div",{className:"page-header",children:h.jsx("h2",{children:"Generate New License"})}),i&&h.jsxs("div",{className:"success-card",children:[h.jsx("h3",{children:"✅ License Generated Successfully!"}),h.jsxs("div",{className:"license-key-display",children:[h.jsx("label",{children:"License Key:"}),h.jsx("div",{className:"license-key",children:i.license_key}),h.jsx("button",{onClick:()=>navigator.clipboard.writeText(i.license_key),className:"copy-btn",children:"📋 Copy"})]}),h.jsx("p",{className:"success-note",children:"Save this license key and share it with the customer."})]}),u&&h.jsx("div",{className:"error-message",children:u}),h.jsxs("form",{onSubmit:m,className:"license-form",children:[h.jsxs("div",{className:"form-grid",children:[h.jsxs("div",{className:"form-group",children:[h.jsx("label",{children:"Customer Name *"}),h.jsx("input",{type:"text",name:"customer_name",value:t.customer_name,onChange:a,required:!0,placeholder:"Enter customer name"})]}),h.jsxs("div",{className:"form-group",children:[h.jsx("label",{children:"Company Name"}),h.jsx("input",{type:"text",name:"company_name",value:t.company_name,onChange:a,placeholder:"Enter company name (optional)"})]}),h.jsxs("div",{className:"form-group",children:[h.jsx("label",{children:"Email"}),h.jsx("input",{type:"email",name:"email",value:t.email,onChange:a,placeholder:"customer@example.com"})]}),h.jsxs("div",{className:"form-group",children:[h.jsx("label",{children:"Phone"}),h.jsx("input",{type:"tel",name:"phone",value:t.phone,onChange:a,placeholder:"+91 1234567890"})]}),h.jsxs("div",{className:"form-group",children:[h.jsx("label",{children:"Expiry Date *"}),h.jsx("input",{type:"date",name:"expires_at",value:t.expires_at,onChange:a,required:!0,min:new Date().toISOString().split("T")[0]})]}),h.jsxs("div",{className:"form-group",children:[h.jsx("label",{children:"Max Activations *"}),h.jsx("input",{type:"number",name:"max_activations",value:t.max_activations,onChange:a,required:!0,min:"1",max:"10"}),h.jsx("small",{children:"Maximum number of devices that can use this license"})]}),h.jsxs("div",{className:"form-group",children:[h.jsx("label",{children:"Hardware Fingerprint *"}),h.jsx("input",{type:"text",name:"restricted_fingerprint",value:t.restricted_fingerprint,onChange:a,required:!0,placeholder:"Paste the machine fingerprint here"}),h.jsx("small",{children:"Strictly bound: ONLY this machine will be able to activate this key"})]})]}),h.jsxs("div",{className:"form-group",children:[h.jsx("label",{children:"Notes"}),h.jsx("textarea",{name:"notes",value:t.notes,onChange:a,rows:"3",placeholder:"Additional notes (optional)"})]}),h.jsx("button",{type:"submit",className:"submit-btn",disabled:r,children:r?"Generating...":"🔑 Generate & Bind License"})]})]})}function Es({token:e}){const[t,n]=k.useState([]),[r,l]=k.useState(!0),[i,o]=k.useState("all");k.useEffect(()=>{u()},[]);const u=async()=>{l(!0);try{const g=await(await fetch("/admin/licenses",{headers:{Authorization:`Bearer ${e}`}})).json();n(g.licenses)}catch(y){console.error("Failed to fetch licenses:",y)}finally{l(!1)}},s=async y=>{if(confirm("Block this license?"))try{await fetch("/admin/block",{method:"POST",headers:{"Content-Type":"application/json",Authorization:`Bearer ${e}`},body:JSON.stringify({license_key:y,message:"License blocked by administrator"})}),u()}catch{alert("Failed to block license")}},a=async y=>{try{await fetch(`/admin/unblock?license_key=${y}`,{method:"POST",headers:{Authorization:`Bearer ${e}`}}),u()}catch{alert("Failed to unblock license")}},m=async y=>{if(confirm(`Are you sure you want to DELETE license ${y}? This action cannot be undone and will remove all activations.`))try{const g=await fetch(`/admin/licenses/${y}`,{method:"DELETE",headers:{Authorization:`Bearer ${e}`}});if(g.ok)alert("License deleted successfully"),u();else{const x=await g.json();alert(`Failed to delete: ${x.detail||"Unknown error"}`)}}catch{alert("Failed to delete license")}},d=y=>y.is_blocked?{label:"Blocked",class:"status-blocked"}:new Date(y.expires_at)<new Date?{label:"Expired",class:"status-expired"}:{label:"Active",class:"status-active"},v=t.filter(y=>i==="active"?!y.is_blocked&&new Date(y.expires_at)>new Date:i==="expired"?new Date(y.expires_at)<new Date:i==="blocked"?y.is_blocked:!0);return h.jsxs("div",{className:"licenses",children:[h.jsxs("div",{className:"page-header",children:[h.jsx("h2",{children:"All Licenses"}),h.jsxs("div",{className:"filter-tabs",children:[h.jsxs("button",{className:i==="all"?"active":"",onClick:()=>o("all"),children:["All (",t.length,")"]}),h.jsx("button",{className:i==="active"?"active":"",onClick:()=>o("active"),children:"Active"}),h.jsx("button",{className:i==="expired"?"active":"",onClick:()=>o("expired"),children:"Expired"}),h.jsx("button",{className:i==="blocked"?"active":"",onClick:()=>o("blocked"),children:"Blocked"})]})]}),r?h.jsx("div",{className:"loading",children:"Loading licenses..."}):h.jsx("div",{className:"licenses-table",children:h.jsxs("table",{children:[h.jsx("thead",{children:h.jsxs("tr",{children:[h.jsx("th",{children:"License Key"}),h.jsx("th",{children:"Customer"}),h.jsx("th",{children:"Company"}),h.jsx("th",{children:"Expires"}),h.jsx("th",{children:"Activations"}),h.jsx("th",{children:"Status"}),h.jsx("th",{children:"Actions"})]})}),h.jsx("tbody",{children:v.map(y=>{const g=d(y);return h.jsxs("tr",{children:[h.jsx("td",{className:"license-key-cell",children:h.jsx("code",{children:y.license_key})}),h.jsx("td",{children:y.customer_name}),h.jsx("td",{children:y.company_name||"-"}),h.jsx("td",{children:new Date(y.expires_at).toLocaleDateString()}),h.jsxs("td",{children:[y.activation_count||0," / ",y.max_activations]}),h.jsx("td",{children:h.jsx("span",{className:`status-badge ${g.class}`,children:g.label})}),h.jsx("td",{children:h.jsxs("div",{style:{display:"flex",gap:"8px"},children:[y.is_blocked?h.jsx("button",{onClick:()=>a(y.license_key),className:"action-btn btn-success",children:"Unblock"}):h.jsx("button",{onClick:()=>s(y.license_key),className:"action-btn btn-danger",children:"Block"}),h.jsx("button",{onClick:()=>m(y.license_key),className:"action-btn btn-danger",children:"Delete"})]})})]},y.id)})})]})})]})}function Cs({token:e}){const[t,n]=k.useState([]),[r,l]=k.useState(!0);k.useEffect(()=>{i()},[]);const i=async()=>{l(!0);try{const s=await(await fetch("/admin/activations",{headers:{Authorization:`Bearer ${e}`}})).json();n(s.activations)}catch(u){console.error("Failed to fetch activations:",u)}finally{l(!1)}},o=async u=>{if(confirm("Deactivate this device?"))try{await fetch(`/admin/activation/${u}`,{method:"DELETE",headers:{Authorization:`Bearer ${e}`}}),i()}catch{alert("Failed to deactivate device")}};return h.jsxs("div",{className:"activations",children:[h.jsxs("div",{className:"page-header",children:[h.jsx("h2",{children:"Device Activations"}),h.jsx("button",{onClick:i,className:"refresh-btn",children:"🔄 Refresh"})]}),r?h.jsx("div",{className:"loading",children:"Loading activations..."}):h.jsxs("div",{className:"licenses-table",children:[h.jsxs("table",{children:[h.jsx("thead",{children:h.jsxs("tr",{children:[h.jsx("th",{children:"License Key"}),h.jsx("th",{children:"Customer"}),h.jsx("th",{children:"Device Name"}),h.jsx("th",{children:"Hardware ID"}),h.jsx("th",{children:"Activated"}),h.jsx("th",{children:"Last Validation"}),h.jsx("th",{children:"Status"}),h.jsx("th",{children:"Actions"})]})}),h.jsx("tbody",{children:t.map(u=>h.jsxs("tr",{children:[h.jsx("td",{className:"license-key-cell",children:h.jsx("code",{children:u.license_key})}),h.jsx("td",{children:u.customer_name}),h.jsx("td",{children:u.device_name||"Unknown Device"}),h.jsx("td",{children:h.jsxs("code",{style:{fontSize:"11px"},children:[u.hardware_fingerprint.substring(0,16),"..."]})}),h.jsx("td",{children:new Date(u.activated_at).toLocaleDateString()}),h.jsx("td",{children:new Date(u.last_validated).toLocaleString()}),h.jsx("td",{children:h.jsx("span",{className:`status-badge ${u.is_active?"status-active":"status-expired"}`,children:u.is_active?"Active":"Inactive"})}),h.jsx("td",{children:u.is_active&&h.jsx("button",{onClick:()=>o(u.id),className:"action-btn btn-danger",children:"Deactivate"})})]},u.id))})]}),t.length===0&&h.jsx("div",{style:{padding:"40px",textAlign:"center",color:"#999"},children:"No activations found"})]})]})}function Lh({onLogout:e}){const t=vn(),n=localStorage.getItem("admin_token"),r=[{path:"/",label:"📊 Overview",component:Ss},{path:"/generate",label:"➕ Generate License",component:ks},{path:"/licenses",label:"📜 All Licenses",component:Es},{path:"/activations",label:"💻 Activations",component:Cs}],l=i=>i==="/"?t.pathname==="/":t.pathname.startsWith(i);return h.jsxs("div",{className:"dashboard",children:[h.jsxs("div",{className:"dashboard-header",children:[h.jsx("div",{className:"header-left",children:h.jsx("h1",{children:"🔑 License Admin Panel"})}),h.jsx("button",{onClick:e,className:"logout-btn",children:"Logout"})]}),h.jsx("div",{className:"dashboard-nav",children:r.map(i=>h.jsx(Nh,{to:i.path,className:`nav-item ${l(i.path)?"active":""}`,children:i.label},i.path))}),h.jsx("div",{className:"dashboard-content",children:h.jsxs(Gc,{children:[h.jsx(Pt,{path:"/",element:h.jsx(Ss,{token:n})}),h.jsx(Pt,{path:"/generate",element:h.jsx(ks,{token:n})}),h.jsx(Pt,{path:"/licenses",element:h.jsx(Es,{token:n})}),h.jsx(Pt,{path:"/activations",element:h.jsx(Cs,{token:n})})]})})]})}function zh(){const[e,t]=k.useState(!1),[n,r]=k.useState(!0);k.useEffect(()=>{localStorage.getItem("admin_token")&&t(!0),r(!1)},[]);const l=o=>{localStorage.setItem("admin_token",o),t(!0)},i=()=>{localStorage.removeItem("admin_token"),t(!1)};return n?h.jsx("div",{className:"loading",children:"Loading..."}):h.jsx(Eh,{children:h.jsxs(Gc,{children:[h.jsx(Pt,{path:"/login",element:e?h.jsx(ys,{to:"/"}):h.jsx(Ph,{onLogin:l})}),h.jsx(Pt,{path:"/*",element:e?h.jsx(Lh,{onLogout:i}):h.jsx(ys,{to:"/login"})})]})})}ii.createRoot(document.getElementById("root")).render(h.jsx(Is.StrictMode,{children:h.jsx(zh,{})}));
@@ -4,19 +4,29 @@ import '../components/Cards.css';
 function Activations({ token }) {
     const [activations, setActivations] = useState([]);
     const [loading, setLoading] = useState(true);
+    const [total, setTotal] = useState(0);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
 
     useEffect(() => {
         fetchActivations();
     }, []);
 
+    const fetchPage = async (cursor) => {
+        const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+        const res = await fetch(`/admin/activations${query}`, {
+            headers: { 'Authorization': `Bearer ${token}` }
+        });
+        return res.json();
+    };
+
     const fetchActivations = async () => {
         setLoading(true);
         try {
-            const res = await fetch('/admin/activations', {
-                headers: { 'Authorization': `Bearer ${token}` }
-            });
-            const data = await res.json();
+            const data = await fetchPage(null);
             setActivations(data.activations);
+            setTotal(data.total);
+            setNextCursor(data.next_cursor);
         } catch (err) {
             console.error('Failed to fetch activations:', err);
         } finally {
@@ -24,6 +34,19 @@ function Activations({ token }) {
         }
     };
 
+    const loadMore = async () => {
+        setLoadingMore(true);
+        try {
+            const data = await fetchPage(nextCursor);
+            setActivations(prev => [...prev, ...data.activations]);
+            setNextCursor(data.next_cursor);
+        } catch (err) {
+            console.error('Failed to fetch activations:', err);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const handleDeactivate = async (activationId) => {
         if (!confirm('Deactivate this device?')) return;
 
@@ -41,7 +64,7 @@ function Activations({ token }) {
     return (
         <div className="activations">
             <div className="page-header">
-                <h2>Device Activations</h2>
+                <h2>Device Activations ({activations.length} of {total})</h2>
                 <button onClick={fetchActivations} className="refresh-btn">🔄 Refresh</button>
             </div>
 
@@ -96,6 +119,13 @@ function Activations({ token }) {
                             ))}
                         </tbody>
                     </table>
+                    {nextCursor && (
+                        <div style={{ padding: '20px', textAlign: 'center' }}>
+                            <button onClick={loadMore} className="refresh-btn" disabled={loadingMore}>
+                                {loadingMore ? 'Loading...' : 'Load more'}
+                            </button>
+                        </div>
+                    )}
                     {activations.length === 0 && (
                         <div style={{ padding: '40px', textAlign: 'center', color: '#999' }}>
                             No activations found
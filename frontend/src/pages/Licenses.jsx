@@ -5,19 +5,32 @@ function Licenses({ token }) {
     const [licenses, setLicenses] = useState([]);
     const [loading, setLoading] = useState(true);
     const [filter, setFilter] = useState('all');
+    const [total, setTotal] = useState(0);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
 
     useEffect(() => {
         fetchLicenses();
-    }, []);
+    }, [filter]);
+
+    // Filtering and paging happen server-side so large catalogs stay fast
+    const fetchPage = async (cursor) => {
+        const params = new URLSearchParams();
+        if (filter !== 'all') params.set('status', filter);
+        if (cursor) params.set('cursor', cursor);
+        const res = await fetch(`/admin/licenses?${params}`, {
+            headers: { 'Authorization': `Bearer ${token}` }
+        });
+        return res.json();
+    };
 
     const fetchLicenses = async () => {
         setLoading(true);
         try {
-            const res = await fetch('/admin/licenses', {
-                headers: { 'Authorization': `Bearer ${token}` }
-            });
-            const data = await res.json();
+            const data = await fetchPage(null);
             setLicenses(data.licenses);
+            setTotal(data.total);
+            setNextCursor(data.next_cursor);
         } catch (err) {
             console.error('Failed to fetch licenses:', err);
         } finally {
@@ -25,6 +38,19 @@ function Licenses({ token }) {
         }
     };
 
+    const loadMore = async () => {
+        setLoadingMore(true);
+        try {
+            const data = await fetchPage(nextCursor);
+            setLicenses(prev => [...prev, ...data.licenses]);
+            setNextCursor(data.next_cursor);
+        } catch (err) {
+            console.error('Failed to fetch licenses:', err);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const handleBlock = async (licenseKey) => {
         if (!confirm('Block this license?')) return;
 
@@ -87,20 +113,13 @@ function Licenses({ token }) {
         return { label: 'Active', class: 'status-active' };
     };
 
-    const filteredLicenses = licenses.filter(license => {
-        if (filter === 'active') return !license.is_blocked && new Date(license.expires_at) > new Date();
-        if (filter === 'expired') return new Date(license.expires_at) < new Date();
-        if (filter === 'blocked') return license.is_blocked;
-        return true;
-    });
-
     return (
         <div className="licenses">
             <div className="page-header">
-                <h2>All Licenses</h2>
+                <h2>All Licenses ({licenses.length} of {total})</h2>
                 <div className="filter-tabs">
                     <button className={filter === 'all' ? 'active' : ''} onClick={() => setFilter('all')}>
-                        All ({licenses.length})
+                        All
                     </button>
                     <button className={filter === 'active' ? 'active' : ''} onClick={() => setFilter('active')}>
                         Active
@@ -131,7 +150,7 @@ function Licenses({ token }) {
                             </tr>
                         </thead>
                         <tbody>
-                            {filteredLicenses.map((license) => {
+                            {licenses.map((license) => {
                                 const status = getStatus(license);
                                 return (
                                     <tr key={license.id}>
@@ -168,6 +187,13 @@ function Licenses({ token }) {
                             })}
                         </tbody>
                     </table>
+                    {nextCursor && (
+                        <div style={{ padding: '20px', textAlign: 'center' }}>
+                            <button onClick={loadMore} className="refresh-btn" disabled={loadingMore}>
+                                {loadingMore ? 'Loading...' : 'Load more'}
+                            </button>
+                        </div>
+                    )}
                 </div>
             )}
         </div>